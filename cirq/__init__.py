@@ -106,6 +106,7 @@ from cirq.linalg import (
     diagonalize_real_symmetric_matrix,
     dot,
     expand_matrix_in_orthogonal_basis,
+    expand_matrix_in_pauli_basis,
     hilbert_schmidt_inner_product,
     eye_tensor,
     is_diagonal,
@@ -116,7 +117,9 @@ from cirq.linalg import (
     is_unitary,
     kak_canonicalize_vector,
     kak_decomposition,
+    kak_decomposition_batch,
     KakDecomposition,
+    KakDecompositionBatch,
     subwavefunction,
     kron,
     kron_bases,
@@ -128,6 +131,7 @@ from cirq.linalg import (
     one_hot,
     partial_trace,
     PAULI_BASIS,
+    pauli_basis_coefficients,
     pow_pauli_combination,
     reflection_matrix_pow,
     slice_for_qubits_equal_to,
@@ -246,6 +250,8 @@ from cirq.ops import (
 )
 
 from cirq.optimizers import (
+    CancelCommutingGates,
+    CircuitStats,
     ConvertToCzAndSingleGates,
     DropEmptyMoments,
     DropNegligible,
@@ -256,11 +262,20 @@ from cirq.optimizers import (
     merge_single_qubit_gates_into_phased_x_z,
     MergeInteractions,
     MergeSingleQubitGates,
+    operations_commute,
+    PassManager,
+    PassManagerReport,
+    PassRecord,
+    RepeatUntilStable,
+    RewriteTemplate,
+    single_qubit_matrices_to_phased_x_z,
     single_qubit_matrix_to_gates,
     single_qubit_matrix_to_pauli_rotations,
     single_qubit_matrix_to_phased_x_z,
     single_qubit_op_to_framed_phase_form,
+    TemplateOptimizer,
     two_qubit_matrix_to_operations,
+    TwoQubitDecompositionCache,
 )
 
 from cirq.schedules import (
@@ -280,6 +295,7 @@ from cirq.sim import (
     measure_density_matrix,
     measure_state_vector,
     final_wavefunction,
+    prune_to_light_cone,
     sample,
     sample_density_matrix,
     sample_state_vector,
@@ -289,13 +305,18 @@ from cirq.sim import (
     SimulatesIntermediateState,
     SimulatesIntermediateWaveFunction,
     SimulatesSamples,
+    SimulationCheckpoint,
+    SimulationCheckpointStore,
     SimulationTrialResult,
     Simulator,
+    SparseAmplitudeSimulator,
+    SparseAmplitudeStep,
     SparseSimulatorStep,
     StateVectorMixin,
     StepResult,
     to_valid_density_matrix,
     to_valid_state_vector,
+    UnitarySimulator,
     validate_normalized_state,
     von_neumann_entropy,
     WaveFunctionSimulatorState,
@@ -355,10 +376,15 @@ from cirq.protocols import (
     approx_eq,
     control,
     channel,
+    channel_cache_info,
     circuit_diagram_info,
+    clear_channel_cache,
+    clear_decompose_cache,
+    clear_unitary_cache,
     CircuitDiagramInfo,
     CircuitDiagramInfoArgs,
     decompose,
+    decompose_cache_info,
     decompose_once,
     decompose_once_with_qubits,
     equal_up_to_global_phase,
@@ -380,7 +406,9 @@ from cirq.protocols import (
     qasm,
     QasmArgs,
     qid_shape,
+    read_binary,
     read_json,
+    read_json_lines,
     resolve_parameters,
     SupportsApplyChannel,
     SupportsConsistentApplyUnitary,
@@ -399,10 +427,14 @@ from cirq.protocols import (
     SupportsQasmWithArgsAndQubits,
     SupportsTraceDistanceBound,
     SupportsUnitary,
+    superoperator,
+    to_binary,
     to_json,
+    to_json_lines,
     obj_to_dict_helper,
     trace_distance_bound,
     unitary,
+    unitary_cache_info,
     validate_mixture,
 )
 
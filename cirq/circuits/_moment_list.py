@@ -0,0 +1,294 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import bisect
+from typing import (Any, Callable, Dict, Iterable, List, Optional,
+                    TYPE_CHECKING)
+
+if TYPE_CHECKING:
+    import cirq
+
+
+class MomentList(list):
+    """A list of moments that knows which moments act on each qubit.
+
+    For each qubit, the list keeps a sorted list of the indices of the moments
+    operating on that qubit. Queries for the next or previous moment acting on
+    some qubits are answered by bisecting these lists instead of scanning the
+    moments.
+
+    The index is built on the first query. After that, replacing, appending,
+    inserting and deleting individual moments (and inserting runs of moments)
+    update it in place. Any other kind of edit discards the index, and the next
+    query rebuilds it.
+
+    Edits can also be journaled, so that a failed batch of edits can be rolled
+    back without having copied the list beforehand.
+    """
+
+    def __init__(self, moments: Iterable['cirq.Moment'] = ()) -> None:
+        super().__init__(moments)
+        self._index = None  # type: Optional[Dict[cirq.Qid, List[int]]]
+        # While recording, undo actions for the edits made so far.
+        self._journal = None  # type: Optional[List[Callable[[], None]]]
+
+    def __reduce__(self):
+        return type(self), (list(self),)
+
+    def _qubit_index(self) -> Dict['cirq.Qid', List[int]]:
+        if self._index is None:
+            index = {}  # type: Dict[cirq.Qid, List[int]]
+            for i, moment in enumerate(self):
+                for q in moment.qubits:
+                    index.setdefault(q, []).append(i)
+            self._index = index
+        return self._index
+
+    def next_moment_operating_on(self, qubits: Iterable['cirq.Qid'],
+                                 start: int, end: int) -> Optional[int]:
+        """Returns the first index in [start, end) of a moment touching any of
+        the qubits, or None."""
+        index = self._qubit_index()
+        start = max(start, 0)
+        best = None
+        for q in qubits:
+            indices = index.get(q)
+            if not indices:
+                continue
+            j = bisect.bisect_left(indices, start)
+            if j < len(indices) and indices[j] < end and (best is None or
+                                                          indices[j] < best):
+                best = indices[j]
+        return best
+
+    def prev_moment_operating_on(self, qubits: Iterable['cirq.Qid'],
+                                 start: int, end: int) -> Optional[int]:
+        """Returns the last index in [start, end) of a moment touching any of
+        the qubits, or None."""
+        index = self._qubit_index()
+        start = max(start, 0)
+        best = None
+        for q in qubits:
+            indices = index.get(q)
+            if not indices:
+                continue
+            if end > indices[-1]:
+                # The latest moment acting on the qubit is before the end,
+                # e.g. when appending to the circuit.
+                j = len(indices) - 1
+            else:
+                j = bisect.bisect_left(indices, end) - 1
+            if j >= 0 and indices[j] >= start and (best is None or
+                                                   indices[j] > best):
+                best = indices[j]
+        return best
+
+    def _add_entries(self, moment_index: int,
+                     qubits: Optional[Iterable['cirq.Qid']] = None) -> None:
+        index = self._index
+        assert index is not None
+        if qubits is None:
+            qubits = self[moment_index].qubits
+        for q in qubits:
+            indices = index.get(q)
+            if indices is None:
+                index[q] = [moment_index]
+            elif not indices or indices[-1] < moment_index:
+                indices.append(moment_index)
+            else:
+                bisect.insort(indices, moment_index)
+
+    def _remove_entries(self, moment_index: int,
+                        qubits: Iterable['cirq.Qid']) -> None:
+        index = self._index
+        assert index is not None
+        for q in qubits:
+            indices = index[q]
+            del indices[bisect.bisect_left(indices, moment_index)]
+
+    def _shift(self, start: int, amount: int) -> None:
+        """Offsets all indexed moment indices at or after start."""
+        assert self._index is not None
+        for indices in self._index.values():
+            j = bisect.bisect_left(indices, start)
+            if j < len(indices):
+                indices[j:] = [i + amount for i in indices[j:]]
+
+    def _normalize(self, i: int) -> int:
+        if i < 0:
+            i += len(self)
+        return min(max(i, 0), len(self))
+
+    def _record_undo(self, undo: Callable[[], None]) -> None:
+        if self._journal is not None:
+            self._journal.append(undo)
+
+    def _record_snapshot(self) -> None:
+        if self._journal is not None:
+            snapshot = list(self)
+            self._journal.append(lambda: self.__setitem__(
+                slice(None), snapshot))
+
+    @property
+    def is_journaling(self) -> bool:
+        """Whether edits are currently being recorded."""
+        return self._journal is not None
+
+    def begin_journal(self) -> None:
+        """Starts recording how to undo subsequent edits."""
+        if self._journal is not None:
+            raise ValueError('A journal is already being recorded.')
+        self._journal = []
+
+    def end_journal(self) -> None:
+        """Stops recording edits, keeping them."""
+        self._journal = None
+
+    def rollback_journal(self) -> None:
+        """Undoes the edits recorded since `begin_journal` and stops
+        recording.
+
+        Undoing costs time proportional to the recorded edits, except for
+        edits other than replacing, inserting, appending or deleting moments,
+        whose undo restores a snapshot of the whole list.
+        """
+        journal = self._journal
+        self._journal = None
+        assert journal is not None
+        for undo in reversed(journal):
+            undo()
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            value = list(value)
+            start, stop, step = key.indices(len(self))
+            is_insertion = step == 1 and start >= stop
+            if is_insertion:
+                self._record_undo(lambda: self.__delitem__(
+                    slice(start, start + len(value))))
+            else:
+                self._record_snapshot()
+            super().__setitem__(key, value)
+            if self._index is None:
+                return
+            if is_insertion:
+                self._shift(start, len(value))
+                for i in range(start, start + len(value)):
+                    self._add_entries(i)
+            else:
+                self._index = None
+            return
+        old = self[key]
+        key = self._normalize(key)
+        self._record_undo(lambda: self.__setitem__(key, old))
+        super().__setitem__(key, value)
+        if self._index is None:
+            return
+        # Only touch the entries that changed, so that adding an operation to
+        # a wide moment costs time proportional to the operation's size.
+        self._remove_entries(key, old.qubits - value.qubits)
+        self._add_entries(key, value.qubits - old.qubits)
+
+    def __delitem__(self, key):
+        if isinstance(key, slice):
+            self._record_snapshot()
+            super().__delitem__(key)
+            self._index = None
+            return
+        old = self[key]
+        key = self._normalize(key)
+        self._record_undo(lambda: self.insert(key, old))
+        super().__delitem__(key)
+        if self._index is not None:
+            self._remove_entries(key, old.qubits)
+            self._shift(key + 1, -1)
+
+    def insert(self, i, moment):
+        i = self._normalize(i)
+        self._record_undo(lambda: self.__delitem__(i))
+        super().insert(i, moment)
+        if self._index is not None:
+            self._shift(i, 1)
+            self._add_entries(i)
+
+    def append(self, moment):
+        self.extend([moment])
+
+    def extend(self, moments):
+        start = len(self)
+        self._record_undo(lambda: self.__delitem__(slice(start, None)))
+        super().extend(moments)
+        if self._index is not None:
+            for i in range(start, len(self)):
+                self._add_entries(i)
+
+    def __iadd__(self, moments: Iterable[Any]) -> 'MomentList':
+        self.extend(moments)
+        return self
+
+    def __imul__(self, repetitions: int) -> 'MomentList':
+        self._record_snapshot()
+        self._index = None
+        super().__imul__(repetitions)
+        return self
+
+    def pop(self, i=-1):
+        moment = self[i]
+        del self[i]
+        return moment
+
+    def remove(self, moment):
+        self._record_snapshot()
+        super().remove(moment)
+        self._index = None
+
+    def clear(self):
+        self._record_snapshot()
+        super().clear()
+        self._index = None
+
+    def reverse(self):
+        self._record_snapshot()
+        super().reverse()
+        self._index = None
+
+    def sort(self, *args, **kwargs):
+        self._record_snapshot()
+        super().sort(*args, **kwargs)
+        self._index = None
+
+
+class MomentListAttribute:
+    """An attribute holding a `MomentList`.
+
+    Any iterable of moments can be assigned to the attribute. It is wrapped in
+    a `MomentList`, so that the per-qubit index of the moments can't be
+    bypassed.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initializes the attribute.
+
+        Args:
+            name: The name of the instance attribute storing the list.
+        """
+        self._name = name
+
+    def __get__(self, instance: Any, owner: Any) -> MomentList:
+        return getattr(instance, self._name)
+
+    def __set__(self, instance: Any, moments: Iterable['cirq.Moment']) -> None:
+        if not isinstance(moments, MomentList):
+            moments = MomentList(moments)
+        setattr(instance, self._name, moments)
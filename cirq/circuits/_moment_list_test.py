@@ -0,0 +1,177 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import pickle
+import random
+
+import pytest
+
+from cirq.circuits._moment_list import MomentList
+import cirq
+
+QUBITS = cirq.LineQubit.range(4)
+
+
+def _random_moment():
+    qubits = random.sample(QUBITS, random.randint(0, len(QUBITS)))
+    return cirq.Moment(cirq.X(q) for q in qubits)
+
+
+def assert_index_consistent(moments: MomentList):
+    # Compare against a scan of the moments, with and without a fresh index.
+    for fresh in [False, True]:
+        if fresh:
+            moments = MomentList(moments)
+        for q in QUBITS + [cirq.LineQubit(-1)]:
+            touching = [i for i, m in enumerate(moments) if q in m.qubits]
+            for start in range(-1, len(moments) + 1):
+                for end in range(start, len(moments) + 2):
+                    inside = [i for i in touching if start <= i < end]
+                    assert moments.next_moment_operating_on(
+                        [q], start, end) == (inside[0] if inside else None)
+                    assert moments.prev_moment_operating_on(
+                        [q], start, end) == (inside[-1] if inside else None)
+
+
+def _insert_run(moments, i):
+    moments[i:i] = [_random_moment(), _random_moment()]
+
+
+def test_queries():
+    a, b, c, _ = QUBITS
+    moments = MomentList([
+        cirq.Moment([cirq.X(a)]),
+        cirq.Moment([cirq.X(b)]),
+        cirq.Moment(),
+        cirq.Moment([cirq.CZ(a, b)]),
+    ])
+    assert moments.next_moment_operating_on([a], 0, 4) == 0
+    assert moments.next_moment_operating_on([a], 1, 4) == 3
+    assert moments.next_moment_operating_on([a], 1, 3) is None
+    assert moments.next_moment_operating_on([a, b], 1, 4) == 1
+    assert moments.next_moment_operating_on([c], 0, 4) is None
+    assert moments.prev_moment_operating_on([a], 0, 3) == 0
+    assert moments.prev_moment_operating_on([a, b], 0, 3) == 1
+    assert moments.prev_moment_operating_on([a, b], 2, 3) is None
+    assert_index_consistent(moments)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_index_kept_in_sync_with_edits(seed):
+    random.seed(seed)
+    moments = MomentList(_random_moment() for _ in range(5))
+    assert_index_consistent(moments)
+
+    edits = [
+        lambda: moments.__setitem__(random.randint(-len(moments),
+                                                   len(moments) - 1),
+                                    _random_moment()),
+        lambda: moments.insert(random.randint(-6, len(moments) + 2),
+                               _random_moment()),
+        lambda: moments.append(_random_moment()),
+        lambda: moments.extend([_random_moment(), _random_moment()]),
+        lambda: moments.__iadd__([_random_moment()]),
+        lambda: moments.__delitem__(random.randint(-len(moments),
+                                                   len(moments) - 1)),
+        lambda: moments.pop(),
+        lambda: _insert_run(moments, random.randint(0, len(moments))),
+    ]
+    for _ in range(40):
+        random.choice(edits)()
+        if len(moments) < 3:
+            moments.extend([_random_moment()] * 3)
+        assert_index_consistent(moments)
+
+
+def test_edits_discarding_index():
+    a, b = QUBITS[:2]
+    m_a = cirq.Moment([cirq.X(a)])
+    m_b = cirq.Moment([cirq.X(b)])
+    for edit in [
+            lambda m: m.__setitem__(slice(0, 2), [m_b]),
+            lambda m: m.__setitem__(slice(None, None, 2), [m_b, m_b]),
+            lambda m: m.__delitem__(slice(1, 2)),
+            lambda m: m.__imul__(3),
+            lambda m: m.remove(m_a),
+            lambda m: m.clear(),
+            lambda m: m.reverse(),
+            lambda m: m.sort(key=str),
+    ]:
+        moments = MomentList([m_a, m_b, m_a])
+        assert moments.next_moment_operating_on([b], 0, 3) == 1
+        edit(moments)
+        assert_index_consistent(moments)
+
+    # Edits before the index is first used.
+    moments = MomentList([m_a, m_b])
+    moments[0] = m_b
+    moments[1:1] = [m_a]
+    del moments[0]
+    assert moments == [m_a, m_b]
+    assert_index_consistent(moments)
+
+
+def test_copy_and_pickle():
+    moments = MomentList([cirq.Moment([cirq.X(QUBITS[0])]), cirq.Moment()])
+    assert moments.next_moment_operating_on([QUBITS[0]], 0, 2) == 0
+    for other in [
+            copy.copy(moments),
+            copy.deepcopy(moments),
+            pickle.loads(pickle.dumps(moments))
+    ]:
+        assert isinstance(other, MomentList)
+        assert other == moments
+        other.insert(0, cirq.Moment())
+        assert other.next_moment_operating_on([QUBITS[0]], 0, 3) == 1
+        assert moments.next_moment_operating_on([QUBITS[0]], 0, 2) == 0
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_journal_rollback(seed):
+    random.seed(seed)
+    moments = MomentList(_random_moment() for _ in range(5))
+    original = list(moments)
+    assert_index_consistent(moments)
+
+    moments.begin_journal()
+    with pytest.raises(ValueError, match='already'):
+        moments.begin_journal()
+    moments[1] = _random_moment()
+    moments.insert(0, _random_moment())
+    moments.append(_random_moment())
+    del moments[2]
+    _insert_run(moments, 3)
+    moments.reverse()
+    moments[-1] = _random_moment()
+    del moments[1:3]
+    moments *= 2
+    assert isinstance(moments, MomentList)
+    moments += [_random_moment()]
+    assert isinstance(moments, MomentList)
+    moments.remove(moments[0])
+    moments.sort(key=str)
+    moments.clear()
+    moments.extend([_random_moment()])
+    moments.rollback_journal()
+    assert moments == original
+    assert_index_consistent(moments)
+
+    moments.begin_journal()
+    moments.append(_random_moment())
+    moments.end_journal()
+    assert len(moments) == 6
+    moments.begin_journal()
+    moments.rollback_journal()
+    assert len(moments) == 6
@@ -20,6 +20,7 @@ Moment the Operations must all act on distinct Qubits.
 """
 
 from collections import defaultdict
+import contextlib
 from fractions import Fraction
 from itertools import groupby
 import math
@@ -34,6 +35,7 @@ import numpy as np
 from cirq import devices, linalg, ops, study, protocols
 from cirq._compat import deprecated
 from cirq.circuits._bucket_priority_queue import BucketPriorityQueue
+from cirq.circuits._moment_list import MomentList, MomentListAttribute
 from cirq.circuits.insert_strategy import InsertStrategy
 from cirq.circuits.text_diagram_drawer import TextDiagramDrawer
 from cirq.circuits.qasm_output import QasmOutput
@@ -93,6 +95,10 @@ class Circuit:
         circuit[1:7] = [Moment(...)]
     """
 
+    # Assigned moments are wrapped, so that the per-qubit index of the moments
+    # can't be bypassed.
+    _moments = MomentListAttribute('_moment_list')
+
     def __init__(self,
                  moments: Iterable['cirq.Moment'] = (),
                  device: devices.Device = devices.UNCONSTRAINED_DEVICE) -> None:
@@ -102,9 +108,9 @@ class Circuit:
             moments: The initial list of moments defining the circuit.
             device: Hardware that the circuit should be able to run on.
         """
-        self._moments = list(moments)
+        self._moments = MomentList(moments)
         self._device = device
-        self._device.validate_circuit(self)
+        self._device.validate_moments_in_circuit(self, range(len(self)))
         self._validate_op_tree_qids(self)
 
     @property
@@ -113,7 +119,7 @@ class Circuit:
 
     @device.setter
     def device(self, new_device: devices.Device) -> None:
-        new_device.validate_circuit(self)
+        new_device.validate_moments_in_circuit(self, range(len(self)))
         self._device = new_device
 
     @staticmethod
@@ -132,9 +138,52 @@ class Circuit:
             The constructed circuit containing the operations.
         """
         result = Circuit(device=device)
-        result.append(operations, strategy)
+        if (strategy is InsertStrategy.EARLIEST and
+                type(device).can_add_operation_into_moment is
+                devices.Device.can_add_operation_into_moment):
+            result._load_earliest(operations)
+        else:
+            result.append(operations, strategy)
         return result
 
+    def _load_earliest(self, operations: 'cirq.OP_TREE') -> None:
+        """Fills an empty circuit as if by appending the given operations with
+        the EARLIEST strategy, in a single pass over the operations.
+
+        Requires a device that accepts an operation into any moment not
+        already acting on its qubits. Then each operation goes into the
+        moment just after the last one acting on any of its qubits, which is
+        tracked per qubit.
+        """
+        moments_and_operations = list(
+            ops.flatten_op_tree(ops.transform_op_tree(
+                operations,
+                self._device.decompose_operation,
+                preserve_moments=True),
+                                preserve_moments=True))
+        # The operations in each moment, in order of insertion.
+        layers = []  # type: List[List[ops.Operation]]
+        # The index of the moment after the last one acting on each qubit.
+        frontier = {}  # type: Dict[ops.Qid, int]
+        for moment_or_op in moments_and_operations:
+            if isinstance(moment_or_op, ops.Moment):
+                self._validate_op_tree_qids(moment_or_op)
+                layers.append(list(moment_or_op.operations))
+                for q in moment_or_op.qubits:
+                    frontier[q] = len(layers)
+                continue
+            op = cast(ops.Operation, moment_or_op)
+            self._validate_op_tree_qids(op)
+            p = max([frontier.get(q, 0) for q in op.qubits], default=0)
+            if p == len(layers):
+                layers.append([])
+            layers[p].append(op)
+            for q in op.qubits:
+                frontier[q] = p + 1
+
+        self._moments = [ops.Moment(layer) for layer in layers]
+        self._device.validate_moments_in_circuit(self, range(len(self)))
+
     def __copy__(self) -> 'Circuit':
         return self.copy()
 
@@ -201,18 +250,22 @@ class Circuit:
         if isinstance(key, int):
             if not isinstance(value, ops.Moment):
                 raise TypeError('Can only assign Moments into Circuits.')
-            self._device.validate_moment(value)
             self._validate_op_tree_qids(value)
+            indices = [self._moment_index(key)]  # type: Iterable[int]
 
         if isinstance(key, slice):
             value = list(value)
             if any(not isinstance(v, ops.Moment) for v in value):
                 raise TypeError('Can only assign Moments into Circuits.')
             for moment in value:
-                self._device.validate_moment(moment)
                 self._validate_op_tree_qids(moment)
+            start, stop, step = key.indices(len(self._moments))
+            indices = (range(start, start + len(value))
+                       if step == 1 else range(start, stop, step))
 
-        self._moments[key] = value
+        with self._transaction():
+            self._moments[key] = value
+            self._device.validate_moments_in_circuit(self, indices)
     # pylint: enable=function-redefined
 
     def __delitem__(self, key: Union[int, slice]):
@@ -333,14 +386,6 @@ class Circuit:
                 + self.to_text_diagram()
                 + '</pre>')
 
-    def _first_moment_operating_on(self, qubits: Iterable['cirq.Qid'],
-                                   indices: Iterable[int]) -> Optional[int]:
-        qubits = frozenset(qubits)
-        for m in indices:
-            if self._has_op_at(m, qubits):
-                return m
-        return None
-
     def next_moment_operating_on(self,
                                  qubits: Iterable['cirq.Qid'],
                                  start_moment_index: int = 0,
@@ -368,9 +413,8 @@ class Circuit:
         else:
             max_distance = min(max_distance, max_circuit_distance)
 
-        return self._first_moment_operating_on(
-            qubits,
-            range(start_moment_index, start_moment_index + max_distance))
+        return self._moments.next_moment_operating_on(
+            qubits, start_moment_index, start_moment_index + max_distance)
 
     def next_moments_operating_on(self,
                                   qubits: Iterable['cirq.Qid'],
@@ -437,21 +481,21 @@ class Circuit:
         if max_distance <= 0:
             return None
 
-        return self._first_moment_operating_on(qubits,
-                                               (end_moment_index - k - 1
-                                                for k in range(max_distance)))
+        return self._moments.prev_moment_operating_on(
+            qubits, end_moment_index - max_distance, end_moment_index)
 
     def _prev_moment_available(self, op: 'cirq.Operation',
                                end_moment_index: int) -> Optional[int]:
-        last_available = end_moment_index
-        k = end_moment_index
-        while k > 0:
-            k -= 1
-            if not self._can_commute_past(k, op):
-                return last_available
+        # The operation can commute back past every moment after the last
+        # one acting on its qubits, and lands in the earliest of those that
+        # accepts it.
+        blocker = self._moments.prev_moment_operating_on(
+            op.qubits, 0, end_moment_index)
+        start = 0 if blocker is None else blocker + 1
+        for k in range(start, end_moment_index):
             if self._can_add_op_at(k, op):
-                last_available = k
-        return last_available
+                return k
+        return end_moment_index
 
     def reachable_frontier_from(
             self,
@@ -739,10 +783,7 @@ class Circuit:
         """
         if not 0 <= moment_index < len(self._moments):
             return None
-        for op in self._moments[moment_index].operations:
-            if qubit in op.qubits:
-                return op
-        return None
+        return self._moments[moment_index].operation_at(qubit)
 
     def findall_operations(self, predicate: Callable[['cirq.Operation'], bool]
                           ) -> Iterable[Tuple[int, ops.Operation]]:
@@ -864,10 +905,6 @@ class Circuit:
             operation,
             self._moments[moment_index])
 
-    def _can_commute_past(self, moment_index: int,
-                          operation: 'cirq.Operation') -> bool:
-        return not self._moments[moment_index].operates_on(operation.qubits)
-
     def _validate_op_tree_qids(self, op_tree: ops.OP_TREE) -> None:
         """Raises an exception if any operation in `op_tree` has qids that don't
         match its qid shape.
@@ -928,20 +965,27 @@ class Circuit:
         # limit index to 0..len(self._moments), also deal with indices smaller 0
         k = max(min(index if index >= 0 else len(self._moments) + index,
                     len(self._moments)), 0)
-        for moment_or_op in moments_and_operations:
-            if isinstance(moment_or_op, ops.Moment):
-                self._moments.insert(k, moment_or_op)
-                k += 1
-            else:
-                p = self._pick_or_create_inserted_op_moment_index(
-                    k, moment_or_op, strategy)
-                while p >= len(self._moments):
-                    self._moments.append(ops.Moment())
-                self._moments[p] = self._moments[p].with_operation(moment_or_op)
-                self._device.validate_moment(self._moments[p])
-                k = max(k, p + 1)
-                if strategy is InsertStrategy.NEW_THEN_INLINE:
-                    strategy = InsertStrategy.INLINE
+        # New moments are only ever created at or after k, which never
+        # decreases, so the indices of the edited moments don't shift.
+        edited = set()  # type: Set[int]
+        with self._transaction():
+            for moment_or_op in moments_and_operations:
+                if isinstance(moment_or_op, ops.Moment):
+                    self._moments.insert(k, moment_or_op)
+                    edited.add(k)
+                    k += 1
+                else:
+                    p = self._pick_or_create_inserted_op_moment_index(
+                        k, moment_or_op, strategy)
+                    while p >= len(self._moments):
+                        self._moments.append(ops.Moment())
+                    self._moments[p] = self._moments[p].with_operation(
+                        moment_or_op)
+                    edited.add(p)
+                    k = max(k, p + 1)
+                    if strategy is InsertStrategy.NEW_THEN_INLINE:
+                        strategy = InsertStrategy.INLINE
+            self._device.validate_moments_in_circuit(self, sorted(edited))
         return k
 
     def insert_into_range(self, operations: 'cirq.OP_TREE', start: int,
@@ -972,22 +1016,28 @@ class Circuit:
             self._device.validate_operation(op)
         self._validate_op_tree_qids(operations)
 
-        i = start
-        op_index = 0
-        while op_index < len(operations):
-            op = operations[op_index]
-            while i < end and not self._device.can_add_operation_into_moment(
-                    op, self._moments[i]):
-                i += 1
-            if i >= end:
-                break
-            self._moments[i] = self._moments[i].with_operation(op)
-            op_index += 1
-
-        if op_index >= len(operations):
-            return end
-
-        return self.insert(end, operations[op_index:])
+        with self._transaction():
+            i = start
+            op_index = 0
+            edited = []  # type: List[int]
+            while op_index < len(operations):
+                op = operations[op_index]
+                while (i < end and
+                       not self._device.can_add_operation_into_moment(
+                           op, self._moments[i])):
+                    i += 1
+                if i >= end:
+                    break
+                self._moments[i] = self._moments[i].with_operation(op)
+                if not edited or edited[-1] != i:
+                    edited.append(i)
+                op_index += 1
+            self._device.validate_moments_in_circuit(self, edited)
+
+            if op_index >= len(operations):
+                return end
+
+            return self.insert(end, operations[op_index:])
 
     @staticmethod
     def _pick_inserted_ops_moment_indices(
@@ -1110,6 +1160,19 @@ class Circuit:
         operations = tuple(ops.flatten_op_tree(operations))
         if not operations:
             return frontier
+        self._insert_at_frontier(operations, start, frontier)
+        return frontier
+
+    def _insert_at_frontier(self, operations: Sequence['cirq.Operation'],
+                            start: int, frontier: Dict[ops.Qid, int]
+                           ) -> Tuple[Sequence[int], Tuple[int, int]]:
+        """Inserts a non-empty sequence of operations inline at frontier.
+
+        Returns:
+            The index of the moment each operation was inserted into, and the
+            (index at which new moments were inserted, how many new moments
+            were inserted) pair from `_push_frontier`.
+        """
         qubits = set(q for op in operations for q in op.qubits)
         if any(frontier[q] > start for q in qubits):
             raise ValueError('The frontier for qubits on which the operations'
@@ -1120,11 +1183,11 @@ class Circuit:
         insertion_indices, _ = self._pick_inserted_ops_moment_indices(
             operations, start, frontier)
 
-        self._push_frontier(frontier, next_moments)
+        shift = self._push_frontier(frontier, next_moments)
 
         self._insert_operations(operations, insertion_indices)
 
-        return frontier
+        return insertion_indices, shift
 
     def batch_remove(self,
                      removals: Iterable[Tuple[int, ops.Operation]]) -> None:
@@ -1142,18 +1205,28 @@ class Circuit:
         IndexError:
             Deleted from a moment that doesn't exist.
         """
-        copy = self.copy()
+        removals_by_moment = defaultdict(
+            list)  # type: Dict[int, List[ops.Operation]]
         for i, op in removals:
-            if op not in copy._moments[i].operations:
-                raise ValueError(
-                    "Can't remove {} @ {} because it doesn't exist.".format(
-                        op, i))
-            copy._moments[i] = ops.Moment(
-                old_op
-                for old_op in copy._moments[i].operations
-                if op != old_op)
-        self._device.validate_circuit(copy)
-        self._moments = copy._moments
+            removals_by_moment[self._moment_index(i)].append(op)
+
+        new_moments = {}  # type: Dict[int, ops.Moment]
+        for i, to_remove in removals_by_moment.items():
+            moment = self._moments[i]
+            removed_ids = set()  # type: Set[int]
+            for op in to_remove:
+                matches = ([moment.operation_at(op.qubits[0])]
+                           if op.qubits else moment.operations)
+                ids = {id(old_op) for old_op in matches if old_op == op}
+                if not ids or not ids.isdisjoint(removed_ids):
+                    raise ValueError(
+                        "Can't remove {} @ {} because it doesn't exist.".format(
+                            op, i))
+                removed_ids |= ids
+            new_moments[i] = ops.Moment(
+                old_op for old_op in moment.operations
+                if id(old_op) not in removed_ids)
+        self._replace_moments(new_moments)
 
     def batch_insert_into(self,
                           insert_intos: Iterable[Tuple[int, ops.Operation]]
@@ -1173,12 +1246,50 @@ class Circuit:
         IndexError:
             Inserted into a moment index that doesn't exist.
         """
-        copy = self.copy()
+        insertions_by_moment = defaultdict(
+            list)  # type: Dict[int, List[ops.Operation]]
         for i, op in insert_intos:
-            copy._moments[i] = copy._moments[i].with_operation(op)
-        self._device.validate_circuit(copy)
-        self._validate_op_tree_qids(copy)
-        self._moments = copy._moments
+            insertions_by_moment[self._moment_index(i)].append(op)
+        for new_ops in insertions_by_moment.values():
+            self._validate_op_tree_qids(new_ops)
+
+        self._replace_moments({
+            i: ops.Moment(self._moments[i].operations + tuple(new_ops))
+            for i, new_ops in insertions_by_moment.items()
+        })
+
+    def _moment_index(self, index: int) -> int:
+        """Resolves a possibly negative index of an existing moment."""
+        if not -len(self._moments) <= index < len(self._moments):
+            raise IndexError('Moment index out of range: {}'.format(index))
+        return index % len(self._moments)
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        """Undoes the edits made to the moments if the block raises.
+
+        Nested transactions are part of the outermost one.
+        """
+        if self._moments.is_journaling:
+            yield
+            return
+        self._moments.begin_journal()
+        try:
+            yield
+        except Exception:
+            self._moments.rollback_journal()
+            raise
+        self._moments.end_journal()
+
+    def _replace_moments(self, new_moments: Dict[int, 'cirq.Moment']) -> None:
+        """Replaces several existing moments, validating only those moments.
+
+        If the device rejects the result, the circuit is left unchanged.
+        """
+        with self._transaction():
+            for i, moment in new_moments.items():
+                self._moments[i] = moment
+            self._device.validate_moments_in_circuit(self, sorted(new_moments))
 
     def batch_insert(self,
                      insertions: Iterable[Tuple[int, ops.OP_TREE]]) -> None:
@@ -1202,22 +1313,20 @@ class Circuit:
                 indicating operations to add into the circuit at specific
                 places.
         """
-        # Work on a copy in case validation fails halfway through.
-        copy = self.copy()
         shift = 0
         # Note: python `sorted` is guaranteed to be stable. This matters.
         insertions = sorted(insertions, key=lambda e: e[0])
         groups = _group_until_different(insertions,
                                         key=lambda e: e[0],
                                         value=lambda e: e[1])
-        for i, group in groups:
-            insert_index = i + shift
-            next_index = copy.insert(insert_index,
-                                     reversed(group),
-                                     InsertStrategy.EARLIEST)
-            if next_index > insert_index:
-                shift += next_index - insert_index
-        self._moments = copy._moments
+        # Undo the earlier groups if validation fails halfway through.
+        with self._transaction():
+            for i, group in groups:
+                insert_index = i + shift
+                next_index = self.insert(insert_index, reversed(group),
+                                         InsertStrategy.EARLIEST)
+                if next_index > insert_index:
+                    shift += next_index - insert_index
 
     def append(
             self,
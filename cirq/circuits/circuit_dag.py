@@ -12,8 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Callable, Dict, Generic, Iterator, TypeVar, cast, \
-    TYPE_CHECKING
+from typing import (Any, Callable, Dict, Generic, Iterable, Iterator, List,
+                    Tuple, TypeVar, cast, TYPE_CHECKING)
 
 import functools
 import networkx
@@ -64,7 +64,10 @@ class CircuitDag(networkx.DiGraph):
     application order between two operations.  The first must be applied before
     the second.
 
-    The graph is maximalist (transitive completion).
+    The graph is maximalist (transitive completion), unless it is built with
+    `maximalist=False`. Then each operation only has edges from the latest
+    operations on its qubits that it can't be reordered with, and the
+    transitive completion of the graph is the maximalist graph.
     """
 
     disjoint_qubits = staticmethod(_disjoint_qubits)
@@ -97,23 +100,45 @@ class CircuitDag(networkx.DiGraph):
         return Unique(op)
 
     @staticmethod
-    def from_circuit(circuit: circuit.Circuit,
-                     can_reorder: Callable[['cirq.Operation', ops.
-                                            Operation], bool] = _disjoint_qubits
-                    ) -> 'CircuitDag':
+    def from_circuit(
+            circuit: circuit.Circuit,
+            can_reorder: Callable[['cirq.Operation', ops.
+                                   Operation], bool] = _disjoint_qubits,
+            maximalist: bool = True) -> 'CircuitDag':
         return CircuitDag.from_ops(circuit.all_operations(),
                                    can_reorder=can_reorder,
-                                   device=circuit.device)
+                                   device=circuit.device,
+                                   maximalist=maximalist)
 
     @staticmethod
     def from_ops(*operations: 'cirq.OP_TREE',
                  can_reorder: Callable[['cirq.Operation', ops.
                                         Operation], bool] = _disjoint_qubits,
-                 device: devices.Device = devices.UNCONSTRAINED_DEVICE
-                ) -> 'CircuitDag':
+                 device: devices.Device = devices.UNCONSTRAINED_DEVICE,
+                 maximalist: bool = True) -> 'CircuitDag':
+        """Creates a CircuitDag of the given operations.
+
+        Args:
+            operations: The operations, in the order they are applied.
+            can_reorder: A predicate that determines if two operations may be
+                reordered. See `CircuitDag.__init__`.
+            device: Hardware that the circuit should be able to run on.
+            maximalist: If True, every operation gets an edge from each of
+                the operations that must come before it, which takes time
+                quadratic in the number of operations. If False, only edges
+                from the latest such operations on each qubit are added,
+                which implies the same order and is much faster for large
+                circuits. This requires `can_reorder` to
+                allow reordering operations that don't share qubits.
+        """
         dag = CircuitDag(can_reorder=can_reorder, device=device)
-        for op in ops.flatten_op_tree(operations):
-            dag.append(cast(ops.Operation, op))
+        flat_ops = cast(Iterable[ops.Operation],
+                        ops.flatten_op_tree(operations))
+        if maximalist:
+            for op in flat_ops:
+                dag.append(op)
+        else:
+            dag._extend_sparse(flat_ops)
         return dag
 
     def append(self, op: 'cirq.Operation') -> None:
@@ -125,6 +150,42 @@ class CircuitDag(networkx.DiGraph):
                     self.add_edge(pred, new_node)
         self.add_node(new_node)
 
+    def _extend_sparse(self, operations: Iterable['cirq.Operation']) -> None:
+        """Adds the operations, with edges only from the latest operations on
+        their qubits that they can't be reordered with.
+
+        The earlier operations on each qubit are walked from the latest one
+        back. Each node remembers how many of the operations before it on
+        each of its qubits are known to be its ancestors, so the walk stops
+        as soon as the remaining operations are implied by an edge already
+        added. For the default predicate this is the last operation on the
+        qubit; for other predicates the walk covers the run of operations
+        that can be reordered with the new one.
+        """
+        # The nodes operating on each qubit, in order.
+        history = {}  # type: Dict[ops.Qid, List[Unique[ops.Operation]]]
+        # For each node and qubit of the node, how many of the earlier nodes
+        # on the qubit are known to be ancestors of the node.
+        floors = {}  # type: Dict[Tuple[Unique[ops.Operation], ops.Qid], int]
+        for op in operations:
+            new_node = self.make_node(op)
+            self.add_node(new_node)
+            for q in op.qubits:
+                nodes = history.setdefault(q, [])
+                stop = 0
+                floor = len(nodes)
+                i = len(nodes) - 1
+                while i >= stop:
+                    node = nodes[i]
+                    if self.can_reorder(node.val, op):
+                        floor = i
+                    else:
+                        self.add_edge(node, new_node)
+                        stop = max(stop, floors[node, q])
+                    i -= 1
+                floors[new_node, q] = floor
+                nodes.append(new_node)
+
     def __eq__(self, other):
         if not isinstance(other, type(self)):
             return NotImplemented
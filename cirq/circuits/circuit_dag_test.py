@@ -250,3 +250,52 @@ def test_is_maximalist(circuit):
     dag = cirq.CircuitDag.from_circuit(circuit)
     transitive_closure = networkx.dag.transitive_closure(dag)
     assert cirq.CircuitDag(incoming_graph_data=transitive_closure) == dag
+
+
+def test_from_ops_not_maximalist():
+    q0, q1 = cirq.LineQubit.range(2)
+    dag = cirq.CircuitDag.from_ops(cirq.X(q0),
+                                   cirq.Y(q0),
+                                   cirq.CZ(q0, q1),
+                                   cirq.X(q0),
+                                   maximalist=False)
+    assert networkx.dag.is_directed_acyclic_graph(dag)
+    assert len(dag.nodes()) == 4
+    assert ([(n1.val, n2.val) for n1, n2 in dag.edges()] ==
+            [(cirq.X(q0), cirq.Y(q0)),
+             (cirq.Y(q0), cirq.CZ(q0, q1)),
+             (cirq.CZ(q0, q1), cirq.X(q0))])
+
+
+def test_not_maximalist_with_reorder_predicate():
+    q0 = cirq.LineQubit(0)
+    dag = cirq.CircuitDag.from_ops(cirq.H(q0),
+                                   cirq.S(q0),
+                                   cirq.Z(q0),
+                                   can_reorder=cirq.operations_commute,
+                                   maximalist=False)
+    assert (set((n1.val, n2.val) for n1, n2 in dag.edges()) ==
+            {(cirq.H(q0), cirq.S(q0)),
+             (cirq.H(q0), cirq.Z(q0))})
+
+
+@pytest.mark.parametrize('circuit,can_reorder', [
+    (cirq.testing.random_circuit(10, 10, 0.5), can_reorder)
+    for can_reorder in [cirq.CircuitDag.disjoint_qubits,
+                        cirq.operations_commute]
+    for _ in range(3)
+])
+def test_not_maximalist_has_same_closure(circuit, can_reorder):
+    dag = cirq.CircuitDag.from_circuit(circuit,
+                                       can_reorder=can_reorder,
+                                       maximalist=False)
+    if can_reorder is cirq.CircuitDag.disjoint_qubits:
+        assert dag.number_of_edges() <= sum(
+            len(op.qubits) for op in circuit.all_operations())
+    transitive_closure = networkx.dag.transitive_closure(dag)
+    assert cirq.CircuitDag(
+        incoming_graph_data=transitive_closure) == cirq.CircuitDag.from_circuit(
+            circuit, can_reorder=can_reorder)
+    cirq.testing.assert_allclose_up_to_global_phase(circuit.unitary(),
+                                                    dag.to_circuit().unitary(),
+                                                    atol=1e-7)
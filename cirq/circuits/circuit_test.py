@@ -17,6 +17,8 @@ from typing import Tuple
 from collections import defaultdict
 from random import randint, random, sample, randrange
 import os
+from unittest import mock
+
 import numpy as np
 import pytest
 import sympy
@@ -1037,6 +1039,32 @@ def test_prev_moment_operating_on_distance():
     assert c.prev_moment_operating_on([a], 1, max_distance=10**100) is None
 
 
+def test_moment_operating_on_after_edits():
+    a, b = cirq.LineQubit.range(2)
+    c = cirq.Circuit.from_ops(cirq.X(a), cirq.Y(b), cirq.CZ(a, b))
+    assert c.next_moment_operating_on([b]) == 0
+    assert c.prev_moment_operating_on([a], 1) == 0
+
+    c.insert(0, cirq.Moment([cirq.Z(b)]))
+    assert c.next_moment_operating_on([b]) == 0
+    assert c.next_moment_operating_on([a]) == 1
+    assert c.prev_moment_operating_on([a], 2) == 1
+
+    c[1] = cirq.Moment()
+    assert c.next_moment_operating_on([a]) == 2
+    assert c.operation_at(a, 1) is None
+    assert c.operation_at(a, 2) == cirq.CZ(a, b)
+
+    del c[0]
+    assert c.next_moment_operating_on([b]) == 1
+    c.batch_remove([(1, cirq.CZ(a, b))])
+    assert c.next_moment_operating_on([b]) is None
+
+    # Reassigning the moment list directly keeps the queries working.
+    c._moments = [cirq.Moment(), cirq.Moment([cirq.X(a)])]
+    assert c.prev_moment_operating_on([a]) == 1
+
+
 def test_operation_at():
     a = cirq.NamedQubit('a')
     b = cirq.NamedQubit('b')
@@ -1543,6 +1571,44 @@ def test_from_ops():
     ])
 
 
+def test_from_ops_matches_appending_one_by_one():
+    qubits = cirq.LineQubit.range(5)
+    for _ in range(5):
+        random_ops = list(
+            cirq.testing.random_circuit(qubits, n_moments=10,
+                                        op_density=0.7).all_operations())
+        contents = random_ops[:10] + [
+            cirq.Moment([cirq.X(qubits[0])]),
+            cirq.GlobalPhaseOperation(1j),
+        ] + random_ops[10:] + [cirq.Moment()] + random_ops[:5]
+
+        expected = cirq.Circuit()
+        for item in contents:
+            expected.append(item)
+        assert cirq.Circuit.from_ops(contents) == expected
+
+    # Devices that decide placement themselves take the general path.
+    device = cg.Foxtail
+    q = cirq.GridQubit(0, 0)
+    expected = cirq.Circuit(device=device)
+    expected.append([cirq.CZ(q, q + (0, 1)), cirq.X(q)**0.5])
+    assert cirq.Circuit.from_ops(
+        [cirq.CZ(q, q + (0, 1)), cirq.X(q)**0.5], device=device) == expected
+
+
+def test_append_to_wide_circuit_uses_frontier():
+    qubits = cirq.LineQubit.range(200)
+    c = cirq.Circuit()
+    for _ in range(3):
+        for q in qubits:
+            c.append(cirq.X(q))
+    assert len(c) == 3
+    c.append(cirq.CZ(qubits[0], qubits[1]))
+    c.append(cirq.Z(qubits[2]))
+    assert c[3] == cirq.Moment([cirq.CZ(qubits[0], qubits[1]),
+                                cirq.Z(qubits[2])])
+
+
 def test_to_text_diagram_teleportation_to_diagram():
     ali = cirq.NamedQubit('(0, 0)')
     bob = cirq.NamedQubit('(0, 1)')
@@ -2481,6 +2547,91 @@ def test_batch_insert():
     ])
 
 
+def test_batch_edits_roll_back_without_copying():
+    device = cg.Foxtail
+    q0, q1, q2 = cirq.GridQubit.rect(1, 3)
+    original = cirq.Circuit([
+        cirq.Moment([cirq.X(q0)]),
+        cirq.Moment([cirq.measure(q1, key='m')]),
+        cirq.Moment(),
+    ])
+
+    with mock.patch.object(cirq.Circuit, 'copy', side_effect=AssertionError):
+        # Rejected by the device's circuit-level check for unique keys.
+        after = cirq.Circuit(original, device=device)
+        with pytest.raises(ValueError, match='Measurement key'):
+            after.batch_insert_into([(0, cirq.Y(q2)),
+                                     (2, cirq.measure(q0, key='m'))])
+        assert list(after) == list(original)
+        assert after.next_moment_operating_on([q2]) is None
+
+        # Rejected after an earlier group was inserted.
+        after = cirq.Circuit(original, device=device)
+        with pytest.raises(ValueError, match='Qubit not on device'):
+            after.batch_insert([(0, cirq.Y(q2)),
+                                (1, cirq.X(cirq.GridQubit(10, 10)))])
+        assert list(after) == list(original)
+        assert after.next_moment_operating_on([q2]) is None
+
+        after.batch_remove([(-3, cirq.X(q0))])
+        assert after.next_moment_operating_on([q0]) is None
+        after.batch_insert_into([(2, cirq.Y(q2)), (-1, cirq.X(q0))])
+        assert after[2] == cirq.Moment([cirq.Y(q2), cirq.X(q0)])
+
+
+def test_batch_remove_zero_qubit_operations():
+    a = cirq.LineQubit(0)
+    c = cirq.Circuit([
+        cirq.Moment([cirq.X(a), cirq.GlobalPhaseOperation(1j)]),
+    ])
+    c.batch_remove([(0, cirq.GlobalPhaseOperation(1j))])
+    assert c == cirq.Circuit([cirq.Moment([cirq.X(a)])])
+    with pytest.raises(ValueError, match="doesn't exist"):
+        c.batch_remove([(0, cirq.GlobalPhaseOperation(1j))])
+
+
+def test_edits_validate_only_edited_moments():
+    device = cg.Foxtail
+    q0, q1, q2 = cirq.GridQubit.rect(1, 3)
+    with mock.patch.object(cg.XmonDevice,
+                           'validate_circuit',
+                           side_effect=AssertionError):
+        c = cirq.Circuit.from_ops([cirq.X(q0), cirq.Y(q1)] * 3, device=device)
+        c.append(cirq.measure(q0, key='a'))
+        c[1] = cirq.Moment([cirq.X(q2)])
+        c[2:3] = [cirq.Moment([cirq.CZ(q1, q2)]), cirq.Moment()]
+        c.insert_into_range([cirq.X(q0)], 2, 3)
+        c.device = device
+        _ = c.with_device(device)
+        expected = list(c)
+
+        # Rejected edits leave the circuit unchanged.
+        with pytest.raises(ValueError, match='Measurement key a repeated'):
+            c.append(cirq.measure(q1, key='a'))
+        with pytest.raises(ValueError, match='Adjacent Exp11'):
+            c.append(cirq.Moment([
+                cirq.CZ(q0, q1),
+                cirq.CZ(cirq.GridQubit(1, 0), cirq.GridQubit(1, 1))
+            ]))
+        with pytest.raises(ValueError, match='Qubit not on device'):
+            c[0] = cirq.Moment([cirq.X(cirq.GridQubit(10, 10))])
+        with pytest.raises(ValueError, match='Qubit not on device'):
+            c.insert_into_range([cirq.Y(q2), cirq.X(cirq.GridQubit(10, 10))],
+                                0, 1)
+        assert list(c) == expected
+
+
+def test_insert_into_range_rolls_back_overflow():
+    device = cg.Foxtail
+    q0, q1 = cirq.GridQubit.rect(1, 2)
+    c = cirq.Circuit([cirq.Moment([cirq.X(q0)])], device=device)
+    with pytest.raises(ValueError, match='Qubit not on device'):
+        c.insert_into_range(
+            [cirq.Y(q1), cirq.Y(q0),
+             cirq.X(cirq.GridQubit(10, 10))], 0, 1)
+    assert c == cirq.Circuit([cirq.Moment([cirq.X(q0)])], device=device)
+
+
 def test_batch_insert_multiple_same_index():
     a, b = cirq.LineQubit.range(2)
     c = cirq.Circuit()
@@ -3228,6 +3379,8 @@ def test_operation_shape_validation():
         _ = cirq.Circuit.from_ops(BadOperation1())
     with pytest.raises(ValueError, match='Invalid operation'):
         _ = cirq.Circuit.from_ops(BadOperation2())
+    with pytest.raises(ValueError, match='Invalid operation'):
+        _ = cirq.Circuit.from_ops(cirq.Moment([BadOperation2()]))
 
 
 def test_json_dict():
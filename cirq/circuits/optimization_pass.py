@@ -13,11 +13,12 @@
 # limitations under the License.
 
 """Defines the OptimizationPass type."""
-from typing import (Dict, Callable, Iterable, Optional, Sequence, TYPE_CHECKING,
-                    Tuple, cast)
+from typing import (Dict, Callable, Iterable, List, Optional, Sequence, Set,
+                    TYPE_CHECKING, Tuple, cast)
 
 import abc
 from collections import defaultdict
+import heapq
 
 from cirq import ops
 from cirq.circuits.circuit import Circuit
@@ -138,3 +139,145 @@ class PointOptimizer:
                 circuit.insert_at_frontier(new_operations, i, frontier)
 
             i += 1
+
+    def optimize_circuit_until_stable(self, circuit: Circuit) -> None:
+        """Optimizes the circuit until the optimization stops changing it.
+
+        Where `optimize_circuit` visits each moment once and leaves alone the
+        operations inserted by earlier optimizations, this keeps a worklist of
+        the (moment, qubit) locations still to be examined. It starts out
+        holding every operation, visited in moment order. After each rewrite
+        only its neighborhood goes back on the worklist: the new operations,
+        and the operations just before and just after them on the qubits the
+        rewrite touched. So a single call reaches a fixpoint without
+        re-running whole passes.
+
+        An optimization whose new operations are the same as the ones it
+        would clear is treated as making no change. Otherwise the optimization
+        must eventually stop finding changes, or this method never returns.
+
+        Args:
+            circuit: The circuit to optimize. This value is mutated in-place.
+        """
+        worklist = _Worklist()
+        while True:
+            qubits = None  # type: Optional[Set[Qid]]
+            if worklist.has_dirty():
+                index, qubits = worklist.pop()
+            elif worklist.horizon < len(circuit):
+                index = worklist.horizon
+                worklist.horizon += 1
+            else:
+                break
+            if index >= len(circuit):
+                continue
+
+            pending = [
+                op for op in circuit[index].operations
+                if qubits is None or not qubits.isdisjoint(op.qubits)
+            ]
+            for k, op in enumerate(pending):
+                new_index = self._rewrite_at(circuit, index, op, worklist)
+                if new_index is not None:
+                    # The rest of the moment is examined later, from wherever
+                    # the rewrite moved it to.
+                    for later_op in pending[k + 1:]:
+                        worklist.mark(new_index, later_op.qubits)
+                    break
+
+    def _rewrite_at(self, circuit: Circuit, index: int, op: 'cirq.Operation',
+                    worklist: '_Worklist') -> Optional[int]:
+        """Applies the optimization at an operation, if it changes anything.
+
+        Returns:
+            None if the circuit wasn't changed. Otherwise the index the moment
+            at the given index moved to.
+        """
+        opt = self.optimization_at(circuit, index, op)
+        if opt is None:
+            return None
+
+        span = range(index, min(index + opt.clear_span, len(circuit)))
+        clear_qubits = frozenset(opt.clear_qubits)
+        old_operations = [
+            old_op for i in span for old_op in circuit[i].operations
+            if not clear_qubits.isdisjoint(old_op.qubits)
+        ]
+        # Without `preserve_moments`, only operations are yielded.
+        new_operations = tuple(
+            cast(
+                Iterable[ops.Operation],
+                ops.flatten_op_tree(
+                    self.post_clean_up(
+                        cast(Tuple[ops.Operation], opt.new_operations)))))
+        if tuple(old_operations) == new_operations:
+            return None
+
+        circuit.clear_operations_touching(clear_qubits, span)
+        affected = set(clear_qubits)
+        for old_op in old_operations:
+            affected.update(old_op.qubits)
+        last_new_moments = {}  # type: Dict[Qid, int]
+        if new_operations:
+            insertion_indices, (shift_start, shift) = (
+                circuit._insert_at_frontier(new_operations, index,
+                                            defaultdict(lambda: 0)))
+            worklist.shift(shift_start, shift)
+            for new_op, i in zip(new_operations, insertion_indices):
+                worklist.mark(i, new_op.qubits)
+                for q in new_op.qubits:
+                    affected.add(q)
+                    last_new_moments[q] = max(last_new_moments.get(q, i), i)
+            if shift and shift_start <= index:
+                index += shift
+
+        for q in affected:
+            prev_index = circuit.prev_moment_operating_on([q], index)
+            if prev_index is not None:
+                worklist.mark(prev_index, [q])
+            next_index = circuit.next_moment_operating_on(
+                [q], last_new_moments.get(q, index - 1) + 1)
+            if next_index is not None:
+                worklist.mark(next_index, [q])
+        return index
+
+
+class _Worklist:
+    """The locations a `PointOptimizer` still has to examine.
+
+    Moments at or after the horizon haven't been visited at all yet. Before
+    the horizon, only the marked qubits of marked moments need another look.
+    """
+
+    def __init__(self) -> None:
+        self.horizon = 0
+        self._dirty = {}  # type: Dict[int, Set[Qid]]
+        self._heap = []  # type: List[int]
+
+    def has_dirty(self) -> bool:
+        return bool(self._heap)
+
+    def mark(self, index: int, qubits: Iterable['Qid']) -> None:
+        """Marks qubits of a moment for (re-)examination."""
+        if index >= self.horizon:
+            return
+        if index not in self._dirty:
+            self._dirty[index] = set()
+            heapq.heappush(self._heap, index)
+        self._dirty[index].update(qubits)
+
+    def pop(self) -> Tuple[int, Set['Qid']]:
+        """Removes and returns the earliest marked moment and its qubits."""
+        index = heapq.heappop(self._heap)
+        return index, self._dirty.pop(index)
+
+    def shift(self, start: int, amount: int) -> None:
+        """Accounts for `amount` moments having been inserted at `start`."""
+        if not amount:
+            return
+        if self.horizon >= start:
+            self.horizon += amount
+        if any(index >= start for index in self._heap):
+            self._dirty = {(index + amount if index >= start else index): qubits
+                           for index, qubits in self._dirty.items()}
+            self._heap = sorted(self._dirty)
@@ -145,3 +145,114 @@ z: ─────────────────────────
 def test_repr():
     assert repr(cirq.PointOptimizationSummary(clear_span=0, clear_qubits=[
     ], new_operations=[])) == 'cirq.PointOptimizationSummary(0, (), ())'
+
+
+class MergeAdjacentXPowers(PointOptimizer):
+    """Merges an X power gate into the next operation on its qubit, if that is
+    also an X power gate."""
+
+    def optimization_at(self, circuit, index, op):
+        if not isinstance(op.gate, cirq.XPowGate):
+            return None
+        n = circuit.next_moment_operating_on(op.qubits, index + 1)
+        if n is None:
+            return None
+        next_op = circuit.operation_at(op.qubits[0], n)
+        if not isinstance(next_op.gate, cirq.XPowGate):
+            return None
+        return PointOptimizationSummary(
+            clear_span=n - index + 1,
+            clear_qubits=op.qubits,
+            new_operations=cirq.X(op.qubits[0])**(op.gate.exponent +
+                                                  next_op.gate.exponent))
+
+
+class DropYAndMergeXPowers(MergeAdjacentXPowers):
+    """Also drops Y gates."""
+
+    def optimization_at(self, circuit, index, op):
+        if op.gate == cirq.Y:
+            return PointOptimizationSummary(clear_span=1,
+                                            clear_qubits=op.qubits,
+                                            new_operations=[])
+        return super().optimization_at(circuit, index, op)
+
+
+class SplitZ(PointOptimizer):
+    """Replaces Z gates with two S gates."""
+
+    def optimization_at(self, circuit, index, op):
+        if op.gate != cirq.Z:
+            return None
+        return PointOptimizationSummary(clear_span=1,
+                                        clear_qubits=op.qubits,
+                                        new_operations=[cirq.S(op.qubits[0])] *
+                                        2)
+
+
+def _without_empty_moments(circuit):
+    return cirq.Circuit(m for m in circuit if m)
+
+
+def test_point_optimizer_optimize_circuit_until_stable():
+    a, b = cirq.LineQubit.range(2)
+    c = cirq.Circuit.from_ops(
+        [cirq.X(a)**0.25] * 5,
+        cirq.CZ(a, b),
+        [cirq.X(a)**0.5] * 3,
+        cirq.X(b)**0.5,
+        cirq.X(b)**0.5,
+    )
+
+    single_pass = c.copy()
+    MergeAdjacentXPowers().optimize_circuit(single_pass)
+    assert len(list(single_pass.all_operations())) > 4
+
+    MergeAdjacentXPowers().optimize_circuit_until_stable(c)
+    assert _without_empty_moments(c) == cirq.Circuit([
+        cirq.Moment([cirq.X(a)**1.25]),
+        cirq.Moment([cirq.CZ(a, b)]),
+        cirq.Moment([cirq.X(b), cirq.X(a)**1.5]),
+    ])
+
+    # A stable circuit is left alone.
+    expected = c.copy()
+    MergeAdjacentXPowers().optimize_circuit_until_stable(c)
+    assert c == expected
+
+
+def test_point_optimizer_optimize_circuit_until_stable_revisits_earlier_ops():
+    a = cirq.NamedQubit('a')
+    c = cirq.Circuit.from_ops(cirq.X(a)**0.5, cirq.Y(a), cirq.X(a)**0.5)
+
+    single_pass = c.copy()
+    DropYAndMergeXPowers().optimize_circuit(single_pass)
+    assert _without_empty_moments(single_pass) == cirq.Circuit.from_ops(
+        cirq.X(a)**0.5, cirq.X(a)**0.5)
+
+    DropYAndMergeXPowers().optimize_circuit_until_stable(c)
+    assert _without_empty_moments(c) == cirq.Circuit.from_ops(cirq.X(a))
+
+
+def test_point_optimizer_optimize_circuit_until_stable_inserting_moments():
+    a, b = cirq.LineQubit.range(2)
+    c = cirq.Circuit.from_ops(cirq.Z(a), cirq.Z(b), cirq.X(a), cirq.X(b))
+
+    SplitZ().optimize_circuit_until_stable(c)
+    assert c == cirq.Circuit([
+        cirq.Moment([cirq.S(a), cirq.S(b)]),
+        cirq.Moment([cirq.S(a), cirq.S(b)]),
+        cirq.Moment([cirq.X(a), cirq.X(b)]),
+    ])
+
+
+def test_point_optimizer_optimize_circuit_until_stable_post_clean_up():
+    x = cirq.NamedQubit('x')
+    y = cirq.NamedQubit('y')
+    c = cirq.Circuit.from_ops(cirq.CZ(x, y), cirq.Y(x), cirq.Z(y))
+
+    ReplaceWithXGates(post_clean_up=lambda operations: [
+        op**-1 for op in operations
+    ]).optimize_circuit_until_stable(c)
+    assert c == cirq.Circuit.from_ops(cirq.X(x), cirq.X(y), cirq.X(x),
+                                      cirq.X(y))
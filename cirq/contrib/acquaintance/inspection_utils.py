@@ -62,7 +62,7 @@ def get_acquaintance_dag(strategy: 'cirq.Circuit',
                         for op in moment.operations
                         if isinstance(op, AcquaintanceOperation))
     return circuits.CircuitDag.from_ops(
-            acquaintance_ops, device=strategy.device)
+            acquaintance_ops, device=strategy.device, maximalist=False)
 
 
 def get_logical_acquaintance_opportunities(strategy: 'cirq.Circuit',
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import TYPE_CHECKING
+from typing import Iterable, TYPE_CHECKING
 
 import abc
 
@@ -82,6 +82,34 @@ class Device(metaclass=abc.ABCMeta):
         for moment in circuit:
             self.validate_moment(moment)
 
+    def validate_moments_in_circuit(self, circuit: 'cirq.Circuit',
+                                    moment_indices: Iterable[int]) -> None:
+        """Raises an exception if edited moments make a circuit invalid.
+
+        This is an incremental version of `validate_circuit`, used by circuits
+        after some of their moments were added or replaced. The circuit is
+        assumed to have been valid before the edit, so only the moments at the
+        given indices need to be checked, in the context of their neighbors
+        and of the rest of the circuit.
+
+        By default the given moments are validated with `validate_moment`
+        when the device doesn't override `validate_circuit`. Otherwise the
+        whole circuit is validated. Devices with circuit-level constraints
+        can override this method to avoid revalidating the whole circuit.
+
+        Args:
+            circuit: The edited circuit.
+            moment_indices: The indices of the added or replaced moments.
+
+        Raises:
+            ValueError: The circuit isn't valid for this device.
+        """
+        if type(self).validate_circuit is Device.validate_circuit:
+            for i in moment_indices:
+                self.validate_moment(circuit[i])
+        else:
+            self.validate_circuit(circuit)
+
     def validate_moment(self, moment: 'cirq.Moment') -> None:
         """Raises an exception if a moment is not valid.
 
@@ -0,0 +1,64 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+import cirq
+
+
+class _RecordingDevice(cirq.Device):
+
+    def __init__(self):
+        self.validated = []
+
+    def duration_of(self, operation):
+        return cirq.Duration()
+
+    def validate_operation(self, operation):
+        self.validated.append(operation)
+        if operation.qubits == (cirq.LineQubit(-1),):
+            raise ValueError('Bad qubit')
+
+    def validate_scheduled_operation(self, schedule, scheduled_operation):
+        pass
+
+    def validate_schedule(self, schedule):
+        pass
+
+
+class _CircuitCheckingDevice(_RecordingDevice):
+
+    def validate_circuit(self, circuit):
+        self.validated.append(len(circuit))
+
+
+def test_validate_moments_in_circuit_checks_given_moments():
+    a, b = cirq.LineQubit.range(2)
+    d = _RecordingDevice()
+    circuit = cirq.Circuit.from_ops(cirq.X(a), cirq.Y(a), cirq.Z(b))
+    d.validate_moments_in_circuit(circuit, [1])
+    assert d.validated == [cirq.Y(a)]
+
+    circuit[0] = cirq.Moment([cirq.X(cirq.LineQubit(-1))])
+    d.validate_moments_in_circuit(circuit, [1])
+    with pytest.raises(ValueError, match='Bad qubit'):
+        d.validate_moments_in_circuit(circuit, [0])
+
+
+def test_validate_moments_in_circuit_falls_back_to_validate_circuit():
+    d = _CircuitCheckingDevice()
+    circuit = cirq.Circuit.from_ops(cirq.X(cirq.LineQubit(0)),
+                                    cirq.Y(cirq.LineQubit(0)))
+    d.validate_moments_in_circuit(circuit, [1])
+    assert d.validated == [2]
@@ -32,6 +32,9 @@ class _UnconstrainedDevice(device.Device):
     def validate_circuit(self, circuit):
         pass
 
+    def validate_moments_in_circuit(self, circuit, moment_indices):
+        pass
+
     def validate_schedule(self, schedule):
         pass
 
@@ -77,3 +77,6 @@ from cirq.google.serializable_gate_set import (
 
 from cirq.google.xmon_device import (
     XmonDevice,)
+
+from cirq.google.xmon_templates import (
+    XMON_TEMPLATES,)
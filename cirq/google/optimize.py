@@ -13,7 +13,7 @@
 # limitations under the License.
 
 """A combination of several optimizations targeting XmonDevice."""
-from typing import Callable, cast, List, Optional, TYPE_CHECKING
+from typing import Callable, cast, Optional, TYPE_CHECKING
 
 from cirq import circuits, devices, ops, optimizers
 from cirq.google import convert_to_xmon_gates, xmon_device
@@ -28,25 +28,23 @@ def _merge_rots(c: 'cirq.Circuit'):
     return optimizers.merge_single_qubit_gates_into_phased_x_z(c, _TOLERANCE)
 
 
-_OPTIMIZERS: List[Callable[['cirq.Circuit'], None]] = [
-    convert_to_xmon_gates.ConvertToXmonGates().optimize_circuit,
-    optimizers.MergeInteractions(tolerance=_TOLERANCE,
-                                 allow_partial_czs=False).optimize_circuit,
+_OPTIMIZERS = optimizers.PassManager([
+    convert_to_xmon_gates.ConvertToXmonGates(),
+    optimizers.MergeInteractions(tolerance=_TOLERANCE, allow_partial_czs=False),
     _merge_rots,
-    optimizers.EjectPhasedPaulis(tolerance=_TOLERANCE).optimize_circuit,
-    optimizers.EjectZ(tolerance=_TOLERANCE).optimize_circuit,
-    optimizers.DropNegligible(tolerance=_TOLERANCE).optimize_circuit,
-]
+    optimizers.EjectPhasedPaulis(tolerance=_TOLERANCE),
+    optimizers.EjectZ(tolerance=_TOLERANCE),
+    optimizers.DropNegligible(tolerance=_TOLERANCE),
+])
 
-_OPTIMIZERS_PART_CZ: List[Callable[['cirq.Circuit'], None]] = [
-    convert_to_xmon_gates.ConvertToXmonGates().optimize_circuit,
-    optimizers.MergeInteractions(tolerance=_TOLERANCE,
-                                 allow_partial_czs=True).optimize_circuit,
+_OPTIMIZERS_PART_CZ = optimizers.PassManager([
+    convert_to_xmon_gates.ConvertToXmonGates(),
+    optimizers.MergeInteractions(tolerance=_TOLERANCE, allow_partial_czs=True),
     _merge_rots,
-    optimizers.EjectPhasedPaulis(tolerance=_TOLERANCE).optimize_circuit,
-    optimizers.EjectZ(tolerance=_TOLERANCE).optimize_circuit,
-    optimizers.DropNegligible(tolerance=_TOLERANCE).optimize_circuit,
-]
+    optimizers.EjectPhasedPaulis(tolerance=_TOLERANCE),
+    optimizers.EjectZ(tolerance=_TOLERANCE),
+    optimizers.DropNegligible(tolerance=_TOLERANCE),
+])
 
 
 def optimized_for_xmon(
@@ -77,8 +75,7 @@ def optimized_for_xmon(
     """
     copy = circuit.copy()
     opts = _OPTIMIZERS_PART_CZ if allow_partial_czs else _OPTIMIZERS
-    for optimizer in opts:
-        optimizer(copy)
+    opts.optimize_circuit(copy)
 
     return circuits.Circuit.from_ops(
         (op.transform_qubits(qubit_map) for op in copy.all_operations()),
@@ -145,6 +145,27 @@ class XmonDevice(devices.Device):
         super().validate_circuit(circuit)
         _verify_unique_measurement_keys(circuit.all_operations())
 
+    def validate_moments_in_circuit(self, circuit: 'cirq.Circuit',
+                                    moment_indices: Iterable[int]):
+        if type(self).validate_circuit is not XmonDevice.validate_circuit:
+            # Only the subclass knows how to check its own constraints.
+            self.validate_circuit(circuit)
+            return
+        edited = sorted(set(moment_indices))
+        for i in edited:
+            self.validate_moment(circuit[i])
+        new_operations = [op for i in edited for op in circuit[i].operations]
+        # Keys can only collide if the edit added measurements. The circuit
+        # was valid before the edit, so the keys of the other moments are
+        # already unique.
+        if any(protocols.is_measurement(op) for op in new_operations):
+            edited_set = set(edited)
+            _verify_unique_measurement_keys(
+                new_operations,
+                seen=_measurement_keys(
+                    op for i, moment in enumerate(circuit)
+                    if i not in edited_set for op in moment.operations))
+
     def validate_moment(self, moment: 'cirq.Moment'):
         super().validate_moment(moment)
         for op in moment.operations:
@@ -218,8 +239,17 @@ class XmonDevice(devices.Device):
                 self.qubits)
 
 
-def _verify_unique_measurement_keys(operations: Iterable['cirq.Operation']):
-    seen: Set[str] = set()
+def _measurement_keys(operations: Iterable['cirq.Operation']) -> Set[str]:
+    return {
+        protocols.measurement_key(op)
+        for op in operations
+        if protocols.is_measurement(op)
+    }
+
+
+def _verify_unique_measurement_keys(operations: Iterable['cirq.Operation'],
+                                    seen: Optional[Set[str]] = None):
+    seen = set() if seen is None else seen
     for op in operations:
         if protocols.is_measurement(op):
             key = protocols.measurement_key(op)
@@ -238,6 +238,64 @@ def test_validate_circuit_repeat_measurement_keys():
         d.validate_circuit(circuit)
 
 
+def test_validate_moments_in_circuit():
+    d = square_device(3, 3)
+    q00 = cirq.GridQubit(0, 0)
+    q01 = cirq.GridQubit(0, 1)
+    q10 = cirq.GridQubit(1, 0)
+    q11 = cirq.GridQubit(1, 1)
+    circuit = cirq.Circuit([
+        cirq.Moment([cirq.measure(q00, key='a')]),
+        cirq.Moment([cirq.CZ(q00, q01)]),
+        cirq.Moment(),
+    ])
+    d.validate_moments_in_circuit(circuit, [0, 1, 2])
+
+    circuit[2] = cirq.Moment([cirq.CZ(q00, q01), cirq.CZ(q10, q11)])
+    with pytest.raises(ValueError, match='Adjacent Exp11'):
+        d.validate_moments_in_circuit(circuit, [2])
+
+    circuit[2] = cirq.Moment([cirq.measure(q11, key='a')])
+    d.validate_moments_in_circuit(circuit, [1])
+    with pytest.raises(ValueError, match='Measurement key a repeated'):
+        d.validate_moments_in_circuit(circuit, [2])
+
+    circuit[1] = cirq.Moment(
+        [cirq.measure(q10, key='b'),
+         cirq.measure(q01, key='b')])
+    with pytest.raises(ValueError, match='Measurement key b repeated'):
+        d.validate_moments_in_circuit(circuit, [1])
+
+
+def test_validate_moments_in_circuit_uses_subclass_validate_circuit():
+
+    class NoMeasurementsDevice(cg.XmonDevice):
+
+        def validate_circuit(self, circuit):
+            super().validate_circuit(circuit)
+            if any(cirq.is_measurement(op) for op in circuit.all_operations()):
+                raise ValueError('No measurements.')
+
+    d = NoMeasurementsDevice(measurement_duration=cirq.Duration(nanos=1),
+                             exp_w_duration=cirq.Duration(nanos=2),
+                             exp_11_duration=cirq.Duration(nanos=3),
+                             qubits=[cirq.GridQubit(0, 0)])
+    circuit = cirq.Circuit([cirq.Moment([cirq.measure(cirq.GridQubit(0, 0))])])
+    with pytest.raises(ValueError, match='No measurements'):
+        d.validate_moments_in_circuit(circuit, [])
+
+
+def test_insert_validates_operations_before_placing_them():
+    d = square_device(2, 2)
+    circuit = cirq.Circuit(device=d)
+    circuit.append(cirq.CZ(cirq.GridQubit(0, 0), cirq.GridQubit(0, 1)))
+    with pytest.raises(ValueError, match='Unsupported qubit type'):
+        circuit.insert(0, cirq.CZ(cirq.NamedQubit('a'), cirq.NamedQubit('b')))
+    with pytest.raises(ValueError, match='Unsupported qubit type'):
+        circuit.insert_into_range(
+            [cirq.CZ(cirq.NamedQubit('a'), cirq.NamedQubit('b'))], 0, 1)
+
+
 def test_validate_schedule_repeat_measurement_keys():
     d = square_device(3, 3)
 
@@ -0,0 +1,47 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Rewrite templates for circuits made of xmon gates."""
+
+from cirq import devices, ops, optimizers
+
+_a, _b = devices.LineQubit.range(2)
+
+# Identities that shorten circuits of xmon gates, for `cirq.TemplateOptimizer`.
+# The replacements only use xmon gates.
+XMON_TEMPLATES = (
+    optimizers.RewriteTemplate([ops.CZ(_a, _b), ops.CZ(_a, _b)], [],
+                               name='CZ CZ = I'),
+    optimizers.RewriteTemplate([ops.CZ(_a, _b), ops.CZ(_b, _a)], [],
+                               name='CZ CZ = I (swapped qubits)'),
+    optimizers.RewriteTemplate([ops.X(_a), ops.X(_a)], [], name='X X = I'),
+    optimizers.RewriteTemplate([ops.Y(_a), ops.Y(_a)], [], name='Y Y = I'),
+    optimizers.RewriteTemplate([ops.Z(_a), ops.Z(_a)], [], name='Z Z = I'),
+    optimizers.RewriteTemplate([ops.S(_a), ops.S(_a)], [ops.Z(_a)],
+                               name='S S = Z'),
+    optimizers.RewriteTemplate([ops.T(_a), ops.T(_a)], [ops.S(_a)],
+                               name='T T = S'),
+    optimizers.RewriteTemplate([ops.Z(_a), ops.X(_a), ops.Z(_a)], [ops.X(_a)],
+                               name='Z X Z = X'),
+    optimizers.RewriteTemplate([ops.X(_a), ops.Z(_a), ops.X(_a)], [ops.Z(_a)],
+                               name='X Z X = Z'),
+    optimizers.RewriteTemplate(
+        [ops.X(_a), ops.CZ(_a, _b), ops.X(_a)],
+        [ops.CZ(_a, _b), ops.Z(_b)],
+        name='X CZ X = CZ Z on the other qubit'),
+    optimizers.RewriteTemplate(
+        [ops.Y(_a), ops.CZ(_a, _b), ops.Y(_a)],
+        [ops.CZ(_a, _b), ops.Z(_b)],
+        name='Y CZ Y = CZ Z on the other qubit'),
+)
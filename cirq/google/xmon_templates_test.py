@@ -0,0 +1,40 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+import cirq
+
+
+@pytest.mark.parametrize('template', cirq.google.XMON_TEMPLATES)
+def test_xmon_template_is_valid(template):
+    qubits = sorted({q for op in template.pattern for q in op.qubits})
+    cirq.testing.assert_allclose_up_to_global_phase(
+        cirq.Circuit.from_ops(template.replacement).unitary(qubit_order=qubits),
+        cirq.Circuit.from_ops(template.pattern).unitary(qubit_order=qubits),
+        atol=1e-8)
+    assert len(template.replacement) < len(template.pattern)
+    assert all(cirq.google.is_native_xmon_op(op) for op in template.pattern)
+    assert all(
+        cirq.google.is_native_xmon_op(op) for op in template.replacement)
+
+
+def test_optimize_with_xmon_templates():
+    a, b = cirq.GridQubit(0, 0), cirq.GridQubit(0, 1)
+    circuit = cirq.Circuit.from_ops(cirq.CZ(a, b), cirq.CZ(b, a), cirq.T(a),
+                                    cirq.T(a), cirq.Y(b))
+    cirq.TemplateOptimizer(
+        cirq.google.XMON_TEMPLATES).optimize_circuit(circuit)
+    cirq.DropEmptyMoments().optimize_circuit(circuit)
+    assert circuit == cirq.Circuit.from_ops(cirq.Y(b), cirq.S(a))
@@ -27,6 +27,9 @@ from cirq.ion.ion_device import (
 from cirq.ion.convert_to_ion_gates import (
     ConvertToIonGates,)
 
+from cirq.ion.ion_templates import (
+    ION_TEMPLATES,)
+
 from cirq.ion.ion_decomposition import (
     two_qubit_matrix_to_ion_operations,)
 
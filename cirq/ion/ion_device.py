@@ -120,6 +120,27 @@ class IonDevice(devices.Device):
         super().validate_circuit(circuit)
         _verify_unique_measurement_keys(circuit.all_operations())
 
+    def validate_moments_in_circuit(self, circuit: circuits.Circuit,
+                                    moment_indices: Iterable[int]):
+        if type(self).validate_circuit is not IonDevice.validate_circuit:
+            # Only the subclass knows how to check its own constraints.
+            self.validate_circuit(circuit)
+            return
+        edited = sorted(set(moment_indices))
+        for i in edited:
+            self.validate_moment(circuit[i])
+        new_operations = [op for i in edited for op in circuit[i].operations]
+        # Keys can only collide if the edit added measurements. The circuit
+        # was valid before the edit, so the keys of the other moments are
+        # already unique.
+        if any(protocols.is_measurement(op) for op in new_operations):
+            edited_set = set(edited)
+            _verify_unique_measurement_keys(
+                new_operations,
+                seen=_measurement_keys(
+                    op for i, moment in enumerate(circuit)
+                    if i not in edited_set for op in moment.operations))
+
     def can_add_operation_into_moment(self,
                                       operation: ops.Operation,
                                       moment: ops.Moment) -> bool:
@@ -181,8 +202,18 @@ class IonDevice(devices.Device):
                 self.qubits)
 
 
-def _verify_unique_measurement_keys(operations: Iterable[ops.Operation]):
-    seen: Set[str] = set()
+def _measurement_keys(operations: Iterable[ops.Operation]) -> Set[str]:
+    keys = set()  # type: Set[str]
+    for op in operations:
+        meas = ops.op_gate_of_type(op, ops.MeasurementGate)
+        if meas:
+            keys.add(protocols.measurement_key(meas))
+    return keys
+
+
+def _verify_unique_measurement_keys(operations: Iterable[ops.Operation],
+                                    seen: Optional[Set[str]] = None):
+    seen = set() if seen is None else seen
     for op in operations:
         meas = ops.op_gate_of_type(op, ops.MeasurementGate)
         if meas:
@@ -215,6 +215,43 @@ def test_validate_circuit_repeat_measurement_keys():
         d.validate_circuit(circuit)
 
 
+def test_validate_moments_in_circuit():
+    d = ion_device(3)
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit([
+        cirq.Moment([cirq.measure(q0, key='a')]),
+        cirq.Moment([cirq.X(q1)]),
+    ])
+    d.validate_moments_in_circuit(circuit, [0, 1])
+
+    circuit[1] = cirq.Moment([cirq.measure(q2, key='a')])
+    d.validate_moments_in_circuit(circuit, [])
+    with pytest.raises(ValueError, match='Measurement key a repeated'):
+        d.validate_moments_in_circuit(circuit, [1])
+
+    circuit[1] = cirq.Moment([cirq.X(cirq.LineQubit(5))])
+    with pytest.raises(ValueError, match='Qubit not on device'):
+        d.validate_moments_in_circuit(circuit, [1])
+
+
+def test_validate_moments_in_circuit_uses_subclass_validate_circuit():
+
+    class NoMeasurementsDevice(cirq.IonDevice):
+
+        def validate_circuit(self, circuit):
+            super().validate_circuit(circuit)
+            if any(cirq.is_measurement(op) for op in circuit.all_operations()):
+                raise ValueError('No measurements.')
+
+    d = NoMeasurementsDevice(measurement_duration=cirq.Duration(nanos=1),
+                             twoq_gates_duration=cirq.Duration(nanos=2),
+                             oneq_gates_duration=cirq.Duration(nanos=3),
+                             qubits=cirq.LineQubit.range(1))
+    circuit = cirq.Circuit([cirq.Moment([cirq.measure(cirq.LineQubit(0))])])
+    with pytest.raises(ValueError, match='No measurements'):
+        d.validate_moments_in_circuit(circuit, [])
+
+
 def test_validate_schedule_repeat_measurement_keys():
     d = ion_device(3)
 
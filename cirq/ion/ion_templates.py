@@ -0,0 +1,44 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Rewrite templates for circuits made of ion trap gates."""
+
+import numpy as np
+
+from cirq import devices, ops, optimizers
+from cirq.ion import MS
+
+_a, _b = devices.LineQubit.range(2)
+_ms = MS(np.pi / 4)(_a, _b)
+_ms_dag = MS(-np.pi / 4)(_a, _b)
+_ms_full = MS(np.pi / 2)(_a, _b)
+
+# Identities that shorten circuits of ion trap gates, for
+# `cirq.TemplateOptimizer`. The replacements only use ion trap gates.
+ION_TEMPLATES = (
+    optimizers.RewriteTemplate([_ms, _ms], [_ms_full], name='MS MS = MS(pi/2)'),
+    optimizers.RewriteTemplate([_ms, _ms_dag], [], name='MS MS^-1 = I'),
+    optimizers.RewriteTemplate([_ms_dag, _ms], [], name='MS^-1 MS = I'),
+    optimizers.RewriteTemplate([_ms_full, _ms_full], [],
+                               name='MS(pi/2) MS(pi/2) = I'),
+    optimizers.RewriteTemplate([ops.X(_a), _ms, ops.X(_a)], [_ms],
+                               name='X MS X = MS'),
+    optimizers.RewriteTemplate([ops.Y(_a), _ms, ops.Y(_a)], [_ms_dag],
+                               name='Y MS Y = MS^-1'),
+    optimizers.RewriteTemplate([ops.Z(_a), _ms, ops.Z(_a)], [_ms_dag],
+                               name='Z MS Z = MS^-1'),
+    optimizers.RewriteTemplate([ops.X(_a), ops.X(_a)], [], name='X X = I'),
+    optimizers.RewriteTemplate([ops.Y(_a), ops.Y(_a)], [], name='Y Y = I'),
+    optimizers.RewriteTemplate([ops.Z(_a), ops.Z(_a)], [], name='Z Z = I'),
+)
@@ -0,0 +1,43 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+import cirq
+from cirq.ion.convert_to_ion_gates import is_native_ion_gate
+
+
+@pytest.mark.parametrize('template', cirq.ion.ION_TEMPLATES)
+def test_ion_template_is_valid(template):
+    qubits = sorted({q for op in template.pattern for q in op.qubits})
+    cirq.testing.assert_allclose_up_to_global_phase(
+        cirq.Circuit.from_ops(template.replacement).unitary(qubit_order=qubits),
+        cirq.Circuit.from_ops(template.pattern).unitary(qubit_order=qubits),
+        atol=1e-8)
+    assert len(template.replacement) < len(template.pattern)
+    assert all(is_native_ion_gate(op.gate) for op in template.pattern)
+    assert all(is_native_ion_gate(op.gate) for op in template.replacement)
+
+
+def test_optimize_with_ion_templates():
+    a, b = cirq.LineQubit.range(2)
+    ms = cirq.ion.MS(np.pi / 4)
+    circuit = cirq.Circuit.from_ops(cirq.Z(a), ms(a, b), cirq.Z(a), ms(a, b))
+    # The first rewrite puts MS^-1 next to the last MS, and the second
+    # cancels them.
+    cirq.TemplateOptimizer(
+        cirq.ion.ION_TEMPLATES).optimize_circuit_until_stable(circuit)
+    cirq.DropEmptyMoments().optimize_circuit(circuit)
+    assert circuit == cirq.Circuit()
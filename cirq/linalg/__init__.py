@@ -32,7 +32,9 @@ from cirq.linalg.decompositions import (
     deconstruct_single_qubit_matrix_into_angles,
     kak_canonicalize_vector,
     kak_decomposition,
+    kak_decomposition_batch,
     KakDecomposition,
+    KakDecompositionBatch,
     kron_factor_4x4_to_2x2s,
     map_eigenvalues,
     so4_to_magic_su2s,
@@ -52,10 +54,12 @@ from cirq.linalg.diagonalize import (
 
 from cirq.linalg.operator_spaces import (
     expand_matrix_in_orthogonal_basis,
+    expand_matrix_in_pauli_basis,
     hilbert_schmidt_inner_product,
     kron_bases,
     matrix_from_basis_coefficients,
     PAULI_BASIS,
+    pauli_basis_coefficients,
     pow_pauli_combination,
 )
 
@@ -693,3 +693,325 @@ def kak_decomposition(
         global_phase=g * inner_cannon.global_phase,
         single_qubit_operations_before=(b1, b0),
         single_qubit_operations_after=(a1, a0))
+
+
+class KakDecompositionBatch:
+    """The KAK decompositions of a stack of two-qubit operations.
+
+    Stores the same values as a `cirq.KakDecomposition` for each of N
+    operations, as arrays whose first axis indexes the operations.
+
+    Attributes:
+        global_phases: An array of shape (N,) of the global phases g.
+        single_qubit_operations_before: An array of shape (N, 2, 2, 2). Entry
+            [k, 0] and [k, 1] hold the first and second element of the k'th
+            decomposition's single_qubit_operations_before.
+        interaction_coefficients: An array of shape (N, 3) of the x, y, z
+            interaction coefficients.
+        single_qubit_operations_after: An array of shape (N, 2, 2, 2),
+            arranged like single_qubit_operations_before.
+    """
+
+    def __init__(self, *, global_phases: np.ndarray,
+                 single_qubit_operations_before: np.ndarray,
+                 interaction_coefficients: np.ndarray,
+                 single_qubit_operations_after: np.ndarray) -> None:
+        self.global_phases = global_phases
+        self.single_qubit_operations_before = single_qubit_operations_before
+        self.interaction_coefficients = interaction_coefficients
+        self.single_qubit_operations_after = single_qubit_operations_after
+
+    def __len__(self):
+        return len(self.global_phases)
+
+    def __getitem__(self, index: int) -> KakDecomposition:
+        before = self.single_qubit_operations_before[index]
+        after = self.single_qubit_operations_after[index]
+        x, y, z = self.interaction_coefficients[index]
+        return KakDecomposition(
+            global_phase=complex(self.global_phases[index]),
+            single_qubit_operations_before=(before[0], before[1]),
+            interaction_coefficients=(float(x), float(y), float(z)),
+            single_qubit_operations_after=(after[0], after[1]))
+
+    def unitaries(self) -> np.ndarray:
+        """Returns the (N, 4, 4) stack of the decomposed unitary matrices.
+
+        U = g · (a1 ⊗ a0) · exp(i·(x·XX + y·YY + z·ZZ)) · (b1 ⊗ b0)
+        """
+        before = _batch_kron(self.single_qubit_operations_before[:, 0],
+                             self.single_qubit_operations_before[:, 1])
+        after = _batch_kron(self.single_qubit_operations_after[:, 0],
+                            self.single_qubit_operations_after[:, 1])
+        # XX, YY and ZZ are diagonal in the magic basis, where the interaction
+        # multiplies the basis vectors by these phases.
+        angles = np.dot(self.interaction_coefficients, _MAGIC_INTERACTION_SIGNS)
+        interaction = np.matmul(MAGIC * np.exp(1j * angles)[:, None, :],
+                                MAGIC_CONJ_T)
+        return self.global_phases[:, None, None] * np.matmul(
+            np.matmul(after, interaction), before)
+
+    def __repr__(self):
+        return ('cirq.KakDecompositionBatch('
+                'global_phases={}, '
+                'single_qubit_operations_before={}, '
+                'interaction_coefficients={}, '
+                'single_qubit_operations_after={})').format(
+                    proper_repr(self.global_phases),
+                    proper_repr(self.single_qubit_operations_before),
+                    proper_repr(self.interaction_coefficients),
+                    proper_repr(self.single_qubit_operations_after))
+
+
+# Row k holds the eigenvalues of XX, YY and ZZ (k = 0, 1, 2) on the magic basis
+# vectors, i.e. the columns of MAGIC.
+_MAGIC_INTERACTION_SIGNS = np.array([[1, 1, -1, -1], [-1, 1, -1, 1],
+                                     [1, -1, -1, 1]])
+
+_KAK_GAMMA = np.array([[1, 1, 1, 1], [1, 1, -1, -1], [-1, 1, -1, 1],
+                       [1, -1, -1, 1]]) * 0.25
+
+# Flip the X, Y, and Z axes respectively. See `kak_canonicalize_vector`.
+_KAK_FLIPPERS = [
+    np.array([[0, 1], [1, 0]]) * 1j,
+    np.array([[0, -1j], [1j, 0]]) * 1j,
+    np.array([[1, 0], [0, -1]]) * 1j
+]
+
+# Swap the roles of the two axes other than the index's axis.
+_KAK_SWAPPERS = [
+    np.array([[1, -1j], [1j, -1]]) * 1j * np.sqrt(0.5),
+    np.array([[1, 1], [1, -1]]) * 1j * np.sqrt(0.5),
+    np.array([[0, 1 - 1j], [1 + 1j, 0]]) * 1j * np.sqrt(0.5)
+]
+
+# An arbitrary irrational weight, used to combine the real and imaginary parts
+# of a symmetric unitary into a single real symmetric matrix with the same
+# eigenvectors.
+_EIGENVECTOR_MIXING_WEIGHT = 0.5772156649015329
+
+
+def kak_decomposition_batch(mats: np.ndarray,
+                            rtol: float = 1e-5,
+                            atol: float = 1e-8) -> KakDecompositionBatch:
+    """Decomposes a stack of 2-qubit unitaries into 1-qubit ops and XX/YY/ZZ
+    interactions.
+
+    Does the same as calling `cirq.kak_decomposition` on each matrix, but
+    performs the work for all matrices together with a fixed number of numpy
+    calls on stacked arrays. Matrices whose eigenvectors can't be determined
+    reliably that way (e.g. because of nearly degenerate eigenvalues) are
+    decomposed one at a time with `cirq.kak_decomposition` instead.
+
+    The decompositions are canonicalized like those of `cirq.kak_decomposition`
+    but, where the factors of a decomposition aren't unique, may pick
+    different single-qubit operations.
+
+    Args:
+        mats: An array of shape (N, 4, 4) holding the unitary matrices to
+            decompose.
+        rtol: Per-matrix-entry relative tolerance on equality.
+        atol: Per-matrix-entry absolute tolerance on equality.
+
+    Returns:
+        The decompositions of the matrices.
+
+    Raises:
+        ValueError: Bad matrix shape.
+        ArithmeticError: Failed to perform a decomposition.
+    """
+    mats = np.asarray(mats, dtype=np.complex128)
+    if mats.ndim != 3 or mats.shape[1:] != (4, 4):
+        raise ValueError('mats must have shape (N, 4, 4), not {}.'.format(
+            mats.shape))
+
+    left, d, right, ok = _bidiagonalize_unitaries_with_special_orthogonals(
+        np.matmul(np.matmul(MAGIC_CONJ_T, mats), MAGIC),
+        rtol=rtol,
+        atol=atol)
+
+    a1, a0 = _so4s_to_magic_su2s(np.swapaxes(left, 1, 2))
+    b1, b0 = _so4s_to_magic_su2s(np.swapaxes(right, 1, 2))
+    w, x, y, z = np.dot(_KAK_GAMMA, np.angle(d).T)
+    g = np.exp(1j * w)
+
+    (phase, coefficients, inner_before,
+     inner_after) = _kak_canonicalize_vectors(np.stack([x, y, z], axis=1))
+
+    result = KakDecompositionBatch(
+        global_phases=g * phase,
+        single_qubit_operations_before=np.stack([
+            np.matmul(inner_before[0], b1),
+            np.matmul(inner_before[1], b0)
+        ],
+                                                axis=1),
+        interaction_coefficients=coefficients,
+        single_qubit_operations_after=np.stack(
+            [np.matmul(a1, inner_after[0]),
+             np.matmul(a0, inner_after[1])],
+            axis=1))
+
+    for k in np.flatnonzero(~ok):
+        kak = kak_decomposition(mats[k], rtol=rtol, atol=atol)
+        result.global_phases[k] = kak.global_phase
+        result.single_qubit_operations_before[k] = (
+            kak.single_qubit_operations_before)
+        result.interaction_coefficients[k] = kak.interaction_coefficients
+        result.single_qubit_operations_after[k] = (
+            kak.single_qubit_operations_after)
+    return result
+
+
+def _batch_kron(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Kronecker products of two (N, 2, 2) stacks of matrices."""
+    return np.einsum('nij,nkl->nikjl', a, b).reshape(-1, 4, 4)
+
+
+def _bidiagonalize_unitaries_with_special_orthogonals(
+        mats: np.ndarray, *, rtol: float, atol: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Batched `cirq.bidiagonalize_unitary_with_special_orthogonals`.
+
+    Returns:
+        A tuple (L, d, R, ok) of stacks such that L[k] @ mats[k] @ R[k] =
+        diag(d[k]) with L[k] and R[k] in SO(4), for each k where ok[k] is set.
+        Where ok[k] isn't set, the results are unreliable.
+    """
+    # mat = L.T @ diag(d) @ R.T implies mat.T @ mat = R @ diag(d**2) @ R.T.
+    # The real and imaginary parts of this symmetric unitary matrix are
+    # commuting real symmetric matrices, so a generic real combination of them
+    # has the same eigenvectors.
+    sym = np.matmul(np.swapaxes(mats, 1, 2), mats)
+    _, right = np.linalg.eigh(
+        np.real(sym) + _EIGENVECTOR_MIXING_WEIGHT * np.imag(sym))
+    right[np.linalg.det(right) < 0, :, 0] *= -1
+
+    d2 = np.einsum('nji,njk,nki->ni', right, sym, right)
+    d = np.sqrt(d2)
+    left_t = np.matmul(mats, right) / d[:, None, :]
+    flip = np.real(np.linalg.det(left_t)) < 0
+    d[flip, 0] *= -1
+    left_t[flip, :, 0] *= -1
+    left = np.real(np.swapaxes(left_t, 1, 2))
+
+    # Check that the factors are orthogonal and actually diagonalize.
+    diag = np.matmul(np.matmul(left, mats), right)
+    ok = (np.all(np.isclose(left_t.imag, 0, rtol=rtol, atol=atol),
+                 axis=(1, 2)) &
+          np.all(np.isclose(np.matmul(left, np.swapaxes(left, 1, 2)),
+                            np.eye(4),
+                            rtol=rtol,
+                            atol=atol),
+                 axis=(1, 2)) &
+          np.all(np.isclose(diag, d[:, :, None] * np.eye(4), rtol=rtol,
+                            atol=atol),
+                 axis=(1, 2)))
+    return left, d, right, ok
+
+
+def _so4s_to_magic_su2s(mats: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Batched `cirq.so4_to_magic_su2s`, without the precondition check."""
+    ab = np.matmul(np.matmul(MAGIC, mats), MAGIC_CONJ_T)
+    n = ab.shape[0]
+    rows = np.arange(n)
+
+    # Rearrange so that entry [2i+j, 2k+l] is A[i, j] * B[k, l]. Then a column
+    # is a multiple of A and a row a multiple of B. Use the ones through the
+    # entry with the largest magnitude.
+    outer = ab.reshape(n, 2, 2, 2, 2).transpose(0, 1, 3, 2, 4).reshape(n, 4, 4)
+    ref = np.argmax(np.abs(outer).reshape(n, 16), axis=1)
+    r, c = ref // 4, ref % 4
+    a = outer[rows, :, c].reshape(n, 2, 2)
+    b = outer[rows, r, :].reshape(n, 2, 2)
+
+    # Rescale factors to have unit determinants.
+    det_a = np.sqrt(np.linalg.det(a))
+    det_b = np.sqrt(np.linalg.det(b))
+    a /= np.where(det_a == 0, 1, det_a)[:, None, None]
+    b /= np.where(det_b == 0, 1, det_b)[:, None, None]
+
+    # Make the remaining global factor positive.
+    g = outer[rows, r, c] / (a.reshape(n, 4)[rows, r] *
+                             b.reshape(n, 4)[rows, c])
+    a[np.real(g) < 0] *= -1
+    return a, b
+
+
+def _kak_canonicalize_vectors(
+        vectors: np.ndarray, atol: float = 1e-9
+) -> Tuple[np.ndarray, np.ndarray, List[np.ndarray], List[np.ndarray]]:
+    """Batched `cirq.kak_canonicalize_vector`.
+
+    Returns:
+        A tuple (phases, coefficients, before, after) where, for the k'th
+        vector, phases[k], coefficients[k], (before[0][k], before[1][k]) and
+        (after[0][k], after[1][k]) are the global phase, interaction
+        coefficients, single_qubit_operations_before and
+        single_qubit_operations_after of its canonicalized decomposition.
+    """
+    n = vectors.shape[0]
+    v = np.array(vectors, dtype=np.float64)
+    phase = np.ones(n, dtype=np.complex128)
+    identities = np.tile(np.eye(2, dtype=np.complex128), (n, 1, 1))
+    left = [identities.copy() for _ in range(2)]
+    right = [identities.copy() for _ in range(2)]
+    flipper_powers = [
+        np.array([np.linalg.matrix_power(f, p) for p in range(4)])
+        for f in _KAK_FLIPPERS
+    ]
+
+    def where(mask, new, old):
+        return np.where(mask[:, None, None], new, old)
+
+    # Shifting strength by ½π is equivalent to local ops (e.g. exp(i½π XX)∝XX).
+    def shift(k, steps):
+        v[:, k] += steps * np.pi / 2
+        phase[:] *= np.array([1, 1j, -1, -1j])[steps % 4]
+        s = flipper_powers[k][steps % 4]
+        right[0] = np.matmul(s, right[0])
+        right[1] = np.matmul(s, right[1])
+
+    # Two negations is equivalent to temporarily flipping along the other axis.
+    def negate(k1, k2, mask):
+        v[mask, k1] *= -1
+        v[mask, k2] *= -1
+        phase[mask] *= -1
+        s = _KAK_FLIPPERS[3 - k1 - k2]
+        left[1] = where(mask, np.matmul(left[1], s), left[1])
+        right[1] = where(mask, np.matmul(s, right[1]), right[1])
+
+    # Swapping components is equivalent to temporarily swapping the two axes.
+    def swap(k1, k2, mask):
+        v[mask, k1], v[mask, k2] = v[mask, k2], v[mask, k1]
+        s = _KAK_SWAPPERS[3 - k1 - k2]
+        for i in range(2):
+            left[i] = where(mask, np.matmul(left[i], s), left[i])
+            right[i] = where(mask, np.matmul(s, right[i]), right[i])
+
+    # Shifts each axis strength into the range (-π/4, π/4].
+    def canonical_shift(k):
+        shift(k, np.floor((np.pi / 4 - v[:, k]) / (np.pi / 2)).astype(int))
+
+    # Sorts axis strengths into descending order by absolute magnitude.
+    def sort():
+        swap(0, 1, np.abs(v[:, 0]) < np.abs(v[:, 1]))
+        swap(1, 2, np.abs(v[:, 1]) < np.abs(v[:, 2]))
+        swap(0, 1, np.abs(v[:, 0]) < np.abs(v[:, 1]))
+
+    # Get all strengths to (-¼π, ¼π] in descending order by absolute magnitude.
+    canonical_shift(0)
+    canonical_shift(1)
+    canonical_shift(2)
+    sort()
+
+    # Move all negativity into z.
+    negate(0, 2, v[:, 0] < 0)
+    negate(1, 2, v[:, 1] < 0)
+    canonical_shift(2)
+
+    # If x = π/4, force z to be positive
+    mask = (v[:, 0] > np.pi / 4 - atol) & (v[:, 2] < 0)
+    shift(0, -mask.astype(int))
+    negate(0, 2, mask)
+
+    return phase, v, [right[1], right[0]], [left[1], left[0]]
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import random
+from unittest import mock
 
 import numpy as np
 import pytest
@@ -241,6 +242,91 @@ def test_kak_decomposition(target):
     np.testing.assert_allclose(cirq.unitary(kak), target, atol=1e-8)
 
 
+def test_kak_decomposition_batch():
+    targets = np.array([np.eye(4), SWAP, SWAP * 1j, CZ, CNOT,
+                        SWAP.dot(CZ)] +
+                       [cirq.testing.random_unitary(4) for _ in range(20)])
+    kaks = cirq.kak_decomposition_batch(targets)
+
+    assert len(kaks) == len(targets)
+    assert kaks.interaction_coefficients.shape == (len(targets), 3)
+    assert kaks.single_qubit_operations_before.shape == (len(targets), 2, 2, 2)
+    np.testing.assert_allclose(kaks.unitaries(), targets, atol=1e-8)
+    for k, target in enumerate(targets):
+        kak = kaks[k]
+        np.testing.assert_allclose(cirq.unitary(kak), target, atol=1e-8)
+        np.testing.assert_allclose(
+            kak.interaction_coefficients,
+            cirq.kak_decomposition(target).interaction_coefficients,
+            atol=1e-7)
+        for m in (kak.single_qubit_operations_before +
+                  kak.single_qubit_operations_after):
+            assert cirq.is_special_unitary(m)
+        x, y, z = kak.interaction_coefficients
+        assert np.pi / 4 + 1e-8 >= x >= y >= abs(z) - 1e-8
+
+
+S = np.diag([1, 1j])
+DEGENERATE_TARGETS = [
+    np.eye(4),
+    np.eye(4) * 1j,
+    CZ,
+    SWAP,
+    SWAP.dot(CZ),
+    np.kron(H, S),
+    np.kron(S, S),
+    np.kron(X, np.eye(2)),
+    CZ.dot(np.kron(H, H)),
+    np.kron(S, H).dot(SWAP),
+]
+
+
+def test_kak_decomposition_batch_degenerate_spectra():
+    targets = np.array(DEGENERATE_TARGETS)
+    kaks = cirq.kak_decomposition_batch(targets)
+    np.testing.assert_allclose(kaks.unitaries(), targets, atol=1e-8)
+    for k, target in enumerate(targets):
+        np.testing.assert_allclose(
+            kaks[k].interaction_coefficients,
+            cirq.kak_decomposition(target).interaction_coefficients,
+            atol=1e-7)
+
+
+def test_kak_decomposition_batch_falls_back_to_scalar():
+    targets = np.array(DEGENERATE_TARGETS[:4] +
+                       [cirq.testing.random_unitary(4) for _ in range(2)])
+    bidiagonalize = (
+        cirq.linalg.decompositions.
+        _bidiagonalize_unitaries_with_special_orthogonals)
+
+    def failing_bidiagonalize(mats, *, rtol, atol):
+        left, d, right, ok = bidiagonalize(mats, rtol=rtol, atol=atol)
+        ok[::2] = False
+        return left, d, right, ok
+
+    with mock.patch.object(cirq.linalg.decompositions,
+                           '_bidiagonalize_unitaries_with_special_orthogonals',
+                           failing_bidiagonalize):
+        kaks = cirq.kak_decomposition_batch(targets)
+
+    np.testing.assert_allclose(kaks.unitaries(), targets, atol=1e-8)
+    for k in range(0, len(targets), 2):
+        expected = cirq.kak_decomposition(targets[k])
+        assert kaks[k].global_phase == expected.global_phase
+        np.testing.assert_equal(kaks[k].interaction_coefficients,
+                                expected.interaction_coefficients)
+
+
+def test_kak_decomposition_batch_fail():
+    with pytest.raises(ValueError, match='shape'):
+        _ = cirq.kak_decomposition_batch(np.eye(4))
+
+
+def test_kak_decomposition_batch_repr():
+    kaks = cirq.kak_decomposition_batch(np.array([CZ]))
+    assert repr(kaks).startswith('cirq.KakDecompositionBatch(global_phases=')
+
+
 def test_kak_decomposition_eq():
     eq = cirq.testing.EqualsTester()
 
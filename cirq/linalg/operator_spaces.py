@@ -16,6 +16,8 @@
 
 from typing import Dict, Tuple
 
+import itertools
+
 import numpy as np
 
 from cirq import value
@@ -66,6 +68,62 @@ def expand_matrix_in_orthogonal_basis(
     })
 
 
+# Maps the flattened entries of a 2x2 matrix to its coefficients in the Pauli
+# basis: row k holds the conjugated entries of PAULI_BASIS[IXYZ[k]], halved.
+_PAULI_TRANSFORM = np.array([b.conj().reshape(4) for b in PAULI_BASIS.values()
+                            ]) / 2
+
+
+def pauli_basis_coefficients(m: np.ndarray) -> np.ndarray:
+    """Computes the coefficients of an n-qubit matrix in the Pauli basis.
+
+    Instead of taking an inner product with each of the 4**n Pauli products
+    (which takes O(16**n) time), the matrix is viewed as a tensor with one
+    (row, column) index pair per qubit, and each pair is transformed into the
+    Pauli basis in turn. This takes O(n * 4**n) time.
+
+    Args:
+        m: A 2**n by 2**n matrix.
+
+    Returns:
+        An array with n axes of length 4. The entry at index (k1, ..., kn) is
+        the coefficient of the product of the Pauli matrices 'IXYZ'[k1], ...,
+        'IXYZ'[kn] (with the first qubit's matrix leftmost in the Kronecker
+        product, matching `kron_bases`).
+
+    Raises:
+        ValueError: The matrix isn't square, or its size isn't a power of two.
+    """
+    if m.ndim != 2 or m.shape[0] != m.shape[1]:
+        raise ValueError('Not a square matrix: {}'.format(m.shape))
+    n = m.shape[0].bit_length() - 1
+    if m.shape[0] != 1 << n:
+        raise ValueError('Matrix size is not a power of two: {}'.format(
+            m.shape))
+
+    # Group the row and column index of each qubit into a single axis.
+    t = m.reshape((2,) * (2 * n))
+    t = t.transpose([a for k in range(n) for a in (k, n + k)])
+    t = t.reshape((4,) * n)
+    for k in range(n):
+        t = np.moveaxis(np.tensordot(_PAULI_TRANSFORM, t, axes=([1], [k])), 0,
+                        k)
+    return t
+
+
+def expand_matrix_in_pauli_basis(m: np.ndarray) -> value.LinearDict[str]:
+    """Computes the coefficients of an n-qubit matrix in the Pauli basis.
+
+    Equivalent to expanding the matrix in `kron_bases(PAULI_BASIS, repeat=n)`
+    with `expand_matrix_in_orthogonal_basis`, but takes O(n * 4**n) time
+    instead of O(16**n). See `pauli_basis_coefficients`.
+    """
+    coefficients = pauli_basis_coefficients(m)
+    names = (''.join(e)
+             for e in itertools.product('IXYZ', repeat=coefficients.ndim))
+    return value.LinearDict(dict(zip(names, coefficients.flat)))
+
+
 def matrix_from_basis_coefficients(expansion: value.LinearDict[str],
                                    basis: Dict[str, np.ndarray]) -> np.ndarray:
     """Computes linear combination of basis vectors with given coefficients."""
@@ -293,3 +293,35 @@ def test_pow_pauli_combination(coefficients, exponent):
     result = bi * i + bx * x + by * y + bz * z
 
     assert np.allclose(result, expected_result)
+
+
+@pytest.mark.parametrize('num_qubits', [1, 2, 3, 4])
+def test_expand_matrix_in_pauli_basis(num_qubits):
+    m = (np.random.randn(2**num_qubits, 2**num_qubits) +
+         1j * np.random.randn(2**num_qubits, 2**num_qubits))
+    basis = cirq.kron_bases(PAULI_BASIS, repeat=num_qubits)
+    expected = cirq.expand_matrix_in_orthogonal_basis(m, basis)
+    actual = cirq.expand_matrix_in_pauli_basis(m)
+    assert set(actual.keys()) == set(expected.keys())
+    for name in expected:
+        assert np.isclose(actual[name], expected[name])
+    np.testing.assert_allclose(
+        cirq.matrix_from_basis_coefficients(actual, basis), m)
+
+    coefficients = cirq.pauli_basis_coefficients(m)
+    assert coefficients.shape == (4,) * num_qubits
+
+
+def test_pauli_basis_coefficients_ordering():
+    m = np.kron(PAULI_BASIS['X'], PAULI_BASIS['Z'])
+    coefficients = cirq.pauli_basis_coefficients(m)
+    expected = np.zeros((4, 4))
+    expected[1, 3] = 1
+    np.testing.assert_allclose(coefficients, expected, atol=1e-12)
+
+
+def test_pauli_basis_coefficients_invalid_shape():
+    with pytest.raises(ValueError, match='square'):
+        cirq.pauli_basis_coefficients(np.zeros((2, 4)))
+    with pytest.raises(ValueError, match='power of two'):
+        cirq.pauli_basis_coefficients(np.zeros((3, 3)))
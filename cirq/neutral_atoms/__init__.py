@@ -20,3 +20,6 @@ from cirq.neutral_atoms.convert_to_neutral_atom_gates import (
     is_native_neutral_atom_gate,
     is_native_neutral_atom_op
 )
+
+from cirq.neutral_atoms.neutral_atom_templates import (
+    NEUTRAL_ATOM_TEMPLATES,)
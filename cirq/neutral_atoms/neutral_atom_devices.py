@@ -312,6 +312,36 @@ class NeutralAtomDevice(devices.Device):
                 if ops.op_gate_of_type(operation, ops.MeasurementGate):
                     has_measurement_occurred = True
 
+    def validate_moments_in_circuit(self, circuit: circuits.Circuit,
+                                    moment_indices: Iterable[int]):
+        """
+        Raises an error if the given moments of the circuit are invalid on
+        this device, assuming that the rest of the circuit was valid.
+
+        Since measurements must be in the last non-empty moment, only the
+        closest non-empty moments around each given moment are checked.
+
+        Args:
+            circuit: The circuit containing the moments
+            moment_indices: The indices of the moments to validate
+
+        Raises:
+            ValueError: If the moments make the circuit invalid
+        """
+        for i in moment_indices:
+            moment = circuit[i]
+            self.validate_moment(moment)
+            if not moment.operations:
+                continue
+            previous = next((circuit[j]
+                             for j in range(i - 1, -1, -1)
+                             if circuit[j].operations), None)
+            if previous is not None and _has_measurement(previous):
+                raise ValueError("Non-empty moment after measurement")
+            if _has_measurement(moment) and any(
+                    circuit[j].operations for j in range(i + 1, len(circuit))):
+                raise ValueError("Non-empty moment after measurement")
+
     def validate_scheduled_operation(self, schedule, scheduled_operation):
         """
         Raises an error if the given scheduled_operation is isn't valid in the
@@ -416,3 +446,9 @@ class NeutralAtomDevice(devices.Device):
             horizontal_spacing=3,
             vertical_spacing=2,
             use_unicode_characters=True)
+
+
+def _has_measurement(moment: ops.Moment) -> bool:
+    return any(
+        ops.op_gate_of_type(operation, ops.MeasurementGate)
+        for operation in moment.operations)
@@ -252,6 +252,30 @@ def test_validate_circuit_errors():
         d.validate_circuit(c)
 
 
+def test_validate_moments_in_circuit():
+    d = square_device(2, 2)
+    q00 = cirq.GridQubit(0, 0)
+    q01 = cirq.GridQubit(0, 1)
+    circuit = cirq.Circuit([
+        cirq.Moment([cirq.X(q00)]),
+        cirq.Moment(),
+        cirq.Moment([cirq.measure(q00)]),
+        cirq.Moment(),
+    ])
+    d.validate_moments_in_circuit(circuit, range(4))
+
+    circuit[1] = cirq.Moment([cirq.X(q01)])
+    d.validate_moments_in_circuit(circuit, [1])
+    circuit[3] = cirq.Moment([cirq.X(q01)])
+    with pytest.raises(ValueError, match="Non-empty moment after measurement"):
+        d.validate_moments_in_circuit(circuit, [3])
+    circuit[3] = cirq.Moment()
+
+    circuit[0] = cirq.Moment([cirq.measure(q00)])
+    with pytest.raises(ValueError, match="Non-empty moment after measurement"):
+        d.validate_moments_in_circuit(circuit, [0])
+
+
 def test_validate_scheduled_operation_errors():
     d = square_device(2, 2)
     s = cirq.Schedule(device=cirq.UNCONSTRAINED_DEVICE)
@@ -0,0 +1,51 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Rewrite templates for circuits made of neutral atom gates."""
+
+from cirq import devices, ops, optimizers
+
+_a, _b, _c = devices.LineQubit.range(3)
+
+# Identities that shorten circuits of neutral atom gates, for
+# `cirq.TemplateOptimizer`. The replacements only use neutral atom gates.
+NEUTRAL_ATOM_TEMPLATES = (
+    optimizers.RewriteTemplate([ops.CNOT(_a, _b), ops.CNOT(_a, _b)], [],
+                               name='CNOT CNOT = I'),
+    optimizers.RewriteTemplate([ops.CZ(_a, _b), ops.CZ(_a, _b)], [],
+                               name='CZ CZ = I'),
+    optimizers.RewriteTemplate([ops.CZ(_a, _b), ops.CZ(_b, _a)], [],
+                               name='CZ CZ = I (swapped qubits)'),
+    optimizers.RewriteTemplate(
+        [ops.CCX(_a, _b, _c), ops.CCX(_a, _b, _c)], [], name='CCX CCX = I'),
+    optimizers.RewriteTemplate(
+        [ops.CCZ(_a, _b, _c), ops.CCZ(_a, _b, _c)], [], name='CCZ CCZ = I'),
+    optimizers.RewriteTemplate(
+        [ops.X(_b), ops.CNOT(_a, _b), ops.X(_b)], [ops.CNOT(_a, _b)],
+        name='X CNOT X = CNOT on the target'),
+    optimizers.RewriteTemplate(
+        [ops.Z(_a), ops.CNOT(_a, _b), ops.Z(_a)], [ops.CNOT(_a, _b)],
+        name='Z CNOT Z = CNOT on the control'),
+    optimizers.RewriteTemplate(
+        [ops.X(_a), ops.CNOT(_a, _b), ops.X(_a)],
+        [ops.CNOT(_a, _b), ops.X(_b)],
+        name='X CNOT X = CNOT X on the control'),
+    optimizers.RewriteTemplate(
+        [ops.Z(_b), ops.CNOT(_a, _b), ops.Z(_b)],
+        [ops.CNOT(_a, _b), ops.Z(_a)],
+        name='Z CNOT Z = CNOT Z on the target'),
+    optimizers.RewriteTemplate([ops.X(_a), ops.X(_a)], [], name='X X = I'),
+    optimizers.RewriteTemplate([ops.Y(_a), ops.Y(_a)], [], name='Y Y = I'),
+    optimizers.RewriteTemplate([ops.Z(_a), ops.Z(_a)], [], name='Z Z = I'),
+)
@@ -143,8 +143,21 @@ class LinearCombinationOfGates(value.LinearDict[raw_types.Gate]):
 
     def _pauli_expansion_(self) -> value.LinearDict[str]:
         result = value.LinearDict({})  # type: value.LinearDict[str]
+        # Gates that can only be expanded via their unitary are summed as
+        # matrices first, so that the matrix expansion happens only once.
+        matrix = None  # type: Optional[np.ndarray]
         for gate, coefficient in self.items():
+            if (getattr(gate, '_pauli_expansion_', None) is None and
+                    all(d == 2 for d in protocols.qid_shape(gate))):
+                gate_matrix = protocols.unitary(gate, None)
+                if gate_matrix is not None:
+                    term = gate_matrix * coefficient
+                    matrix = term if matrix is None else matrix + term
+                    continue
             result += protocols.pauli_expansion(gate) * coefficient
+        if matrix is not None:
+            result += operator_spaces.expand_matrix_in_pauli_basis(
+                matrix).clean(atol=1e-9)
         return result
 
 
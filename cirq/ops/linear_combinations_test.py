@@ -110,6 +110,10 @@ def test_linear_combination_of_gates_has_correct_matrix(terms, expected_matrix):
      {'X': 2 + np.sqrt(0.5), 'Z': np.sqrt(0.5)}),
     ({cirq.XX: -2, cirq.YY: 3j, cirq.ZZ: 4},
      {'XX': -2, 'YY': 3j, 'ZZ': 4}),
+    ({cirq.CCZ: 4, cirq.CCX: 4},
+     {'III': 6, 'IZI': 2, 'ZII': 2, 'ZZI': -2,
+      'IIZ': 1, 'IZZ': -1, 'ZIZ': -1, 'ZZZ': 1,
+      'IIX': 1, 'IZX': -1, 'ZIX': -1, 'ZZX': 1}),
 ))
 def test_linear_combination_of_gates_has_correct_pauli_expansion(
         terms, expected_expansion):
@@ -18,7 +18,7 @@ from typing import cast, Any, Tuple
 
 import numpy as np
 
-from cirq import linalg, protocols
+from cirq import linalg, protocols, value
 from cirq._compat import proper_repr
 from cirq.ops import gate_features
 
@@ -161,6 +161,9 @@ class TwoQubitMatrixGate(gate_features.TwoQubitGate):
     def _unitary_(self) -> np.ndarray:
         return np.array(self._matrix)
 
+    def _pauli_expansion_(self) -> value.LinearDict[str]:
+        return linalg.expand_matrix_in_pauli_basis(self._matrix)
+
     def _circuit_diagram_info_(self, args: 'protocols.CircuitDiagramInfoArgs'
                               ) -> 'protocols.CircuitDiagramInfo':
         return protocols.CircuitDiagramInfo(
@@ -14,7 +14,8 @@
 
 """A simplified time-slice of operations within a sequenced circuit."""
 
-from typing import Any, Callable, Iterable, Sequence, TypeVar, Union
+from typing import (Any, Callable, Dict, Iterable, Optional, Sequence, TypeVar,
+                    Union)
 
 from cirq import protocols
 from cirq.ops import raw_types
@@ -37,6 +38,8 @@ class Moment:
         qubits: A set of the qubits acted upon by this Moment.
     """
 
+    __slots__ = ('operations', 'qubits', '_qubit_to_op')
+
     def __init__(self, operations: Iterable[raw_types.Operation] = ()) -> None:
         """Constructs a moment with the given operations.
 
@@ -50,11 +53,17 @@ class Moment:
         self.operations = tuple(operations)
 
         # Check that operations don't overlap.
-        affected_qubits = [q for op in self.operations for q in op.qubits]
-        self.qubits = frozenset(affected_qubits)
-        if len(affected_qubits) != len(self.qubits):
+        qubit_to_op = {}  # type: Dict[raw_types.Qid, raw_types.Operation]
+        num_qubits = 0
+        for op in self.operations:
+            for q in op.qubits:
+                qubit_to_op[q] = op
+                num_qubits += 1
+        if len(qubit_to_op) != num_qubits:
             raise ValueError(
                 'Overlapping operations: {}'.format(self.operations))
+        self._qubit_to_op = qubit_to_op
+        self.qubits = frozenset(qubit_to_op)
 
     def operates_on_single_qubit(self, qubit: raw_types.Qid) -> bool:
         """Determines if the moment has operations touching the given qubit.
@@ -74,7 +83,17 @@ class Moment:
         Returns:
             Whether this moment has operations involving the qubits.
         """
-        return any(q in qubits for q in self.qubits)
+        return not self.qubits.isdisjoint(qubits)
+
+    def operation_at(self, qubit: raw_types.Qid
+                    ) -> Optional[raw_types.Operation]:
+        """Returns the operation on the given qubit, or None if there isn't
+        one.
+
+        Args:
+            qubit: The qubit to look up.
+        """
+        return self._qubit_to_op.get(qubit)
 
     def with_operation(self, operation: raw_types.Operation):
         """Returns an equal moment, but with the given op added.
@@ -85,7 +104,18 @@ class Moment:
         Returns:
             The new moment.
         """
-        return Moment(self.operations + (operation,))
+        qubits = self.qubits.union(operation.qubits)
+        if len(qubits) != len(self.qubits) + len(operation.qubits):
+            raise ValueError('Overlapping operations: {}'.format(
+                self.operations + (operation,)))
+        # Extend the existing qubit map instead of rebuilding it.
+        result = Moment.__new__(Moment)
+        result.operations = self.operations + (operation,)
+        result.qubits = qubits
+        result._qubit_to_op = dict(self._qubit_to_op)
+        for q in operation.qubits:
+            result._qubit_to_op[q] = operation
+        return result
 
     def without_operations_touching(self, qubits: Iterable[raw_types.Qid]):
         """Returns an equal moment, but without ops on the given qubits.
@@ -96,12 +126,12 @@ class Moment:
         Returns:
             The new moment.
         """
-        qubits = frozenset(qubits)
-        if not self.operates_on(qubits):
+        touched = self.qubits.intersection(qubits)
+        if not touched:
             return self
-        return Moment(
-            operation for operation in self.operations
-            if qubits.isdisjoint(frozenset(operation.qubits)))
+        removed = {id(self._qubit_to_op[q]) for q in touched}
+        return Moment(operation for operation in self.operations
+                      if id(operation) not in removed)
 
     def __copy__(self):
         return type(self)(self.operations)
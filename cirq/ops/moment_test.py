@@ -131,6 +131,7 @@ def test_operates_on():
 def test_with_operation():
     a = cirq.NamedQubit('a')
     b = cirq.NamedQubit('b')
+    c = cirq.NamedQubit('c')
 
     assert Moment().with_operation(cirq.X(a)) == Moment([cirq.X(a)])
 
@@ -140,6 +141,31 @@ def test_with_operation():
     with pytest.raises(ValueError):
         _ = Moment([cirq.X(a)]).with_operation(cirq.X(a))
 
+    m = Moment([cirq.X(a)]).with_operation(cirq.CZ(b, c))
+    assert m.qubits == {a, b, c}
+    assert m.operation_at(c) == cirq.CZ(b, c)
+    assert m.without_operations_touching([b]) == Moment([cirq.X(a)])
+
+
+def test_operation_at():
+    a = cirq.NamedQubit('a')
+    b = cirq.NamedQubit('b')
+    c = cirq.NamedQubit('c')
+
+    m = Moment([cirq.X(a), cirq.CZ(b, c)])
+    assert m.operation_at(a) == cirq.X(a)
+    assert m.operation_at(b) == cirq.CZ(b, c)
+    assert m.operation_at(c) == cirq.CZ(b, c)
+    assert m.operation_at(cirq.NamedQubit('d')) is None
+    assert Moment().operation_at(a) is None
+
+
+def test_slots():
+    m = Moment([cirq.X(cirq.NamedQubit('a'))])
+    assert not hasattr(m, '__dict__')
+    with pytest.raises(AttributeError):
+        m.extra = 1
+
 
 def test_without_operations_touching():
     a = cirq.NamedQubit('a')
@@ -45,6 +45,10 @@ class CCZPowGate(eigen_gate.EigenGate,
     The matrix of `CCZ**t` is `diag(1, 1, 1, 1, 1, 1, 1, exp(i pi t))`.
     """
 
+    # The decomposition avoids interactions between non-adjacent qubits, so it
+    # can't be shared by `cirq.decompose` between operations on other qubits.
+    _decompose_depends_on_qubits_ = True
+
     def _eigen_components(self):
         return [
             (0, np.diag([1, 1, 1, 1, 1, 1, 1, 0])),
@@ -159,6 +163,10 @@ class CCZPowGate(eigen_gate.EigenGate,
 class ThreeQubitDiagonalGate(gate_features.ThreeQubitGate):
     """A gate given by a diagonal 8x8 matrix."""
 
+    # The decomposition avoids interactions between non-adjacent qubits, so it
+    # can't be shared by `cirq.decompose` between operations on other qubits.
+    _decompose_depends_on_qubits_ = True
+
     def __init__(self, diag_angles_radians: List[value.TParamVal]) -> None:
         r"""A three qubit gate with only diagonal elements.
 
@@ -402,6 +410,10 @@ class CSwapGate(gate_features.ThreeQubitGate,
                 gate_features.InterchangeableQubitsGate):
     """A controlled swap gate. The Fredkin gate."""
 
+    # The decomposition avoids interactions between non-adjacent qubits, so it
+    # can't be shared by `cirq.decompose` between operations on other qubits.
+    _decompose_depends_on_qubits_ = True
+
     def qubit_index_to_equivalence_group_key(self, index):
         return 0 if index == 0 else 1
 
@@ -14,6 +14,11 @@
 
 """Circuit transformation utilities."""
 
+from cirq.optimizers.cancel_commuting_gates import (
+    CancelCommutingGates,
+    operations_commute,
+)
+
 from cirq.optimizers.drop_empty_moments import (
     DropEmptyMoments,)
 
@@ -40,13 +45,30 @@ from cirq.optimizers.merge_single_qubit_gates import (
     MergeSingleQubitGates,
 )
 
+from cirq.optimizers.pass_manager import (
+    CircuitStats,
+    PassManager,
+    PassManagerReport,
+    PassRecord,
+    RepeatUntilStable,
+)
+
 from cirq.optimizers.decompositions import (
     is_negligible_turn,
+    single_qubit_matrices_to_phased_x_z,
     single_qubit_matrix_to_gates,
     single_qubit_matrix_to_pauli_rotations,
     single_qubit_matrix_to_phased_x_z,
     single_qubit_op_to_framed_phase_form,
 )
 
+from cirq.optimizers.template_optimizer import (
+    RewriteTemplate,
+    TemplateOptimizer,
+)
+
 from cirq.optimizers.two_qubit_decompositions import (
     two_qubit_matrix_to_operations,)
+
+from cirq.optimizers.two_qubit_decomposition_cache import (
+    TwoQubitDecompositionCache,)
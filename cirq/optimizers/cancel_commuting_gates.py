@@ -0,0 +1,231 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An optimization pass that merges rotations across commuting operations."""
+
+from typing import Any, Dict, Hashable, List, Optional, Tuple, cast
+
+import numpy as np
+import sympy
+
+from cirq import circuits, linalg, ops, protocols, value
+
+
+def _pauli_axes(op: ops.Operation) -> Optional[Tuple[ops.Pauli, ...]]:
+    """Finds, for each qubit, the Pauli that the operation is a function of.
+
+    An operation whose matrix can be written as a polynomial in the Paulis
+    P_0 on its first qubit, P_1 on its second qubit, etc. commutes with any
+    other such operation that has the same Paulis on the qubits they share.
+    For example CNOT is a function of Z on the control and X on the target,
+    and all diagonal gates are functions of Z on every qubit.
+
+    Returns:
+        The Pauli for each qubit of the operation, or None if the operation
+        isn't known to have such a form.
+    """
+    gate = getattr(op, 'gate', None)
+    if gate is None:
+        return None
+    n = len(op.qubits)
+    if isinstance(gate, (ops.ZPowGate, ops.CZPowGate, ops.CCZPowGate,
+                         ops.ZZPowGate, ops.ThreeQubitDiagonalGate)):
+        return (ops.Z,) * n
+    if isinstance(gate, (ops.XPowGate, ops.XXPowGate)):
+        return (ops.X,) * n
+    if isinstance(gate, (ops.YPowGate, ops.YYPowGate)):
+        return (ops.Y,) * n
+    if isinstance(gate, ops.CNotPowGate):
+        return ops.Z, ops.X
+    if isinstance(gate, ops.CCXPowGate):
+        return ops.Z, ops.Z, ops.X
+    if isinstance(gate, ops.SingleQubitCliffordGate):
+        # A Clifford that maps a Pauli to itself is a rotation around it.
+        for pauli in (ops.X, ops.Y, ops.Z):
+            if gate.transform(pauli) == ops.PauliTransform(pauli, False):
+                return (pauli,)
+        return None
+    if n <= 2 and protocols.has_unitary(gate):
+        matrix = protocols.unitary(gate)
+        if np.count_nonzero(matrix - np.diag(np.diag(matrix))) == 0:
+            return (ops.Z,) * n
+    return None
+
+
+def _base_gate(op: ops.Operation) -> Optional[ops.EigenGate]:
+    """The operation's gate if it is an `EigenGate`, with Pauli gates such as
+    `cirq.X` replaced by their plain counterparts like `cirq.XPowGate()`."""
+    gate = getattr(op, 'gate', None)
+    if not isinstance(gate, ops.EigenGate):
+        return None
+    if isinstance(gate, ops.Pauli):
+        return cast(ops.EigenGate, gate**1)
+    return gate
+
+
+def _reorder_keys(op: ops.Operation) -> Optional[Tuple[Hashable, ...]]:
+    """Keys, one per qubit, such that operations commute when their keys
+    agree on all the qubits they share."""
+    axes = _pauli_axes(op)
+    if axes is not None:
+        return axes
+    gate = _base_gate(op)
+    if gate is None:
+        return None
+    # Gates that only differ in their exponent share their eigenvectors.
+    family = gate._with_exponent(0)
+    return tuple((family, op.qubits, i) for i in range(len(op.qubits)))
+
+
+def operations_commute(op1: ops.Operation, op2: ops.Operation) -> bool:
+    """Conservatively determines whether two operations commute.
+
+    Operations on disjoint qubits always commute. Otherwise this recognizes
+    that diagonal gates commute with each other, that X rotations commute
+    with each other and with the target of a CNOT, that single-qubit Clifford
+    gates commute with rotations around the Pauli axis they fix, and that
+    gates differing only in their exponent commute.
+
+    This can be used as the `can_reorder` predicate of a `cirq.CircuitDag`.
+
+    Args:
+        op1: An operation.
+        op2: Another operation.
+
+    Returns:
+        True if the operations are known to commute, False if they don't or
+        if it couldn't be determined.
+    """
+    shared = set(op1.qubits) & set(op2.qubits)
+    if not shared:
+        return True
+    keys1 = _reorder_keys(op1)
+    keys2 = _reorder_keys(op2)
+    if keys1 is None or keys2 is None:
+        return False
+    by_qubit1 = dict(zip(op1.qubits, keys1))
+    by_qubit2 = dict(zip(op2.qubits, keys2))
+    return all(by_qubit1[q] == by_qubit2[q] for q in shared)
+
+
+def _is_identity(gate: ops.EigenGate, atol: float) -> bool:
+    """Whether the gate's unitary is the identity, up to global phase.
+
+    The trace distance bound of an `EigenGate` can't be used here, because it
+    only holds for gates of the form exp(i t P) for a Pauli product P. For
+    example `cirq.ISWAP**2` is Z tensor Z, but its bound is about zero.
+    """
+    if protocols.is_parameterized(gate):
+        return False
+    matrix = protocols.unitary(gate)
+    return linalg.allclose_up_to_global_phase(matrix,
+                                              np.eye(matrix.shape[0]),
+                                              atol=atol)
+
+
+class _Merge:
+    """Gates of one kind, all to be combined into the first of them."""
+
+    def __init__(self, index: int, op: ops.Operation,
+                 gate: ops.EigenGate) -> None:
+        """
+        Args:
+            index: The index of the moment of the first operation.
+            op: The first operation.
+            gate: The base gate of the first operation.
+        """
+        self.index = index
+        self.op = op
+        self.gate = gate
+        self.exponent = gate.exponent  # type: value.TParamVal
+        # The (moment index, operation) pairs of the later operations.
+        self.merged = []  # type: List[Tuple[int, ops.Operation]]
+
+
+class CancelCommutingGates:
+    """Merges rotations that are separated only by commuting operations.
+
+    Each qubit's operations are split into commutation groups: maximal runs
+    of consecutive operations that mutually commute according to
+    `cirq.operations_commute`, such as a run of Z rotations and CZs. Gates
+    that differ only in their exponent (like `cirq.Z**0.25` and `cirq.Z`, or
+    two CNOTs on the same qubits) and that are in the same commutation group
+    on every one of their qubits are combined into one gate, at the position
+    of the first one. Combinations that amount to the identity, such as pairs
+    of inverse gates, are removed.
+
+    A single sweep over the circuit finds all the groups, so the pass takes
+    time linear in the number of operations. Removing a gate can put
+    operations that were in different groups next to each other; wrap the
+    pass in a `cirq.RepeatUntilStable` group to also catch those.
+    """
+
+    def __init__(self, tolerance: float = 1e-8) -> None:
+        """
+        Args:
+            tolerance: Combined gates whose unitary is within this absolute
+                tolerance of the identity, up to global phase, are removed.
+        """
+        self.tolerance = tolerance
+
+    def optimize_circuit(self, circuit: circuits.Circuit) -> None:
+        # The current commutation group of each qubit, as (key, group id).
+        groups = {}  # type: Dict[ops.Qid, Tuple[Any, int]]
+        group_count = 0
+        # For each mergeable kind of gate, the index into `merges` of the
+        # first gate of that kind in the current groups.
+        firsts = {}  # type: Dict[Any, int]
+        merges = []  # type: List[_Merge]
+
+        for i, op in circuit.findall_operations(lambda _: True):
+            keys = _reorder_keys(op) or (None,) * len(op.qubits)
+            signature = []
+            for q, key in zip(op.qubits, keys):
+                group = groups.get(q)
+                if key is None or group is None or group[0] != key:
+                    group = (key, group_count)
+                    group_count += 1
+                    groups[q] = group
+                signature.append(group[1])
+
+            gate = _base_gate(op)
+            if gate is None:
+                continue
+            kind = (gate._with_exponent(0), op.qubits, tuple(signature))
+            j = firsts.get(kind)
+            if j is None:
+                firsts[kind] = len(merges)
+                merges.append(_Merge(i, op, gate))
+            else:
+                merges[j].exponent += gate.exponent
+                merges[j].merged.append((i, op))
+
+        removals = []  # type: List[Tuple[int, ops.Operation]]
+        insert_intos = []  # type: List[Tuple[int, ops.Operation]]
+        for merge in merges:
+            if not merge.merged:
+                continue
+            removals.append((merge.index, merge.op))
+            removals.extend(merge.merged)
+            exponent = merge.exponent
+            if isinstance(exponent, sympy.Basic) and not exponent.free_symbols:
+                # The symbols cancelled out, as in `Z**t` followed by `Z**-t`.
+                exponent = float(exponent)
+            new_gate = merge.gate._with_exponent(exponent)
+            if _is_identity(new_gate, self.tolerance):
+                continue
+            insert_intos.append((merge.index, new_gate.on(*merge.op.qubits)))
+
+        circuit.batch_remove(removals)
+        circuit.batch_insert_into(insert_intos)
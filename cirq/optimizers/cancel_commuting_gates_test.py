@@ -0,0 +1,230 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import sympy
+
+import cirq
+
+
+def assert_optimizes(before: cirq.Circuit, expected: cirq.Circuit):
+    actual = before.copy()
+    cirq.CancelCommutingGates().optimize_circuit(actual)
+    assert actual == expected, 'ACTUAL {} : EXPECTED {}'.format(
+        actual, expected)
+    if cirq.has_unitary(before):
+        cirq.testing.assert_allclose_up_to_global_phase(before.unitary(),
+                                                        actual.unitary(),
+                                                        atol=1e-8)
+
+
+def test_merges_rotations_across_diagonal_gates():
+    a, b = cirq.LineQubit.range(2)
+    assert_optimizes(
+        before=cirq.Circuit([
+            cirq.Moment([cirq.Z(a)**0.25]),
+            cirq.Moment([cirq.CZ(a, b)]),
+            cirq.Moment([cirq.Z(a)**0.25, cirq.Z(b)]),
+            cirq.Moment([cirq.CZ(a, b)**0.5]),
+        ]),
+        expected=cirq.Circuit([
+            cirq.Moment([cirq.Z(a)**0.5]),
+            cirq.Moment([cirq.CZ(a, b)**1.5]),
+            cirq.Moment([cirq.Z(b)]),
+            cirq.Moment(),
+        ]))
+
+
+def test_cancels_inverse_pairs():
+    a, b = cirq.LineQubit.range(2)
+    assert_optimizes(
+        before=cirq.Circuit([
+            cirq.Moment([cirq.CNOT(a, b)]),
+            cirq.Moment([cirq.Z(a), cirq.X(b)**0.5]),
+            cirq.Moment([cirq.CNOT(a, b)]),
+            cirq.Moment([cirq.H(a), cirq.T(b)]),
+            cirq.Moment([cirq.H(a), cirq.T(b)**-1]),
+        ]),
+        expected=cirq.Circuit([
+            cirq.Moment(),
+            cirq.Moment([cirq.Z(a), cirq.X(b)**0.5]),
+            cirq.Moment(),
+            cirq.Moment(),
+            cirq.Moment(),
+        ]))
+
+
+def test_rotations_through_cliffords():
+    a = cirq.NamedQubit('a')
+    assert_optimizes(
+        before=cirq.Circuit.from_ops(
+            cirq.X(a)**0.25,
+            cirq.SingleQubitCliffordGate.X_sqrt(a),
+            cirq.X(a)**-0.25,
+            cirq.Z(a)**0.125,
+            cirq.SingleQubitCliffordGate.H(a),
+            cirq.Z(a)**0.125,
+        ),
+        expected=cirq.Circuit([
+            cirq.Moment(),
+            cirq.Moment([cirq.SingleQubitCliffordGate.X_sqrt(a)]),
+            cirq.Moment(),
+            cirq.Moment([cirq.Z(a)**0.125]),
+            cirq.Moment([cirq.SingleQubitCliffordGate.H(a)]),
+            cirq.Moment([cirq.Z(a)**0.125]),
+        ]))
+
+
+def test_stops_at_non_commuting_operations():
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit.from_ops(
+        cirq.X(a),
+        cirq.H(a),
+        cirq.X(a),
+        cirq.Z(b)**0.5,
+        cirq.CNOT(a, b),
+        cirq.Z(b)**0.5,
+        cirq.measure(a),
+        cirq.X(a),
+    )
+    assert_optimizes(before=circuit, expected=circuit.copy())
+
+
+def test_merges_symbols():
+    a, b = cirq.LineQubit.range(2)
+    t = sympy.Symbol('t')
+    assert_optimizes(
+        before=cirq.Circuit.from_ops(
+            cirq.Z(a)**t,
+            cirq.CZ(a, b),
+            cirq.Z(a)**-t,
+            cirq.X(b)**t,
+            cirq.X(b)**0.5,
+        ),
+        expected=cirq.Circuit([
+            cirq.Moment(),
+            cirq.Moment([cirq.CZ(a, b)]),
+            cirq.Moment([cirq.X(b)**(t + 0.5)]),
+            cirq.Moment(),
+        ]))
+
+
+def test_preserves_unitary():
+    a, b, c = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit.from_ops(
+        cirq.T(a), cirq.CNOT(a, b), cirq.X(b)**0.3, cirq.CZ(a, c),
+        cirq.T(a), cirq.CNOT(a, b), cirq.CCZ(a, b, c), cirq.Y(c)**0.2,
+        cirq.YY(b, c)**0.5, cirq.Y(c)**0.3, cirq.ZZ(a, b)**0.1, cirq.S(a),
+        cirq.CCX(a, b, c), cirq.X(c)**-0.5, cirq.CCX(a, b, c),
+        cirq.Rz(0.3).on(a), cirq.Rz(0.4).on(a))
+    expected = circuit.unitary()
+
+    cirq.CancelCommutingGates().optimize_circuit(circuit)
+
+    cirq.testing.assert_allclose_up_to_global_phase(circuit.unitary(),
+                                                    expected,
+                                                    atol=1e-8)
+    assert len(list(circuit.all_operations())) == 9
+
+
+def test_operations_commute():
+    a, b, c = cirq.LineQubit.range(3)
+    assert cirq.operations_commute(cirq.H(a), cirq.H(b))
+    assert cirq.operations_commute(cirq.Z(a), cirq.CZ(a, b)**0.5)
+    assert cirq.operations_commute(cirq.CCZ(a, b, c), cirq.Rz(0.1).on(c))
+    assert cirq.operations_commute(cirq.CNOT(a, b), cirq.X(b)**0.25)
+    assert cirq.operations_commute(cirq.CNOT(a, b), cirq.CNOT(a, c))
+    assert cirq.operations_commute(cirq.H(a), cirq.H(a)**0.5)
+    assert cirq.operations_commute(cirq.SingleQubitCliffordGate.Y_sqrt(a),
+                                   cirq.Y(a))
+    assert cirq.operations_commute(
+        cirq.SingleQubitMatrixGate(cirq.unitary(cirq.S)).on(a), cirq.T(a))
+
+    assert not cirq.operations_commute(cirq.CNOT(a, b), cirq.Z(b))
+    assert not cirq.operations_commute(cirq.CNOT(a, b), cirq.CNOT(b, a))
+    assert not cirq.operations_commute(cirq.H(a), cirq.Z(a))
+    assert not cirq.operations_commute(cirq.SingleQubitCliffordGate.H(a),
+                                       cirq.Z(a))
+    assert not cirq.operations_commute(cirq.measure(a), cirq.Z(a))
+
+
+def test_operations_commute_as_dag_predicate():
+    a, b = cirq.LineQubit.range(2)
+    dag = cirq.CircuitDag.from_ops(cirq.Z(a),
+                                   cirq.CZ(a, b),
+                                   cirq.Z(a)**0.5,
+                                   can_reorder=cirq.operations_commute)
+    assert dag.number_of_edges() == 0
+
+    dag = cirq.CircuitDag.from_ops(cirq.Z(a),
+                                   cirq.H(a),
+                                   cirq.Z(a)**0.5,
+                                   can_reorder=cirq.operations_commute)
+    assert dag.number_of_edges() == 3
+
+
+
+class FSimLikeGate(cirq.EigenGate, cirq.TwoQubitGate):
+    """Swaps with a phase, like an fSim gate, when raised to the power 1."""
+
+    def _eigen_components(self):
+        s = np.sqrt(0.5)
+        symmetric = np.array([0, s, s, 0])
+        antisymmetric = np.array([0, s, -s, 0])
+        return [
+            (0, np.diag([1, 0, 0, 0])),
+            (0.5, np.outer(symmetric, symmetric)),
+            (-0.5, np.outer(antisymmetric, antisymmetric)),
+            (1, np.diag([0, 0, 0, 1])),
+        ]
+
+
+def test_keeps_merged_gates_that_are_not_the_identity():
+    a, b = cirq.LineQubit.range(2)
+    # ISWAP**2 is Z tensor Z even though its trace distance bound is zero.
+    assert cirq.trace_distance_bound(cirq.ISWAP**2) < 1e-8
+    assert_optimizes(
+        before=cirq.Circuit([
+            cirq.Moment([cirq.ISWAP(a, b)]),
+            cirq.Moment([cirq.ISWAP(a, b)]),
+        ]),
+        expected=cirq.Circuit([
+            cirq.Moment([(cirq.ISWAP**2).on(a, b)]),
+            cirq.Moment(),
+        ]))
+    cirq.testing.assert_allclose_up_to_global_phase(
+        cirq.unitary(cirq.ISWAP**2),
+        cirq.unitary(cirq.Circuit.from_ops(cirq.Z(a), cirq.Z(b))),
+        atol=1e-8)
+
+    assert_optimizes(
+        before=cirq.Circuit([
+            cirq.Moment([FSimLikeGate().on(a, b)]),
+            cirq.Moment([FSimLikeGate().on(a, b)]),
+        ]),
+        expected=cirq.Circuit([
+            cirq.Moment([FSimLikeGate(exponent=2).on(a, b)]),
+            cirq.Moment(),
+        ]))
+    assert_optimizes(
+        before=cirq.Circuit([
+            cirq.Moment([FSimLikeGate(exponent=3).on(a, b)]),
+            cirq.Moment([FSimLikeGate().on(a, b)]),
+            cirq.Moment([cirq.Z(a), cirq.Z(b)]),
+        ]),
+        expected=cirq.Circuit([
+            cirq.Moment(),
+            cirq.Moment(),
+            cirq.Moment([cirq.Z(a), cirq.Z(b)]),
+        ]))
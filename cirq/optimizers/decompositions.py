@@ -192,7 +192,92 @@ def single_qubit_matrix_to_phased_x_z(
 
     xy_turn, xy_phase_turn, total_z_turn = (
         _deconstruct_single_qubit_matrix_into_gate_turns(mat))
+    return _phased_x_z_gates(xy_turn, xy_phase_turn, total_z_turn, atol)
 
+
+def single_qubit_matrices_to_phased_x_z(
+        mats: np.ndarray,
+        atol: float = 0
+) -> List[List[ops.SingleQubitGate]]:
+    """Implements many single-qubit operations with PhasedX and Z gates.
+
+    Equivalent to calling `cirq.single_qubit_matrix_to_phased_x_z` on each
+    matrix, but the gate angles of all the matrices are computed together
+    with vectorized numpy operations.
+
+    Args:
+        mats: An array of shape (N, 2, 2) holding the unitary matrices of the
+            operations to implement.
+        atol: A limit on the amount of error introduced by each
+            construction.
+
+    Returns:
+        A list with, for each matrix, a list of gates that, when applied in
+        order, perform the corresponding operation.
+
+    Raises:
+        ValueError: The matrices aren't a stack of 2x2 matrices.
+    """
+    mats = np.asarray(mats)
+    if mats.ndim != 3 or mats.shape[1:] != (2, 2):
+        raise ValueError('Expected an array of shape (N, 2, 2), got {}.'.format(
+            mats.shape))
+    turns = _deconstruct_single_qubit_matrices_into_gate_turns(mats)
+    return [
+        _phased_x_z_gates(float(xy_turn), float(xy_phase_turn),
+                          float(total_z_turn), atol)
+        for xy_turn, xy_phase_turn, total_z_turn in turns
+    ]
+
+
+def _deconstruct_single_qubit_matrices_into_gate_turns(
+        mats: np.ndarray) -> np.ndarray:
+    """Vectorized `_deconstruct_single_qubit_matrix_into_gate_turns`.
+
+    Follows the same steps as `cirq.deconstruct_single_qubit_matrix_into_angles`
+    for every matrix at once.
+
+    Args:
+        mats: An array of shape (N, 2, 2) of unitary matrices.
+
+    Returns:
+        An array of shape (N, 3) with the XY turn, XY phase turn and Z turn of
+        each matrix, canonicalized into the range [-0.5, 0.5).
+    """
+    m00 = mats[:, 0, 0]
+    m01 = mats[:, 0, 1]
+    m10 = mats[:, 1, 0]
+    m11 = mats[:, 1, 1]
+
+    # Anti-cancel right diagonal, then bottom diagonal.
+    right_phase = np.angle(m01 * np.conj(m00)) + np.pi
+    bottom_phase = np.angle(m10 * np.conj(m00))
+    m01 = m01 * np.exp(-1j * right_phase)
+    m10 = m10 * np.exp(-1j * bottom_phase)
+    m11 = m11 * np.exp(-1j * (right_phase + bottom_phase))
+
+    # Cancel the remaining rotation and read off the diagonal phase.
+    rotation = np.arctan2(np.abs(m10), np.abs(m00))
+    cos, sin = np.cos(rotation), np.sin(rotation)
+    d00 = cos * m00 + sin * m10
+    d11 = -sin * m01 + cos * m11
+    diagonal_phase = np.angle(d11 * np.conj(d00))
+
+    pre_phase = right_phase + diagonal_phase
+    post_phase = bottom_phase
+    tau = 2 * np.pi
+    turns = np.stack(
+        [2 * rotation / tau, 0.25 - pre_phase / tau,
+         (post_phase + pre_phase) / tau],
+        axis=-1)
+
+    # Normalize turns into the range [-0.5, 0.5).
+    return (turns + 0.5) % 1 - 0.5
+
+
+def _phased_x_z_gates(xy_turn: float, xy_phase_turn: float,
+                      total_z_turn: float,
+                      atol: float) -> List[ops.SingleQubitGate]:
     # Build the intended operation out of non-negligible XY and Z rotations.
     result = [
         ops.PhasedXPowGate(exponent=2 * xy_turn,
@@ -26,7 +26,8 @@ import cirq
 def assert_gates_implement_unitary(gates: Sequence[cirq.SingleQubitGate],
                                    intended_effect: np.ndarray,
                                    atol: float):
-    actual_effect = cirq.dot(*[cirq.unitary(g) for g in reversed(gates)])
+    actual_effect = cirq.dot(np.eye(2),
+                             *[cirq.unitary(g) for g in reversed(gates)])
     cirq.testing.assert_allclose_up_to_global_phase(actual_effect,
                                                     intended_effect,
                                                     atol=atol)
@@ -298,3 +299,37 @@ def test_single_qubit_matrix_to_native_gates_tolerance_half_turn_phasing():
     kept = cirq.single_qubit_matrix_to_phased_x_z(
         phased_nearly_x, atol=0.0001)
     assert len(kept) == 2
+
+
+def test_single_qubit_matrices_to_phased_x_z_matches_unbatched():
+    a = np.pi / 2 + 0.01
+    c, s = np.cos(a), np.sin(a)
+    mats = [
+        np.eye(2),
+        cirq.unitary(cirq.X),
+        cirq.unitary(cirq.H),
+        cirq.unitary(cirq.Z**0.25),
+        np.diag([1, np.exp(1j * 0.01)]),
+        np.array([[c, -s], [s, c]]),
+        np.array([[0, 1j], [1, 0]]),
+    ] + [cirq.testing.random_unitary(2) for _ in range(10)]
+
+    for atol in [1e-1, 1e-6]:
+        batched = cirq.single_qubit_matrices_to_phased_x_z(np.array(mats),
+                                                           atol=atol)
+        assert len(batched) == len(mats)
+        for mat, gates in zip(mats, batched):
+            expected = cirq.single_qubit_matrix_to_phased_x_z(mat, atol=atol)
+            assert [type(g) for g in gates] == [type(g) for g in expected]
+            for gate, expected_gate in zip(gates, expected):
+                np.testing.assert_allclose(cirq.unitary(gate),
+                                           cirq.unitary(expected_gate),
+                                           atol=1e-8)
+            if atol < 1e-3:
+                assert_gates_implement_unitary(gates, mat, atol=1e-5)
+
+
+def test_single_qubit_matrices_to_phased_x_z_shapes():
+    assert cirq.single_qubit_matrices_to_phased_x_z(np.zeros((0, 2, 2))) == []
+    with pytest.raises(ValueError, match='shape'):
+        _ = cirq.single_qubit_matrices_to_phased_x_z(np.eye(2))
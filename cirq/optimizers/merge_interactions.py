@@ -19,7 +19,7 @@ from typing import Callable, List, Optional, Sequence, Tuple, cast
 import numpy as np
 
 from cirq import circuits, ops, protocols
-from cirq.optimizers import two_qubit_decompositions
+from cirq.optimizers import two_qubit_decomposition_cache
 
 
 class MergeInteractions(circuits.PointOptimizer):
@@ -31,10 +31,29 @@ class MergeInteractions(circuits.PointOptimizer):
                  allow_partial_czs: bool = True,
                  post_clean_up: Callable[
                      [Sequence[ops.Operation]], ops.OP_TREE
-                 ] = lambda op_list: op_list) -> None:
+                 ] = lambda op_list: op_list,
+                 decomposition_cache: Optional[
+                     two_qubit_decomposition_cache.TwoQubitDecompositionCache
+                 ] = None) -> None:
+        """
+        Args:
+            tolerance: A limit on the amount of absolute error introduced by
+                the new operations.
+            allow_partial_czs: Enables the use of Partial-CZ gates.
+            post_clean_up: This function is called on each set of optimized
+                operations before they are put into the circuit to replace the
+                old operations.
+            decomposition_cache: Remembers the decompositions of the merged
+                two-qubit blocks, so that repeated blocks are decomposed once.
+                Defaults to a new cache owned by this optimizer.
+        """
         super().__init__(post_clean_up=post_clean_up)
         self.tolerance = tolerance
         self.allow_partial_czs = allow_partial_czs
+        if decomposition_cache is None:
+            decomposition_cache = (
+                two_qubit_decomposition_cache.TwoQubitDecompositionCache())
+        self.decomposition_cache = decomposition_cache
 
     def optimization_at(self,
                         circuit: circuits.Circuit,
@@ -67,7 +86,7 @@ class MergeInteractions(circuits.PointOptimizer):
 
         # Find a max-3-cz construction.
         new_operations = (
-            two_qubit_decompositions.two_qubit_matrix_to_operations(
+            self.decomposition_cache.two_qubit_matrix_to_operations(
                 op.qubits[0],
                 op.qubits[1],
                 matrix,
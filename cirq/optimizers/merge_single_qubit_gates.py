@@ -14,7 +14,7 @@
 
 """An optimization pass that combines adjacent single-qubit rotations."""
 
-from typing import Optional, Callable, List
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, cast
 
 import numpy as np
 
@@ -30,7 +30,8 @@ class MergeSingleQubitGates(circuits.PointOptimizer):
                  rewriter: Optional[Callable[[List[ops.Operation]],
                                              Optional[ops.OP_TREE]]] = None,
                  synthesizer: Optional[Callable[[ops.Qid, np.ndarray],
-                                                Optional[ops.OP_TREE]]] = None):
+                                                Optional[ops.OP_TREE]]] = None,
+                 batched: bool = False):
         """
         Args:
             rewriter: Specifies how to merge runs of single-qubit operations
@@ -45,12 +46,43 @@ class MergeSingleQubitGates(circuits.PointOptimizer):
                 be specified at the same time as `rewriter`. If `synthesizer`
                 returns `None`, that means "do not rewrite the operations used
                 to make this matrix".
+            batched: Rewrite the whole circuit at once instead of one run at a
+                time. Every maximal run of single-qubit operations is found in
+                a single sweep, and the matrices of all the runs are
+                multiplied together as one stacked numpy computation. This is
+                much faster on large circuits. Each qubit gets the same
+                sequence of operations as in the default mode (up to floating
+                point error), so the circuit has the same unitary, but the
+                moment layout can differ: the new operations of a run are put
+                into the moments of the operations they replace, and only
+                operations beyond the length of the run are inserted after
+                it, instead of being packed from the start of the run.
         """
         super().__init__()
         if rewriter is not None and synthesizer is not None:
             raise ValueError("Can't specify both rewriter and synthesizer.")
         self._rewriter = rewriter
         self._synthesizer = synthesizer
+        self.batched = batched
+
+    def optimize_circuit(self, circuit: circuits.Circuit) -> None:
+        if not self.batched:
+            super().optimize_circuit(circuit)
+            return
+        runs = _single_qubit_runs(circuit)
+        if self._rewriter is not None:
+            rewrites = [
+                self._rewriter([op for _, op in run]) for _, run in runs
+            ]  # type: List[Optional[ops.OP_TREE]]
+        else:
+            unitaries = _run_unitaries(runs)
+            rewrites = []
+            for (q, _), unitary in zip(runs, unitaries):
+                if self._synthesizer is not None:
+                    rewrites.append(self._synthesizer(q, unitary))
+                else:
+                    rewrites.append(ops.SingleQubitMatrixGate(unitary).on(q))
+        _rewrite_runs(circuit, runs, rewrites)
 
     def _rewrite(self, operations: List[ops.Operation]
                  ) -> Optional[ops.OP_TREE]:
@@ -98,9 +130,97 @@ class MergeSingleQubitGates(circuits.PointOptimizer):
             new_operations=rewritten)
 
 
-def merge_single_qubit_gates_into_phased_x_z(
-        circuit: circuits.Circuit,
-        atol: float = 1e-8) -> None:
+_Run = Tuple[ops.Qid, List[Tuple[int, ops.Operation]]]
+
+
+def _single_qubit_runs(circuit: circuits.Circuit) -> List[_Run]:
+    """Finds every maximal run of adjacent unitary single-qubit operations.
+
+    Returns:
+        A list of (qubit, [(moment_index, operation), ...]) pairs, one per
+        run, ordered by the position of the first operation of each run.
+    """
+    runs = []  # type: List[_Run]
+    open_runs = {}  # type: Dict[ops.Qid, List[Tuple[int, ops.Operation]]]
+    for i, moment in enumerate(circuit):
+        for op in moment.operations:
+            if len(op.qubits) == 1 and protocols.has_unitary(op):
+                q = op.qubits[0]
+                run = open_runs.get(q)
+                if run is None:
+                    run = open_runs[q] = []
+                    runs.append((q, run))
+                run.append((i, op))
+            else:
+                for q in op.qubits:
+                    open_runs.pop(q, None)
+    return runs
+
+
+def _run_unitaries(runs: Sequence[_Run]) -> np.ndarray:
+    """Computes the matrix of every run, with one stacked product per round.
+
+    The unitaries of all the operations are stacked into one array, and
+    adjacent pairs within each run are multiplied together until every run is
+    down to a single matrix. This takes a logarithmic number of vectorized
+    rounds instead of one python-level product per operation.
+
+    Returns:
+        An array of shape (len(runs), 2, 2) holding the matrix of each run.
+    """
+    lengths = np.array([len(run) for _, run in runs], dtype=np.int64)
+    mats = np.array([
+        protocols.unitary(op) for _, run in runs for _, op in run
+    ]).reshape((-1, 2, 2)).astype(np.complex128)
+    while np.any(lengths > 1):
+        starts = np.cumsum(lengths) - lengths
+        pos = np.arange(len(mats)) - np.repeat(starts, lengths)
+        firsts = pos % 2 == 0
+        # Each kept matrix absorbs the next one in its run, if there is one.
+        has_pair = firsts & (pos + 1 < np.repeat(lengths, lengths))
+        paired = np.flatnonzero(has_pair)
+        new_mats = mats[firsts]
+        new_mats[has_pair[firsts]] = np.matmul(mats[paired + 1], mats[paired])
+        mats = new_mats
+        lengths = (lengths + 1) // 2
+    return mats
+
+
+def _rewrite_runs(circuit: circuits.Circuit, runs: Sequence[_Run],
+                  rewrites: Sequence[Optional[ops.OP_TREE]]) -> None:
+    """Replaces each run with its rewrite, skipping runs rewritten to None.
+
+    New operations on the run's qubit take the moments of the old operations,
+    in order. Any left over are inserted after the run.
+    """
+    removals = []  # type: List[Tuple[int, ops.Operation]]
+    insert_intos = []  # type: List[Tuple[int, ops.Operation]]
+    insertions = []  # type: List[Tuple[int, List[ops.Operation]]]
+    for (q, run), rewritten in zip(runs, rewrites):
+        if rewritten is None:
+            continue
+        removals.extend(run)
+        # Without `preserve_moments`, only operations are yielded.
+        new_ops = cast(List[ops.Operation],
+                       list(ops.flatten_op_tree(rewritten)))
+        if not new_ops:
+            continue
+        if any(op.qubits != (q,) for op in new_ops):
+            insertions.append((run[0][0], new_ops))
+            continue
+        indices = [i for i, _ in run]
+        insert_intos.extend(zip(indices, new_ops))
+        if len(new_ops) > len(indices):
+            insertions.append((indices[-1] + 1, new_ops[len(indices):]))
+
+    circuit.batch_remove(removals)
+    circuit.batch_insert_into(insert_intos)
+    circuit.batch_insert(insertions)
+
+
+def merge_single_qubit_gates_into_phased_x_z(circuit: circuits.Circuit,
+                                             atol: float = 1e-8,
+                                             batched: bool = False) -> None:
     """Canonicalizes runs of single-qubit rotations in a circuit.
 
     Specifically, any run of non-parameterized circuits will be replaced by an
@@ -110,7 +230,19 @@ def merge_single_qubit_gates_into_phased_x_z(
         circuit: The circuit to rewrite. This value is mutated in-place.
         atol: Absolute tolerance to angle error. Larger values allow more
             negligible gates to be dropped, smaller values increase accuracy.
+        batched: Rewrite all the runs at once, computing their matrices and
+            gate angles with vectorized numpy operations. See the `batched`
+            argument of `cirq.MergeSingleQubitGates`.
     """
+    if batched:
+        runs = _single_qubit_runs(circuit)
+        gate_lists = decompositions.single_qubit_matrices_to_phased_x_z(
+            _run_unitaries(runs), atol)
+        rewrites = [[gate(q) for gate in gates]
+                    for (q, _), gates in zip(runs, gate_lists)
+                   ]  # type: List[Optional[ops.OP_TREE]]
+        _rewrite_runs(circuit, runs, rewrites)
+        return
 
     def synth(qubit: ops.Qid, matrix: np.ndarray) -> List[ops.Operation]:
         out_gates = decompositions.single_qubit_matrix_to_phased_x_z(
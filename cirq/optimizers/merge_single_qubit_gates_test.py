@@ -185,3 +185,128 @@ def test_merge_single_qubit_gates_into_phased_x_z():
                          (cirq.PhasedXPowGate(phase_exponent=-0.5)(a))**0.5,
                      ),
                      optimizer=cirq.merge_single_qubit_gates_into_phased_x_z)
+
+
+def test_batched_matches_unbatched():
+    a, b, c = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit.from_ops(
+        cirq.X(a),
+        cirq.Y(b)**0.5,
+        cirq.CZ(a, b),
+        cirq.H(a),
+        cirq.Z(a),
+        cirq.T(c),
+        cirq.H(c),
+        cirq.measure(b),
+        cirq.X(b),
+        cirq.CZ(a, c),
+        cirq.Y(c)**0.25,
+        cirq.X(a)**-1,
+        cirq.X(a),
+    )
+    for optimizer, batched_optimizer in [
+        (cirq.MergeSingleQubitGates(),
+         cirq.MergeSingleQubitGates(batched=True)),
+        (cirq.merge_single_qubit_gates_into_phased_x_z,
+         lambda c: cirq.merge_single_qubit_gates_into_phased_x_z(
+             c, batched=True)),
+    ]:
+        expected = circuit.copy()
+        actual = circuit.copy()
+        if hasattr(optimizer, 'optimize_circuit'):
+            optimizer.optimize_circuit(expected)
+            batched_optimizer.optimize_circuit(actual)
+        else:
+            optimizer(expected)
+            batched_optimizer(actual)
+
+        # Every run fits in its original moments, so the layouts agree too.
+        assert cirq.approx_eq(actual, expected, atol=1e-8)
+
+
+def test_batched_keeps_moments_of_replaced_operations():
+    a, b, c = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit([
+        cirq.Moment([cirq.T(c)]),
+        cirq.Moment([cirq.CZ(a, b)]),
+        cirq.Moment([cirq.H(c)]),
+    ])
+    expected = circuit.copy()
+    actual = circuit.copy()
+    cirq.merge_single_qubit_gates_into_phased_x_z(expected)
+    cirq.merge_single_qubit_gates_into_phased_x_z(actual, batched=True)
+
+    # The default mode packs the rewrite from the start of the run, while
+    # batched mode reuses the moments of the replaced operations.
+    phased_x = cirq.PhasedXPowGate(phase_exponent=-0.75, exponent=0.5)(c)
+    z = cirq.Z(c)**-0.75
+    assert cirq.approx_eq(expected,
+                          cirq.Circuit([
+                              cirq.Moment([phased_x]),
+                              cirq.Moment([cirq.CZ(a, b), z]),
+                              cirq.Moment(),
+                          ]),
+                          atol=1e-8)
+    assert cirq.approx_eq(actual,
+                          cirq.Circuit([
+                              cirq.Moment([phased_x]),
+                              cirq.Moment([cirq.CZ(a, b)]),
+                              cirq.Moment([z]),
+                          ]),
+                          atol=1e-8)
+    cirq.testing.assert_allclose_up_to_global_phase(actual.unitary(),
+                                                    expected.unitary(),
+                                                    atol=1e-8)
+
+
+def test_batched_merge_into_phased_x_z():
+    a, b = cirq.LineQubit.range(2)
+    assert_optimizes(
+        before=cirq.Circuit.from_ops(
+            cirq.X(a),
+            cirq.Y(b)**0.5,
+            cirq.CZ(a, b),
+            cirq.H(a),
+            cirq.Z(a),
+        ),
+        expected=cirq.Circuit.from_ops(
+            cirq.PhasedXPowGate(phase_exponent=1)(a),
+            cirq.Y(b)**0.5,
+            cirq.CZ(a, b),
+            (cirq.PhasedXPowGate(phase_exponent=-0.5)(a))**0.5,
+        ),
+        optimizer=lambda c: cirq.merge_single_qubit_gates_into_phased_x_z(
+            c, batched=True))
+
+
+def test_batched_rewriter_and_synthesizer():
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit.from_ops(cirq.X(a), cirq.Z(a), cirq.CZ(a, b),
+                                    cirq.H(b), cirq.H(b))
+
+    # Identity runs can be dropped, and extra operations are appended.
+    cirq.MergeSingleQubitGates(
+        synthesizer=lambda q, m: None if np.allclose(m, np.eye(2)) else
+        [cirq.Y(q), cirq.Y(q), cirq.Y(q)],
+        batched=True).optimize_circuit(circuit)
+    assert circuit == cirq.Circuit([
+        cirq.Moment([cirq.Y(a)]),
+        cirq.Moment([cirq.Y(a)]),
+        cirq.Moment([cirq.Y(a)]),
+        cirq.Moment([cirq.CZ(a, b)]),
+        cirq.Moment([cirq.H(b)]),
+        cirq.Moment([cirq.H(b)]),
+    ])
+
+    circuit = cirq.Circuit.from_ops(cirq.X(a), cirq.Z(a), cirq.CZ(a, b),
+                                    cirq.H(b), cirq.H(b))
+    cirq.MergeSingleQubitGates(
+        rewriter=lambda ops: [] if len(ops) > 1 else None,
+        batched=True).optimize_circuit(circuit)
+    assert circuit == cirq.Circuit([
+        cirq.Moment(),
+        cirq.Moment(),
+        cirq.Moment([cirq.CZ(a, b)]),
+        cirq.Moment(),
+        cirq.Moment(),
+    ])
@@ -0,0 +1,218 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Runs a pipeline of optimization passes and reports what each pass did."""
+
+import time
+from typing import (Any, Callable, Dict, Iterable, List, NamedTuple, Optional,
+                    Sequence, Tuple, Union)
+
+from cirq import circuits
+
+CircuitStats = NamedTuple('CircuitStats', [
+    ('operation_count', int),
+    ('two_qubit_operation_count', int),
+    ('depth', int),
+])
+CircuitStats.__doc__ = """The size of a circuit, as tracked by `PassManager`.
+
+Attributes:
+    operation_count: The number of operations in the circuit.
+    two_qubit_operation_count: The number of operations acting on exactly two
+        qubits.
+    depth: The number of non-empty moments in the circuit.
+"""
+
+PassRecord = NamedTuple('PassRecord', [
+    ('name', str),
+    ('repetition', Optional[int]),
+    ('duration', float),
+    ('before', CircuitStats),
+    ('after', CircuitStats),
+])
+PassRecord.__doc__ = """What a single run of a pass did to a circuit.
+
+Attributes:
+    name: The name of the pass.
+    repetition: For passes in a `RepeatUntilStable` group, the index of the
+        repetition of the group this run was part of. Otherwise None.
+    duration: The wall time the pass took, in seconds.
+    before: The circuit's stats before the pass ran.
+    after: The circuit's stats after the pass ran.
+"""
+
+
+def circuit_stats(circuit: circuits.Circuit) -> CircuitStats:
+    """Measures the stats of a circuit that `PassManager` reports."""
+    operation_count = 0
+    two_qubit_operation_count = 0
+    depth = 0
+    for moment in circuit:
+        if not moment.operations:
+            continue
+        depth += 1
+        for op in moment.operations:
+            operation_count += 1
+            if len(op.qubits) == 2:
+                two_qubit_operation_count += 1
+    return CircuitStats(operation_count, two_qubit_operation_count, depth)
+
+
+def _pass_name(optimization_pass: Any) -> str:
+    owner = getattr(optimization_pass, '__self__', None)
+    if owner is not None:
+        return type(owner).__name__
+    name = getattr(optimization_pass, '__name__', None)
+    if name is not None:
+        return name
+    return type(optimization_pass).__name__
+
+
+def _as_callable(optimization_pass: Any
+                ) -> Tuple[str, Callable[[circuits.Circuit], Any]]:
+    optimize = getattr(optimization_pass, 'optimize_circuit', None)
+    if optimize is not None:
+        return _pass_name(optimize), optimize
+    if not callable(optimization_pass):
+        raise TypeError('Not an optimization pass: {!r}'.format(
+            optimization_pass))
+    return _pass_name(optimization_pass), optimization_pass
+
+
+class RepeatUntilStable:
+    """A group of passes that is rerun until it stops changing the circuit."""
+
+    def __init__(self, *passes: Any, max_repetitions: int = 10) -> None:
+        """
+        Args:
+            *passes: The passes to run, in order. Each is either an object
+                with an `optimize_circuit` method or a callable that mutates
+                the circuit given to it.
+            max_repetitions: How many times the group is run at most, even if
+                the circuit is still changing.
+
+        Raises:
+            ValueError: max_repetitions isn't positive.
+        """
+        if max_repetitions < 1:
+            raise ValueError(
+                'max_repetitions must be positive: {}'.format(max_repetitions))
+        self.passes = [_as_callable(p) for p in passes]
+        self.max_repetitions = max_repetitions
+
+    def __repr__(self):
+        return 'cirq.RepeatUntilStable({}, max_repetitions={!r})'.format(
+            ', '.join(name for name, _ in self.passes), self.max_repetitions)
+
+
+class PassManagerReport:
+    """The records of the passes run by a `PassManager`, in order."""
+
+    def __init__(self, records: Sequence[PassRecord] = ()) -> None:
+        self.records = list(records)  # type: List[PassRecord]
+
+    @property
+    def total_duration(self) -> float:
+        """The wall time taken by all the passes, in seconds."""
+        return sum(record.duration for record in self.records)
+
+    def durations_by_pass(self) -> Dict[str, float]:
+        """The total wall time taken by each pass, over all its runs."""
+        durations = {}  # type: Dict[str, float]
+        for record in self.records:
+            durations[record.name] = (durations.get(record.name, 0.0) +
+                                      record.duration)
+        return durations
+
+    def __str__(self):
+        lines = ['pass  seconds  operations  two-qubit operations  depth']
+        for record in self.records:
+            name = record.name
+            if record.repetition is not None:
+                name += '[{}]'.format(record.repetition)
+            lines.append('{}  {:.6f}  {} -> {}  {} -> {}  {} -> {}'.format(
+                name, record.duration, record.before.operation_count,
+                record.after.operation_count,
+                record.before.two_qubit_operation_count,
+                record.after.two_qubit_operation_count, record.before.depth,
+                record.after.depth))
+        lines.append('total  {:.6f}'.format(self.total_duration))
+        return '\n'.join(lines)
+
+    def __repr__(self):
+        return 'cirq.PassManagerReport({!r})'.format(self.records)
+
+
+class PassManager:
+    """Runs an ordered list of optimization passes over circuits.
+
+    Each pass is timed, and the circuit's operation count, two-qubit operation
+    count and depth are recorded before and after it runs. Passes can be
+    grouped with `RepeatUntilStable` to rerun them until the circuit reaches
+    a fixpoint.
+    """
+
+    def __init__(self, passes: Iterable[Union[Any, RepeatUntilStable]]
+                ) -> None:
+        """
+        Args:
+            passes: The passes to run, in order. Each is a `RepeatUntilStable`
+                group, an object with an `optimize_circuit` method, or a
+                callable that mutates the circuit given to it.
+        """
+        self.passes = [
+            p if isinstance(p, RepeatUntilStable) else _as_callable(p)
+            for p in passes
+        ]  # type: List[Union[RepeatUntilStable, Tuple[str, Callable]]]
+
+    def __call__(self, circuit: circuits.Circuit) -> PassManagerReport:
+        return self.optimize_circuit(circuit)
+
+    def optimize_circuit(self, circuit: circuits.Circuit) -> PassManagerReport:
+        """Runs the passes over a circuit.
+
+        Args:
+            circuit: The circuit to optimize. This value is mutated in-place.
+
+        Returns:
+            The record of every run of every pass.
+        """
+        report = PassManagerReport()
+        stats = circuit_stats(circuit)
+        for p in self.passes:
+            if not isinstance(p, RepeatUntilStable):
+                stats = _run_pass(p, circuit, stats, None, report)
+                continue
+            for repetition in range(p.max_repetitions):
+                before = circuit.copy()
+                for group_pass in p.passes:
+                    stats = _run_pass(group_pass, circuit, stats, repetition,
+                                      report)
+                if circuit == before:
+                    break
+        return report
+
+
+def _run_pass(named_pass: Tuple[str, Callable[[circuits.Circuit], Any]],
+              circuit: circuits.Circuit, before: CircuitStats,
+              repetition: Optional[int],
+              report: PassManagerReport) -> CircuitStats:
+    name, optimize = named_pass
+    start = time.perf_counter()
+    optimize(circuit)
+    duration = time.perf_counter() - start
+    after = circuit_stats(circuit)
+    report.records.append(PassRecord(name, repetition, duration, before,
+                                     after))
+    return after
@@ -0,0 +1,131 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+import cirq
+from cirq.optimizers.pass_manager import circuit_stats
+
+
+def test_circuit_stats():
+    a, b, c = cirq.LineQubit.range(3)
+    assert circuit_stats(cirq.Circuit()) == cirq.CircuitStats(0, 0, 0)
+    assert circuit_stats(
+        cirq.Circuit([
+            cirq.Moment([cirq.X(a), cirq.CZ(b, c)]),
+            cirq.Moment(),
+            cirq.Moment([cirq.CCZ(a, b, c)]),
+        ])) == cirq.CircuitStats(operation_count=3,
+                                 two_qubit_operation_count=1,
+                                 depth=2)
+
+
+def test_pass_manager_records_each_pass():
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit([
+        cirq.Moment([cirq.X(a)]),
+        cirq.Moment([cirq.X(a)]),
+        cirq.Moment(),
+        cirq.Moment([cirq.CZ(a, b)]),
+    ])
+    calls = []
+
+    def noop(c):
+        calls.append(len(c))
+
+    report = cirq.PassManager([
+        cirq.MergeSingleQubitGates(),
+        cirq.DropEmptyMoments(),
+        noop,
+    ]).optimize_circuit(circuit)
+
+    assert calls == [2]
+    assert len(circuit) == 2
+    assert [r.name for r in report.records
+           ] == ['MergeSingleQubitGates', 'DropEmptyMoments', 'noop']
+    assert all(r.repetition is None for r in report.records)
+    assert report.records[0].before == cirq.CircuitStats(3, 1, 3)
+    assert report.records[0].after == cirq.CircuitStats(2, 1, 2)
+    assert report.records[1].before == report.records[0].after
+    assert report.records[1].after == cirq.CircuitStats(2, 1, 2)
+    assert report.records[2].after == cirq.CircuitStats(2, 1, 2)
+    assert all(r.duration >= 0 for r in report.records)
+    assert report.total_duration == sum(r.duration for r in report.records)
+    assert set(report.durations_by_pass()) == {
+        'MergeSingleQubitGates', 'DropEmptyMoments', 'noop'
+    }
+    assert 'MergeSingleQubitGates' in str(report)
+    assert '3 -> 2' in str(report)
+    assert repr(report).startswith('cirq.PassManagerReport([')
+
+
+def test_pass_manager_call():
+    a = cirq.NamedQubit('a')
+    circuit = cirq.Circuit([cirq.Moment(), cirq.Moment([cirq.X(a)])])
+    report = cirq.PassManager([cirq.DropEmptyMoments()])(circuit)
+    assert circuit == cirq.Circuit.from_ops(cirq.X(a))
+    assert len(report.records) == 1
+
+
+def test_pass_manager_rejects_non_passes():
+    with pytest.raises(TypeError, match='Not an optimization pass'):
+        _ = cirq.PassManager([1])
+
+
+def test_repeat_until_stable():
+    a = cirq.NamedQubit('a')
+    circuit = cirq.Circuit.from_ops([cirq.X(a)] * 4)
+
+    def drop_first(c):
+        for i, moment in enumerate(c):
+            if moment.operations:
+                c[i] = cirq.Moment()
+                return
+
+    def drop_empty_moments(c):
+        c[:] = [m for m in c if m.operations]
+
+    report = cirq.PassManager([
+        cirq.RepeatUntilStable(drop_first,
+                               drop_empty_moments,
+                               max_repetitions=2),
+        cirq.RepeatUntilStable(drop_first, drop_empty_moments),
+    ]).optimize_circuit(circuit)
+
+    assert circuit == cirq.Circuit()
+    assert [(r.name, r.repetition) for r in report.records] == [
+        ('drop_first', 0),
+        ('drop_empty_moments', 0),
+        ('drop_first', 1),
+        ('drop_empty_moments', 1),
+        # The second group runs once more after emptying the circuit, to see
+        # that nothing changes.
+        ('drop_first', 0),
+        ('drop_empty_moments', 0),
+        ('drop_first', 1),
+        ('drop_empty_moments', 1),
+        ('drop_first', 2),
+        ('drop_empty_moments', 2),
+    ]
+    assert [r.after.operation_count for r in report.records
+           ] == [3, 3, 2, 2, 1, 1, 0, 0, 0, 0]
+
+
+def test_repeat_until_stable_validation_and_repr():
+    with pytest.raises(ValueError, match='max_repetitions'):
+        _ = cirq.RepeatUntilStable(cirq.DropEmptyMoments(), max_repetitions=0)
+    assert repr(cirq.RepeatUntilStable(
+        cirq.DropEmptyMoments(),
+        cirq.EjectZ())) == ('cirq.RepeatUntilStable(DropEmptyMoments, EjectZ, '
+                            'max_repetitions=10)')
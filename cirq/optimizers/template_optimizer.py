@@ -0,0 +1,218 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A peephole optimizer that rewrites matches of equivalence templates."""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple, cast
+
+from cirq import circuits, ops
+
+
+def _operation_kind(op: ops.Operation) -> Any:
+    """The type that identifies what an operation does, ignoring its
+    parameters. Operations can only be equal if their kinds are equal."""
+    gate = getattr(op, 'gate', None)
+    if gate is None:
+        return type(op)
+    if isinstance(gate, ops.Pauli):
+        # `cirq.X` is equal to `cirq.XPowGate()`, so index it the same way.
+        return type(gate**1)
+    return type(gate)
+
+
+class RewriteTemplate:
+    """A circuit identity used by `cirq.TemplateOptimizer`.
+
+    The template says that the operations of `pattern`, applied in order, can
+    be replaced by the operations of `replacement`. The qubits of the
+    template are placeholders that match any qubits of a circuit. The
+    replacement must have the same effect as the pattern, up to global phase,
+    and should be cheaper to run.
+    """
+
+    def __init__(self,
+                 pattern: ops.OP_TREE,
+                 replacement: ops.OP_TREE,
+                 name: Optional[str] = None) -> None:
+        """
+        Args:
+            pattern: The operations to look for, in order. Each operation
+                after the first must share a qubit with an earlier one.
+            replacement: The operations to put in place of the pattern. They
+                may only act on the pattern's qubits.
+            name: A description of the template, used in its repr.
+
+        Raises:
+            ValueError: The pattern is empty or not connected, or the
+                replacement acts on other qubits.
+        """
+        # Without `preserve_moments`, only operations are yielded.
+        self.pattern = tuple(
+            cast(Iterable[ops.Operation], ops.flatten_op_tree(pattern)))
+        self.replacement = tuple(
+            cast(Iterable[ops.Operation], ops.flatten_op_tree(replacement)))
+        self.name = name
+
+        if not self.pattern:
+            raise ValueError('Empty template pattern.')
+        seen = set(self.pattern[0].qubits)
+        for op in self.pattern[1:]:
+            if seen.isdisjoint(op.qubits):
+                raise ValueError(
+                    "Template pattern isn't connected: {!r} shares no qubit "
+                    "with the operations before it.".format(op))
+            seen.update(op.qubits)
+        for op in self.replacement:
+            if not seen.issuperset(op.qubits):
+                raise ValueError(
+                    'Template replacement acts on qubits outside the '
+                    'pattern: {!r}'.format(op))
+
+        first_qubit = self.pattern[0].qubits[0]
+        self._wire_kinds = tuple(
+            _operation_kind(op)
+            for op in self.pattern
+            if first_qubit in op.qubits)
+
+    def _match(self, circuit: circuits.Circuit, index: int, op: ops.Operation
+              ) -> Optional[Tuple[Dict[ops.Qid, ops.Qid], int]]:
+        """Matches the pattern against the circuit, with the first operation
+        of the pattern mapped to the given operation.
+
+        The matched operations must be the only operations on their qubits
+        between the given moment and the last matched moment, so that they
+        can be cleared as a block.
+
+        Returns:
+            None if the pattern doesn't match. Otherwise the map from
+            template qubits to circuit qubits and the index of the last
+            moment of the match.
+        """
+        qubit_map = {}  # type: Dict[ops.Qid, ops.Qid]
+        # The moment of the last matched operation on each circuit qubit.
+        cursor = {}  # type: Dict[ops.Qid, int]
+        end = index
+        m = index  # type: Optional[int]
+        for k, t in enumerate(self.pattern):
+            if k == 0:
+                m, c = index, op
+            else:
+                q = qubit_map[next(q for q in t.qubits if q in qubit_map)]
+                m = circuit.next_moment_operating_on([q], cursor[q] + 1)
+                if m is None:
+                    return None
+                # The moment operates on q, so there is an operation there.
+                c = cast(ops.Operation, circuit.operation_at(q, m))
+            if len(c.qubits) != len(t.qubits):
+                return None
+            for tq, cq in zip(t.qubits, c.qubits):
+                if tq in qubit_map:
+                    if qubit_map[tq] != cq:
+                        return None
+                    start = cursor[cq] + 1
+                else:
+                    if cq in cursor:
+                        return None
+                    qubit_map[tq] = cq
+                    start = index
+                # The operation must be next on every one of its qubits.
+                if circuit.next_moment_operating_on([cq], start) != m:
+                    return None
+            if t.with_qubits(*(qubit_map[q] for q in t.qubits)) != c:
+                return None
+            for cq in c.qubits:
+                cursor[cq] = m
+            end = max(end, m)
+
+        # Nothing else may happen on the matched qubits during the match.
+        for cq, last in cursor.items():
+            if circuit.next_moment_operating_on([cq], last + 1,
+                                                end - last) is not None:
+                return None
+        return qubit_map, end
+
+    def __repr__(self):
+        return 'cirq.RewriteTemplate({!r}, {!r}{})'.format(
+            list(self.pattern), list(self.replacement),
+            '' if self.name is None else ', name={!r}'.format(self.name))
+
+
+class TemplateOptimizer(circuits.PointOptimizer):
+    """Rewrites the parts of a circuit that match templates.
+
+    Templates are indexed by the sequence of operation kinds (gate types) on
+    the first qubit of their pattern. At each operation of the circuit, the
+    kinds of the operations that follow it on its first qubit are looked up
+    in the index, so finding candidate templates takes a constant number of
+    hash lookups no matter how many templates there are. Only candidates are
+    then matched operation by operation.
+
+    A match is replaced when the matched operations are the only operations
+    on their qubits across the moments they span. When several templates
+    match at the same place, templates with longer sequences on the first
+    qubit are preferred, and then templates given earlier.
+    """
+
+    def __init__(self, templates: Iterable[RewriteTemplate]) -> None:
+        """
+        Args:
+            templates: The templates to apply.
+        """
+        super().__init__()
+        self.templates = tuple(templates)
+        self._index = {}  # type: Dict[Tuple[Any, ...], List[RewriteTemplate]]
+        for template in self.templates:
+            self._index.setdefault(template._wire_kinds, []).append(template)
+        self._key_lengths = sorted({len(key) for key in self._index},
+                                   reverse=True)
+
+    def _candidates(self, circuit: circuits.Circuit, index: int,
+                    op: ops.Operation) -> Iterable[RewriteTemplate]:
+        if not self._key_lengths or not op.qubits:
+            return
+        q = op.qubits[0]
+        kinds = [_operation_kind(op)]
+        m = index
+        while len(kinds) < self._key_lengths[0]:
+            next_m = circuit.next_moment_operating_on([q], m + 1)
+            if next_m is None:
+                break
+            m = next_m
+            # The moment operates on q, so there is an operation there.
+            kinds.append(
+                _operation_kind(
+                    cast(ops.Operation, circuit.operation_at(q, m))))
+        for length in self._key_lengths:
+            if length <= len(kinds):
+                yield from self._index.get(tuple(kinds[:length]), [])
+
+    def optimization_at(self, circuit: circuits.Circuit, index: int,
+                        op: ops.Operation
+                       ) -> Optional[circuits.PointOptimizationSummary]:
+        for template in self._candidates(circuit, index, op):
+            match = template._match(circuit, index, op)
+            if match is None:
+                continue
+            qubit_map, end = match
+            return circuits.PointOptimizationSummary(
+                clear_span=end + 1 - index,
+                clear_qubits=list(qubit_map.values()),
+                new_operations=[
+                    r.with_qubits(*(qubit_map[q] for q in r.qubits))
+                    for r in template.replacement
+                ])
+        return None
+
+    def __repr__(self):
+        return 'cirq.TemplateOptimizer({!r})'.format(list(self.templates))
@@ -0,0 +1,113 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+import cirq
+
+_a, _b = cirq.LineQubit.range(2)
+X_X = cirq.RewriteTemplate([cirq.X(_a), cirq.X(_a)], [])
+X_CZ_X = cirq.RewriteTemplate(
+    [cirq.X(_a), cirq.CZ(_a, _b), cirq.X(_a)],
+    [cirq.CZ(_a, _b), cirq.Z(_b)])
+
+
+def assert_optimizes(templates, before: cirq.Circuit, expected: cirq.Circuit):
+    actual = before.copy()
+    cirq.TemplateOptimizer(templates).optimize_circuit(actual)
+    cirq.DropEmptyMoments().optimize_circuit(actual)
+    assert actual == expected, 'ACTUAL {} : EXPECTED {}'.format(
+        actual, expected)
+
+
+def test_rewrites_matches_on_any_qubits():
+    p, q = cirq.NamedQubit('p'), cirq.NamedQubit('q')
+    assert_optimizes(
+        [X_X, X_CZ_X],
+        before=cirq.Circuit([
+            cirq.Moment([cirq.H(p)]),
+            cirq.Moment([cirq.X(q)]),
+            cirq.Moment([cirq.CZ(q, p)]),
+            cirq.Moment([cirq.X(q)]),
+            cirq.Moment([cirq.X(p)]),
+            cirq.Moment([cirq.XPowGate(exponent=1).on(p)]),
+        ]),
+        expected=cirq.Circuit([
+            cirq.Moment([cirq.H(p)]),
+            cirq.Moment([cirq.CZ(q, p)]),
+            cirq.Moment([cirq.Z(p)]),
+        ]))
+
+
+def test_requires_exclusive_block():
+    a, b = cirq.LineQubit.range(2)
+
+    # Another operation on a matched qubit within the match.
+    circuit = cirq.Circuit([
+        cirq.Moment([cirq.X(a)]),
+        cirq.Moment([cirq.CZ(a, b)]),
+        cirq.Moment([cirq.X(a), cirq.H(b)]),
+    ])
+    assert_optimizes([X_CZ_X], before=circuit, expected=circuit.copy())
+
+    # Another operation in between on the same qubit.
+    circuit = cirq.Circuit.from_ops(cirq.X(a), cirq.Y(a), cirq.X(a))
+    assert_optimizes([X_X], before=circuit, expected=circuit.copy())
+
+    # The qubits of an operation in the wrong order.
+    circuit = cirq.Circuit.from_ops(cirq.X(a), cirq.CZ(b, a), cirq.X(a))
+    assert_optimizes([X_CZ_X], before=circuit, expected=circuit.copy())
+
+    # Different gates.
+    circuit = cirq.Circuit.from_ops(cirq.X(a), cirq.X(a)**0.5)
+    assert_optimizes([X_X], before=circuit, expected=circuit.copy())
+
+
+def test_prefers_longer_templates():
+    a = cirq.NamedQubit('a')
+    x_x_z = cirq.RewriteTemplate(
+        [cirq.X(_a), cirq.X(_a), cirq.Z(_a)], [cirq.S(_a), cirq.S(_a)])
+    assert_optimizes(
+        [X_X, x_x_z],
+        before=cirq.Circuit.from_ops(cirq.X(a), cirq.X(a), cirq.Z(a)),
+        expected=cirq.Circuit.from_ops(cirq.S(a), cirq.S(a)))
+    assert_optimizes(
+        [X_X, x_x_z],
+        before=cirq.Circuit.from_ops(cirq.X(a), cirq.X(a), cirq.Y(a)),
+        expected=cirq.Circuit.from_ops(cirq.Y(a)))
+
+
+def test_no_templates():
+    a = cirq.NamedQubit('a')
+    circuit = cirq.Circuit.from_ops(cirq.X(a), cirq.X(a))
+    assert_optimizes([], before=circuit, expected=circuit.copy())
+
+
+def test_template_validation():
+    a, b, c = cirq.LineQubit.range(3)
+    with pytest.raises(ValueError, match='Empty'):
+        _ = cirq.RewriteTemplate([], [])
+    with pytest.raises(ValueError, match='connected'):
+        _ = cirq.RewriteTemplate([cirq.X(a), cirq.X(b)], [])
+    with pytest.raises(ValueError, match='outside'):
+        _ = cirq.RewriteTemplate([cirq.CZ(a, b)], [cirq.CZ(b, c)])
+
+
+def test_repr():
+    a = cirq.LineQubit(0)
+    template = cirq.RewriteTemplate([cirq.X(a), cirq.X(a)], [], name='X X')
+    assert repr(template) == (
+        'cirq.RewriteTemplate([cirq.X.on(cirq.LineQubit(0)), '
+        'cirq.X.on(cirq.LineQubit(0))], [], name=\'X X\')')
+    assert repr(cirq.TemplateOptimizer([])) == 'cirq.TemplateOptimizer([])'
@@ -0,0 +1,164 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A cache of decompositions of two-qubit matrices into operations."""
+
+import collections
+import math
+from typing import Any, List, NamedTuple, Tuple
+
+import numpy as np
+
+from cirq import ops
+from cirq.optimizers import two_qubit_decompositions
+
+CacheInfo = NamedTuple('CacheInfo', [
+    ('hits', int),
+    ('misses', int),
+    ('maxsize', int),
+    ('currsize', int),
+])
+
+# The qubits that cached operations act on, standing in for the actual pair.
+_PLACEHOLDER_QUBITS = (
+    ops.NamedQubit('_kak_q0'),
+    ops.NamedQubit('_kak_q1'),
+)  # type: Tuple[ops.Qid, ops.Qid]
+
+# A canonical matrix and its operations on the placeholder qubits.
+_Entry = Tuple[np.ndarray, Tuple[ops.Operation, ...]]
+
+
+class TwoQubitDecompositionCache:
+    """Remembers how two-qubit matrices decompose into operations.
+
+    Circuits often contain the same two-qubit block many times, e.g. the same
+    pattern of CZs and rotations on every pair of qubits. Decomposing such a
+    block with `cirq.two_qubit_matrix_to_operations` computes a KAK
+    decomposition, which is slow. This cache decomposes each distinct matrix
+    once and replays the resulting operations on whichever qubits later ask
+    for it.
+
+    Matrices are compared up to global phase, and match when their entries
+    agree to within half of the requested absolute tolerance. The other half
+    is left for the decomposition itself, so that reusing an operation list
+    stays within the tolerance. The cache holds a bounded number of matrices,
+    evicting the least recently used one.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """
+        Args:
+            maxsize: The maximum number of decompositions to remember.
+        """
+        self.maxsize = maxsize
+        self._entries = collections.OrderedDict(
+        )  # type: collections.OrderedDict[Any, _Entry]
+        self._hits = 0
+        self._misses = 0
+
+    def two_qubit_matrix_to_operations(self,
+                                       q0: ops.Qid,
+                                       q1: ops.Qid,
+                                       mat: np.ndarray,
+                                       allow_partial_czs: bool,
+                                       atol: float = 1e-8,
+                                       clean_operations: bool = True
+                                      ) -> List[ops.Operation]:
+        """Decomposes a two-qubit operation into Z/XY/CZ gates, reusing an
+        earlier decomposition of a matching matrix if there is one.
+
+        Args:
+            q0: The first qubit being operated on.
+            q1: The other qubit being operated on.
+            mat: Defines the operation to apply to the pair of qubits.
+            allow_partial_czs: Enables the use of Partial-CZ gates.
+            atol: A limit on the amount of absolute error introduced by the
+                construction. Half of it bounds how far the matrix may be from
+                the one whose decomposition is reused, and the other half is
+                given to the decomposition.
+            clean_operations: Enables optimizing resulting operation list by
+                merging operations and ejecting phased Paulis and Z
+                operations.
+
+        Returns:
+            A list of operations implementing the matrix, up to global phase.
+        """
+        # Split the error budget between matching and decomposing.
+        half_atol = atol / 2
+        canonical = _canonical_matrix(mat)
+        key = (allow_partial_czs, atol, clean_operations,
+               _rounded_key(canonical, half_atol))
+
+        entry = self._entries.get(key)
+        if entry is not None and np.allclose(
+                entry[0], canonical, atol=half_atol, rtol=0):
+            self._hits += 1
+            self._entries.move_to_end(key)
+            qubit_map = dict(zip(_PLACEHOLDER_QUBITS, (q0, q1)))
+            return [
+                op.transform_qubits(qubit_map.__getitem__) for op in entry[1]
+            ]
+
+        self._misses += 1
+        operations = two_qubit_decompositions.two_qubit_matrix_to_operations(
+            q0, q1, mat, allow_partial_czs, half_atol, clean_operations)
+        if self.maxsize > 0:
+            qubit_map = dict(zip((q0, q1), _PLACEHOLDER_QUBITS))
+            template = tuple(
+                op.transform_qubits(qubit_map.__getitem__) for op in operations)
+            self._entries[key] = (canonical, template)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return operations
+
+    def cache_info(self) -> CacheInfo:
+        """Returns the hit and miss statistics of the cache.
+
+        Returns:
+            A named tuple with `hits`, `misses`, `maxsize` and `currsize`
+            fields, like the `cache_info` method of `functools.lru_cache`.
+        """
+        return CacheInfo(self._hits, self._misses, self.maxsize,
+                         len(self._entries))
+
+    def clear(self) -> None:
+        """Forgets all decompositions and resets the statistics."""
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def __repr__(self):
+        return 'cirq.TwoQubitDecompositionCache(maxsize={!r})'.format(
+            self.maxsize)
+
+
+def _canonical_matrix(mat: np.ndarray) -> np.ndarray:
+    """Divides out the global phase, making the first large entry (in row major
+    order) real and positive."""
+    flat = np.asarray(mat, dtype=np.complex128).reshape(-1)
+    magnitudes = np.abs(flat)
+    k = int(np.argmax(magnitudes > np.max(magnitudes) / 2))
+    return flat.reshape(4, 4) * (magnitudes[k] / flat[k])
+
+
+def _rounded_key(canonical: np.ndarray, atol: float) -> Any:
+    """Rounds the matrix to a grid about as fine as the tolerance, so that
+    nearly equal matrices usually share a key."""
+    decimals = max(0, int(math.floor(-math.log10(atol)))) if atol > 0 else 15
+    rounded = np.round(canonical, decimals)
+    # Adding zero turns negative zeros, which have a different byte
+    # representation, into positive zeros.
+    return (rounded.real + 0.0).tobytes() + (rounded.imag + 0.0).tobytes()
@@ -0,0 +1,122 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import cirq
+
+
+def assert_implements(operations, q0, q1, matrix):
+    circuit = cirq.Circuit.from_ops(operations)
+    cirq.testing.assert_allclose_up_to_global_phase(
+        circuit.unitary(qubit_order=[q0, q1]), matrix, atol=1e-6)
+
+
+def test_reuses_decomposition_on_other_qubits():
+    a, b, c, d = cirq.LineQubit.range(4)
+    matrix = cirq.unitary(
+        cirq.Circuit.from_ops(cirq.CNOT(a, b),
+                              cirq.Y(a)**0.25,
+                              cirq.ISWAP(a, b)**0.5))
+    cache = cirq.TwoQubitDecompositionCache()
+
+    first = cache.two_qubit_matrix_to_operations(a, b, matrix, True)
+    assert cache.cache_info() == (0, 1, 1024, 1)
+    assert first == cirq.two_qubit_matrix_to_operations(a, b, matrix, True)
+
+    second = cache.two_qubit_matrix_to_operations(d, c, matrix, True)
+    assert cache.cache_info() == (1, 1, 1024, 1)
+    assert_implements(second, d, c, matrix)
+    assert {q for op in second for q in op.qubits} <= {c, d}
+
+    # Global phase is ignored.
+    third = cache.two_qubit_matrix_to_operations(a, b, 1j * matrix, True)
+    assert cache.cache_info().hits == 2
+    assert third == first
+
+
+def test_tolerance_aware_lookup():
+    a, b = cirq.LineQubit.range(2)
+    matrix = cirq.unitary(cirq.CZ**0.3)
+    cache = cirq.TwoQubitDecompositionCache()
+
+    cache.two_qubit_matrix_to_operations(a, b, matrix, True, atol=1e-5)
+    cache.two_qubit_matrix_to_operations(a,
+                                         b,
+                                         matrix + 1e-9,
+                                         True,
+                                         atol=1e-5)
+    assert cache.cache_info().hits == 1
+
+    # Far apart matrices, and different options, don't match.
+    far = cirq.unitary(cirq.CZ**0.31)
+    assert_implements(
+        cache.two_qubit_matrix_to_operations(a, b, far, True, atol=1e-5), a, b,
+        far)
+    cache.two_qubit_matrix_to_operations(a, b, matrix, False, atol=1e-5)
+    cache.two_qubit_matrix_to_operations(a, b, matrix, True, atol=1e-8)
+    assert cache.cache_info() == (1, 4, 1024, 4)
+
+    # Only half of the tolerance is spent on matching, the rest is left to the
+    # decomposition.
+    cache.two_qubit_matrix_to_operations(a,
+                                         b,
+                                         matrix + 7e-6,
+                                         True,
+                                         atol=1e-5)
+    assert cache.cache_info().hits == 1
+
+
+def test_bounded_and_clear():
+    a, b = cirq.LineQubit.range(2)
+    cache = cirq.TwoQubitDecompositionCache(maxsize=2)
+    matrices = [cirq.unitary(cirq.CZ**t) for t in [0.1, 0.2, 0.3]]
+    for m in matrices:
+        cache.two_qubit_matrix_to_operations(a, b, m, True)
+    assert cache.cache_info() == (0, 3, 2, 2)
+
+    # The least recently used matrix was evicted.
+    cache.two_qubit_matrix_to_operations(a, b, matrices[0], True)
+    assert cache.cache_info().misses == 4
+    cache.two_qubit_matrix_to_operations(a, b, matrices[2], True)
+    assert cache.cache_info().hits == 1
+
+    cache.clear()
+    assert cache.cache_info() == (0, 0, 2, 0)
+
+    disabled = cirq.TwoQubitDecompositionCache(maxsize=0)
+    disabled.two_qubit_matrix_to_operations(a, b, matrices[0], True)
+    disabled.two_qubit_matrix_to_operations(a, b, matrices[0], True)
+    assert disabled.cache_info() == (0, 2, 0, 0)
+
+
+def test_merge_interactions_uses_cache():
+    a, b, c, d = cirq.LineQubit.range(4)
+    cache = cirq.TwoQubitDecompositionCache()
+    circuit = cirq.Circuit.from_ops(
+        [cirq.CNOT(a, b), cirq.H(a), cirq.CNOT(a, b)],
+        [cirq.CNOT(c, d), cirq.H(c), cirq.CNOT(c, d)],
+    )
+    expected = circuit.unitary()
+
+    cirq.MergeInteractions(decomposition_cache=cache).optimize_circuit(circuit)
+
+    assert cache.cache_info().hits == 1
+    assert cache.cache_info().misses == 1
+    cirq.testing.assert_allclose_up_to_global_phase(circuit.unitary(),
+                                                    expected,
+                                                    atol=1e-7)
+
+
+def test_repr():
+    assert repr(cirq.TwoQubitDecompositionCache(
+        maxsize=5)) == 'cirq.TwoQubitDecompositionCache(maxsize=5)'
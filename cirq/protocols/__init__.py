@@ -30,7 +30,10 @@ from cirq.protocols.approximate_equality import (
 )
 from cirq.protocols.channel import (
     channel,
+    channel_cache_info,
+    clear_channel_cache,
     has_channel,
+    superoperator,
     SupportsChannel,
 )
 from cirq.protocols.control import (
@@ -43,7 +46,9 @@ from cirq.protocols.circuit_diagram_info import (
     SupportsCircuitDiagramInfo,
 )
 from cirq.protocols.decompose import (
+    clear_decompose_cache,
     decompose,
+    decompose_cache_info,
     decompose_once,
     decompose_once_with_qubits,
     SupportsDecompose,
@@ -56,9 +61,15 @@ from cirq.protocols.inverse import (
 )
 from cirq.protocols.json import (
     to_json,
+    to_json_lines,
     read_json,
+    read_json_lines,
     obj_to_dict_helper,
 )
+from cirq.protocols.binary import (
+    read_binary,
+    to_binary,
+)
 from cirq.protocols.measurement_key import (
     is_measurement,
     measurement_key,
@@ -110,8 +121,10 @@ from cirq.protocols.qid_shape_protocol import (
     SupportsExplicitNumQubits,
 )
 from cirq.protocols.unitary import (
+    clear_unitary_cache,
     SupportsUnitary,
     unitary,
+    unitary_cache_info,
 )
 from cirq.protocols.has_unitary import (
     has_unitary,
@@ -316,3 +316,23 @@ def test_apply_channel_apply_unitary_not_implemented():
                                            out_buffer=out_buf,
                                            auxiliary_buffer0=aux_buf0,
                                            auxiliary_buffer1=aux_buf1))
+
+
+def test_apply_channel_superoperator_two_qubits():
+    state = cirq.testing.random_superposition(8)
+    rho = np.outer(np.conjugate(state), state)
+    us = [cirq.testing.random_unitary(4) for _ in range(3)]
+    full_us = [np.kron(np.eye(2), u) for u in us]
+    expected = sum(np.dot(np.dot(u, rho), np.conjugate(np.transpose(u)))
+                   for u in full_us) / 3
+    rho.shape = (2,) * 6
+    expected.shape = (2,) * 6
+
+    class HasChannel():
+
+        def _channel_(self):
+            return tuple(np.sqrt(1 / 3) * u for u in us)
+
+    result = apply_channel(HasChannel(), rho, [1, 2], [4, 5],
+                           assert_result_is_out_buf=True)
+    np.testing.assert_almost_equal(result, expected)
@@ -31,7 +31,7 @@ import numpy as np
 from typing_extensions import Protocol
 
 from cirq import linalg
-from cirq.protocols import qid_shape_protocol
+from cirq.protocols import qid_shape_protocol, strategy_dispatch
 from cirq.protocols.decompose import _try_decompose_into_operations_and_qubits
 from cirq.type_workarounds import NotImplementedType
 
@@ -302,25 +302,14 @@ def apply_unitary(unitary_value: Any,
 
     # Decide on order to attempt application strategies.
     if len(args.axes) <= 4:
-        strats = [
-            _strat_apply_unitary_from_apply_unitary,
-            _strat_apply_unitary_from_unitary,
-            _strat_apply_unitary_from_decompose
-        ]
+        dispatcher = _small_apply_unitary_dispatcher
     else:
-        strats = [
-            _strat_apply_unitary_from_apply_unitary,
-            _strat_apply_unitary_from_decompose,
-            _strat_apply_unitary_from_unitary
-        ]
+        dispatcher = _large_apply_unitary_dispatcher
 
     # Try each strategy, stopping if one works.
-    for strat in strats:
-        result = strat(unitary_value, args)
-        if result is None:
-            break
-        if result is not NotImplemented:
-            return result
+    result = dispatcher.run(unitary_value, args)
+    if result is not None and result is not NotImplemented:
+        return result
 
     # Don't know how to apply. Fallback to specified default behavior.
     if default is not RaiseTypeErrorIfNotProvided:
@@ -404,6 +393,16 @@ def _strat_apply_unitary_from_decompose(val: Any, args: ApplyUnitaryArgs
     return apply_unitaries(operations, qubits, args, None)
 
 
+_small_apply_unitary_dispatcher = strategy_dispatch.StrategyDispatcher(
+    [('_apply_unitary_', _strat_apply_unitary_from_apply_unitary),
+     ('_unitary_', _strat_apply_unitary_from_unitary),
+     ('_decompose_', _strat_apply_unitary_from_decompose)], NotImplemented)
+_large_apply_unitary_dispatcher = strategy_dispatch.StrategyDispatcher(
+    [('_apply_unitary_', _strat_apply_unitary_from_apply_unitary),
+     ('_decompose_', _strat_apply_unitary_from_decompose),
+     ('_unitary_', _strat_apply_unitary_from_unitary)], NotImplemented)
+
+
 def apply_unitaries(unitary_values: Iterable[Any],
                     qubits: Sequence['cirq.Qid'],
                     args: Optional[ApplyUnitaryArgs] = None,
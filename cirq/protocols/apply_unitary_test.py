@@ -16,7 +16,11 @@ import numpy as np
 import pytest
 
 import cirq
-from cirq.protocols.apply_unitary import _incorporate_result_into_target
+from cirq.protocols.apply_unitary import (
+    _incorporate_result_into_target,
+    _small_apply_unitary_dispatcher,
+    _strat_apply_unitary_from_unitary,
+)
 
 
 def test_apply_unitary_presence_absence():
@@ -459,3 +463,55 @@ def test_incorporate_result_not_view():
 def test_default_method_arguments():
     with pytest.raises(TypeError, match='exactly one of'):
         cirq.ApplyUnitaryArgs.default(1, qid_shape=(2,))
+
+
+def test_apply_unitary_strategy_dispatch():
+
+    class MaybeApplies(cirq.SingleQubitGate):
+
+        def __init__(self, applies):
+            self.applies = applies
+
+        def _apply_unitary_(self, args):
+            if not self.applies:
+                return NotImplemented
+            zero = args.subspace_index(0)
+            one = args.subspace_index(1)
+            args.available_buffer[zero] = args.target_tensor[one]
+            args.available_buffer[one] = args.target_tensor[zero]
+            return args.available_buffer
+
+        def _unitary_(self):
+            return np.array([[1, 0], [0, -1]])
+
+    m = _small_apply_unitary_dispatcher
+    for applies in [False, True, False]:
+        args = cirq.ApplyUnitaryArgs(
+            target_tensor=np.array([1, 2], dtype=np.complex128),
+            available_buffer=np.zeros(2, dtype=np.complex128),
+            axes=[0])
+        result = cirq.apply_unitary(MaybeApplies(applies), args)
+        np.testing.assert_allclose(result, [2, 1] if applies else [1, -2])
+    assert len(m._strats_for(MaybeApplies)) == 2
+
+    class OnlyUnitary:
+
+        def _unitary_(self):
+            return np.array([[0, 1], [1, 0]])
+
+    assert m._strats_for(OnlyUnitary) == (_strat_apply_unitary_from_unitary,)
+
+    class Dynamic:
+
+        def __getattr__(self, name):
+            if name == '_unitary_':
+                return lambda: np.array([[0, 1], [1, 0]])
+            raise AttributeError(name)
+
+    args = cirq.ApplyUnitaryArgs(
+        target_tensor=np.array([1, 2], dtype=np.complex128),
+        available_buffer=np.zeros(2, dtype=np.complex128),
+        axes=[0])
+    np.testing.assert_allclose(cirq.apply_unitary(Dynamic(), args), [2, 1])
+    np.testing.assert_allclose(cirq.unitary(Dynamic()), [[0, 1], [1, 0]])
+    assert cirq.has_unitary(Dynamic())
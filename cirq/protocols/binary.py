@@ -0,0 +1,301 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A compact binary counterpart to the JSON serialization protocol.
+
+The binary format is a numpy `.npz` archive. One member holds a small JSON
+header and the other members hold numeric arrays:
+
+ - Every object supporting the SupportsJSON protocol is written once into an
+   object table and referred to by index everywhere else. Qubits and gates
+   repeated throughout a circuit therefore cost a single table entry.
+ - The operations of a circuit are stored as integer arrays (object indices,
+   arities and a flat array of qubit indices) instead of nested dictionaries.
+ - Arrays of booleans or of integers that are all 0 or 1, such as measurement
+   results, are stored as packed bits along with their dtype.
+
+Objects are rebuilt with the same resolvers used by `cirq.read_json`.
+"""
+
+import json
+from typing import Any, Callable, Dict, List, Optional, Type, Union, cast
+
+import numpy as np
+import sympy
+
+from cirq.protocols.json import (DEFAULT_RESOLVERS, _cirq_object_hook,
+                                 obj_to_dict_helper)
+
+_FORMAT = 'cirq.binary'
+_VERSION = 1
+
+
+def _compact_int_array(values: List[int]) -> np.ndarray:
+    """Stores integers with the smallest dtype that can hold all of them."""
+    if not values:
+        return np.zeros(0, dtype=np.uint8)
+    dtype = np.result_type(np.min_scalar_type(min(values)),
+                           np.min_scalar_type(max(values)))
+    return np.array(values, dtype=dtype)
+
+
+def _is_bit_array(arr: np.ndarray) -> bool:
+    """Whether the array only holds zeros and ones, so that it can be stored
+    as packed bits."""
+    if arr.dtype == np.bool_:
+        return True
+    return arr.dtype.kind in 'iu' and bool(np.all((arr == 0) | (arr == 1)))
+
+
+class _BinaryWriter:
+    """Flattens an object into an object table, a header and arrays."""
+
+    def __init__(self):
+        self.objects = []  # type: List[Any]
+        self.arrays = []  # type: List[np.ndarray]
+        # Objects seen before, by identity. The objects are kept alive in
+        # `_seen` so that their ids cannot be reused.
+        self._ids_by_identity = {}  # type: Dict[int, int]
+        self._seen = []  # type: List[Any]
+        # Objects with identical serialized contents share a table entry.
+        self._ids_by_contents = {}  # type: Dict[str, int]
+
+    def _add_array(self, arr: np.ndarray) -> int:
+        self.arrays.append(arr)
+        return len(self.arrays) - 1
+
+    def object_id(self, o: Any, d: Dict[str, Any]) -> int:
+        """Adds an object with JSON dictionary `d` to the object table."""
+        key = id(o)
+        if key in self._ids_by_identity:
+            return self._ids_by_identity[key]
+        encoded = {k: self.encode(v) for k, v in d.items()}
+        contents = json.dumps(encoded, sort_keys=True)
+        index = self._ids_by_contents.get(contents)
+        if index is None:
+            index = len(self.objects)
+            self.objects.append(encoded)
+            self._ids_by_contents[contents] = index
+        self._ids_by_identity[key] = index
+        self._seen.append(o)
+        return index
+
+    def encode(self, o: Any) -> Any:
+        if o is None or isinstance(o, (bool, int, float, str)):
+            return o
+        if isinstance(o, np.generic):
+            return self.encode(o.item())
+        if isinstance(o, complex):
+            return {'cirq_type': 'complex', 'real': o.real, 'imag': o.imag}
+        if isinstance(o, np.ndarray):
+            if _is_bit_array(o):
+                return {
+                    '@bits': self._add_array(np.packbits(o.ravel())),
+                    'shape': list(o.shape),
+                    'dtype': o.dtype.str,
+                }
+            if o.dtype.hasobject:
+                return self.encode(o.tolist())
+            return {'@array': self._add_array(o)}
+        if isinstance(o, (list, tuple)):
+            return [self.encode(e) for e in o]
+        if isinstance(o, dict):
+            if any(isinstance(k, str) and k.startswith('@') for k in o):
+                return {'@dict': [[k, self.encode(v)] for k, v in o.items()]}
+            return {k: self.encode(v) for k, v in o.items()}
+        if isinstance(o, sympy.Symbol):
+            return {
+                '@ref':
+                self.object_id(
+                    o, obj_to_dict_helper(o, ['name'], namespace='sympy'))
+            }
+        if hasattr(o, '_json_dict_'):
+            from cirq import circuits
+            if type(o) is circuits.Circuit:
+                return self._encode_circuit(o)
+            return {'@ref': self.object_id(o, o._json_dict_())}
+        raise TypeError('Object of type {} is not serializable'.format(
+            type(o).__name__))
+
+    def _ref(self, o: Any) -> int:
+        return self.encode(o)['@ref']
+
+    def _encode_circuit(self, circuit: Any) -> Dict[str, Any]:
+        from cirq import ops
+
+        moment_sizes = []  # type: List[int]
+        # Non-negative entries are gate ids of GateOperations; negative
+        # entries are bitwise complements of ids of other operations.
+        refs = []  # type: List[int]
+        arities = []  # type: List[int]
+        qubits = []  # type: List[int]
+        for moment in circuit:
+            moment_sizes.append(len(moment.operations))
+            for op in moment.operations:
+                if type(op) is ops.GateOperation:
+                    refs.append(self._ref(op.gate))
+                    arities.append(len(op.qubits))
+                    qubits.extend(self._ref(q) for q in op.qubits)
+                else:
+                    refs.append(~self._ref(op))
+                    arities.append(0)
+        return {
+            '@circuit': {
+                'device': self.encode(circuit.device),
+                'moment_sizes': self._add_array(
+                    _compact_int_array(moment_sizes)),
+                'refs': self._add_array(_compact_int_array(refs)),
+                'arities': self._add_array(_compact_int_array(arities)),
+                'qubits': self._add_array(_compact_int_array(qubits)),
+            }
+        }
+
+
+class _BinaryReader:
+    """Rebuilds objects written by _BinaryWriter."""
+
+    def __init__(self, arrays: Any,
+                 resolvers: List[Callable[[str], Union[None, Type]]]):
+        self._arrays = arrays
+        self._resolvers = resolvers
+        self.objects = []  # type: List[Any]
+
+    def _array(self, index: int) -> np.ndarray:
+        return self._arrays['a{}'.format(index)]
+
+    def load_objects(self, entries: List[Dict[str, Any]]) -> None:
+        # Entries only refer to entries before them.
+        for entry in entries:
+            self.objects.append(self.decode(entry))
+
+    def decode(self, v: Any) -> Any:
+        if isinstance(v, list):
+            return [self.decode(e) for e in v]
+        if not isinstance(v, dict):
+            return v
+        if '@ref' in v:
+            return self.objects[v['@ref']]
+        if '@array' in v:
+            return self._array(v['@array'])
+        if '@bits' in v:
+            shape = tuple(v['shape'])
+            bits = np.unpackbits(self._array(v['@bits']))
+            dtype = np.dtype(v.get('dtype', np.bool_))
+            return bits[:int(np.prod(shape))].reshape(shape).astype(dtype)
+        if '@dict' in v:
+            return {k: self.decode(e) for k, e in v['@dict']}
+        if '@circuit' in v:
+            return self._decode_circuit(v['@circuit'])
+        d = {k: self.decode(e) for k, e in v.items()}
+        return _cirq_object_hook(d, self._resolvers)
+
+    def _decode_circuit(self, d: Dict[str, Any]) -> Any:
+        from cirq import circuits, ops
+
+        refs = self._array(d['refs']).tolist()
+        arities = self._array(d['arities']).tolist()
+        qubits = [self.objects[q] for q in self._array(d['qubits']).tolist()]
+        moments = []
+        op_index = 0
+        qubit_index = 0
+        for size in self._array(d['moment_sizes']).tolist():
+            operations = []
+            for ref, arity in zip(refs[op_index:op_index + size],
+                                  arities[op_index:op_index + size]):
+                if ref >= 0:
+                    operations.append(
+                        ops.GateOperation(
+                            self.objects[ref],
+                            qubits[qubit_index:qubit_index + arity]))
+                    qubit_index += arity
+                else:
+                    operations.append(self.objects[~ref])
+            op_index += size
+            moments.append(ops.Moment(operations))
+        return circuits.Circuit(moments, device=self.decode(d['device']))
+
+
+def to_binary(obj: Any, file_or_fn, *, compress: bool = False) -> None:
+    """Write a compact binary file containing a representation of obj.
+
+    Supports the same objects as `cirq.to_json`, i.e. cirq objects and
+    containers of cirq objects that implement the SupportsJSON protocol. The
+    result is a numpy `.npz` archive that can be read back with
+    `cirq.read_binary`.
+
+    Args:
+        obj: An object which can be serialized to a JSON representation.
+        file_or_fn: A filename (if a string), otherwise a binary file-like
+            object to serve as the destination for `obj`.
+        compress: Whether to additionally deflate the archive members.
+    """
+    writer = _BinaryWriter()
+    root = writer.encode(obj)
+    header = json.dumps({
+        'format': _FORMAT,
+        'version': _VERSION,
+        'objects': writer.objects,
+        'root': root,
+    }).encode('utf-8')
+    members = {'header': np.frombuffer(header, dtype=np.uint8)}
+    for i, arr in enumerate(writer.arrays):
+        members['a{}'.format(i)] = arr
+    save = np.savez_compressed if compress else np.savez
+
+    if isinstance(file_or_fn, str):
+        # Opened here so that numpy doesn't append a '.npz' suffix.
+        with open(file_or_fn, 'wb') as actually_a_file:
+            save(actually_a_file, **members)
+        return
+    save(file_or_fn, **members)
+
+
+def read_binary(
+        file_or_fn,
+        resolvers: Optional[List[Callable[[str], Union[None, Type]]]] = None):
+    """Read a binary file written by `cirq.to_binary`.
+
+    Args:
+        file_or_fn: A filename (if a string), otherwise a binary file-like
+            object from which we read in a representation of an object.
+        resolvers: A list of functions that are called in order to turn
+            the serialized `cirq_type` string into a constructable class.
+            See `cirq.read_json` for details.
+
+    Raises:
+        ValueError: The file is not in the cirq binary format.
+    """
+    if resolvers is None:
+        resolvers = cast(List[Callable[[str], Union[None, Type]]],
+                         DEFAULT_RESOLVERS)
+
+    try:
+        archive = np.load(file_or_fn, allow_pickle=False)
+    except (OSError, ValueError):
+        raise ValueError('Not a cirq binary file.')
+    if not isinstance(archive, np.lib.npyio.NpzFile):
+        raise ValueError('Not a cirq binary file.')
+
+    with archive:
+        header = (json.loads(archive['header'].tobytes().decode('utf-8'))
+                  if 'header' in archive.files else None)
+        if not isinstance(header, dict) or header.get('format') != _FORMAT:
+            raise ValueError('Not a cirq binary file.')
+        if header['version'] > _VERSION:
+            raise ValueError(
+                'Unsupported cirq binary format version: {}'.format(
+                    header['version']))
+        reader = _BinaryReader(archive, resolvers)
+        reader.load_objects(header['objects'])
+        return reader.decode(header['root'])
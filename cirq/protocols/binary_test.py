@@ -0,0 +1,231 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+
+import numpy as np
+import pytest
+import sympy
+
+import cirq
+from cirq.protocols.json_test import TEST_OBJECTS
+
+
+def assert_roundtrip(obj, compress=False):
+    buffer = io.BytesIO()
+    cirq.to_binary(obj, buffer, compress=compress)
+    buffer.seek(0)
+    obj2 = cirq.read_binary(buffer)
+    if isinstance(obj, np.ndarray):
+        np.testing.assert_equal(obj, obj2)
+    else:
+        assert obj == obj2
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize('name', sorted(TEST_OBJECTS))
+def test_roundtrip_json_test_objects(name):
+    objs = TEST_OBJECTS[name]
+    if not isinstance(objs, list):
+        objs = [objs]
+    for obj in objs:
+        assert_roundtrip(obj)
+
+
+def test_resolver_cache_types_covered():
+    cache = cirq.protocols.json.RESOLVER_CACHE
+    resolvable = cache.cirq_class_resolver_dictionary
+    covered = set()
+    for objs in TEST_OBJECTS.values():
+        for obj in objs if isinstance(objs, list) else [objs]:
+            covered.add(type(obj))
+    assert set(resolvable.values()) - covered == set()
+
+
+def test_circuit_roundtrip_is_compact():
+    qubits = cirq.GridQubit.rect(4, 4)
+    circuit = cirq.Circuit.from_ops(
+        [cirq.H(q) for q in qubits],
+        [[cirq.CZ(a, b), cirq.X(a)**0.5, cirq.Y(b)**0.25]
+         for _ in range(20)
+         for a, b in zip(qubits, qubits[1:])],
+        cirq.GlobalPhaseOperation(1j),
+        cirq.X(qubits[0])**sympy.Symbol('t'),
+        cirq.measure(*qubits, key='m'),
+    )
+    data = assert_roundtrip(circuit)
+    json_buffer = io.StringIO()
+    cirq.to_json(circuit, json_buffer, indent=None)
+    assert len(data) * 10 < len(json_buffer.getvalue())
+
+    compressed = assert_roundtrip(circuit, compress=True)
+    assert len(compressed) < len(data)
+
+
+def test_circuit_with_device():
+    q = cirq.GridQubit(0, 0)
+    circuit = cirq.Circuit([cirq.Moment(), cirq.Moment([cirq.X(q)])])
+    assert_roundtrip(circuit)
+    assert_roundtrip([circuit, {'circuit': circuit}])
+
+
+def test_trial_result_packs_bits():
+    measurements = {
+        'a': np.random.randint(2, size=(1000, 7)).astype(bool),
+        'b': np.zeros((1000, 0), dtype=bool),
+    }
+    result = cirq.TrialResult(params=cirq.ParamResolver({'x': 1}),
+                              measurements=measurements)
+    data = assert_roundtrip(result)
+    assert len(data) < 7 * 1000 // 8 + 2000
+
+    buffer = io.BytesIO(data)
+    result2 = cirq.read_binary(buffer)
+    assert result2.measurements['a'].dtype == np.bool_
+    np.testing.assert_equal(result2.measurements['a'], measurements['a'])
+    assert result2.measurements['b'].shape == (1000, 0)
+
+
+def test_simulator_measurements_are_packed():
+    qubits = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit.from_ops([cirq.H(q) for q in qubits],
+                                    cirq.measure(*qubits, key='m'))
+    result = cirq.Simulator().run(circuit, repetitions=1000)
+    measurements = result.measurements['m']
+    assert measurements.dtype != np.bool_
+    data = assert_roundtrip(result)
+    # Unpacked, the measurements alone would take 3000 bytes.
+    assert len(data) < 3 * 1000 // 8 + 1000
+
+    result2 = cirq.read_binary(io.BytesIO(data))
+    assert result2.measurements['m'].dtype == measurements.dtype
+    np.testing.assert_equal(result2.measurements['m'], measurements)
+
+
+def test_only_zero_one_integer_arrays_are_packed():
+    for arr in [
+            np.array([[0, 1], [1, 0]], dtype=np.int64),
+            np.array([0, 2, 1], dtype=np.uint8),
+            np.array([-1, 0], dtype=np.int8),
+            np.array([0.0, 1.0]),
+    ]:
+        buffer = io.BytesIO()
+        cirq.to_binary(arr, buffer)
+        buffer.seek(0)
+        restored = cirq.read_binary(buffer)
+        assert restored.dtype == arr.dtype
+        np.testing.assert_equal(restored, arr)
+
+
+def test_shared_objects_are_interned():
+    q = cirq.LineQubit(0)
+    buffer = io.BytesIO()
+    cirq.to_binary([cirq.X(q)**0.5, cirq.X(q)**0.5, q, cirq.LineQubit(0)],
+                   buffer)
+    buffer.seek(0)
+    a, b, c, d = cirq.read_binary(buffer)
+    assert a is b
+    assert c is d
+    assert a.qubits[0] is c
+
+
+def test_special_values():
+    assert_roundtrip({'@ref': 1, 'x': [1j, np.int64(3), np.float32(0.5)]})
+    assert_roundtrip(np.array([[1 + 2j, 3]]))
+    assert_roundtrip(np.array([True, False, True]))
+    symbols = np.array([sympy.Symbol('a')], dtype=object)
+    assert cirq.read_binary(_binary(symbols)) == [sympy.Symbol('a')]
+
+
+def test_not_serializable():
+    with pytest.raises(TypeError, match='not serializable'):
+        cirq.to_binary(object(), io.BytesIO())
+    with pytest.raises(TypeError, match='not serializable'):
+        cirq.to_binary(cirq.Circuit.from_ops(cirq.X(cirq.LineQubit(0))**0.5,
+                                             _NoJson()), io.BytesIO())
+
+
+def test_filename(tmpdir):
+    filename = f'{tmpdir}/circuit.bin'
+    circuit = cirq.Circuit.from_ops(cirq.CNOT(*cirq.LineQubit.range(2)))
+    cirq.to_binary(circuit, filename)
+    assert os.path.exists(filename)
+    assert cirq.read_binary(filename) == circuit
+
+
+def test_read_invalid():
+    with pytest.raises(ValueError, match='Not a cirq binary file'):
+        cirq.read_binary(io.BytesIO(b'definitely not a zip file'))
+
+    buffer = io.BytesIO()
+    np.save(buffer, np.zeros(3))
+    buffer.seek(0)
+    with pytest.raises(ValueError, match='Not a cirq binary file'):
+        cirq.read_binary(buffer)
+
+    buffer = io.BytesIO()
+    np.savez(buffer, x=np.zeros(3))
+    buffer.seek(0)
+    with pytest.raises(ValueError, match='Not a cirq binary file'):
+        cirq.read_binary(buffer)
+
+    buffer = io.BytesIO()
+    header = b'{"format": "cirq.binary", "version": 1000}'
+    np.savez(buffer, header=np.frombuffer(header, dtype=np.uint8))
+    buffer.seek(0)
+    with pytest.raises(ValueError, match='version'):
+        cirq.read_binary(buffer)
+
+
+def test_custom_resolvers():
+
+    class Custom:
+
+        def __init__(self, x):
+            self.x = x
+
+        def __eq__(self, other):
+            return isinstance(other, Custom) and self.x == other.x
+
+        def _json_dict_(self):
+            return {'cirq_type': 'Custom', 'x': self.x}
+
+    buffer = _binary([Custom(5), cirq.LineQubit(1)])
+    with pytest.raises(ValueError, match="Could not resolve type 'Custom'"):
+        cirq.read_binary(buffer)
+
+    buffer.seek(0)
+    resolvers = [lambda name: Custom if name == 'Custom' else None
+                ] + cirq.protocols.json.DEFAULT_RESOLVERS
+    assert cirq.read_binary(buffer, resolvers=resolvers) == [
+        Custom(5), cirq.LineQubit(1)
+    ]
+
+
+class _NoJson(cirq.Operation):
+
+    @property
+    def qubits(self):
+        return ()
+
+    def with_qubits(self, *new_qubits):
+        raise NotImplementedError()
+
+
+def _binary(obj):
+    buffer = io.BytesIO()
+    cirq.to_binary(obj, buffer)
+    buffer.seek(0)
+    return buffer
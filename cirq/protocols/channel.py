@@ -14,12 +14,14 @@
 
 """Protocol and methods for quantum channels."""
 
-from typing import Any, Sequence, Tuple, TypeVar, Union
+from typing import Any, Optional, Sequence, Tuple, TypeVar, Union
 
+import functools
 
 import numpy as np
 from typing_extensions import Protocol
 
+from cirq.protocols import memoization
 from cirq.protocols.mixture import has_mixture_channel
 
 
@@ -33,6 +35,13 @@ from cirq.type_workarounds import NotImplementedType
 # if the user provides a different (np.array([]),) value.
 RaiseTypeErrorIfNotProvided = (np.array([]),)
 
+# Like RaiseTypeErrorIfNotProvided, but used by the superoperator method.
+RaiseTypeErrorIfNotProvidedMatrix = np.array([])  # type: np.ndarray
+
+# The maximum number of channels remembered by `cirq.channel` and
+# `cirq.superoperator`.
+CHANNEL_CACHE_SIZE = 1024
+
 
 TDefault = TypeVar('TDefault')
 
@@ -120,6 +129,27 @@ def channel(val: Any,
             method returned NotImplemented) and also no default value was
             specified.
     """
+    result = (_cached_channel(val)
+              if memoization.is_cacheable(val) else _compute_channel(val))
+    if result is not None:
+        return result
+
+    if default is not RaiseTypeErrorIfNotProvided:
+        return default
+
+    channel_getter = getattr(val, '_channel_', None)
+    mixture_getter = getattr(val, '_mixture_', None)
+    unitary_getter = getattr(val, '_unitary_', None)
+    if (channel_getter is None and unitary_getter is None
+            and mixture_getter is None):
+        raise TypeError("object of type '{}' has no _channel_ or _mixture_ or "
+                        "_unitary_ method.".format(type(val)))
+    raise TypeError("object of type '{}' does have a _channel_, _mixture_ or "
+                "_unitary_ method, but it returned NotImplemented."
+                .format(type(val)))
+
+
+def _compute_channel(val: Any) -> Optional[Tuple[np.ndarray, ...]]:
     channel_getter = getattr(val, '_channel_', None)
     channel_result = (
         NotImplemented if channel_getter is None else channel_getter())
@@ -138,16 +168,97 @@ def channel(val: Any,
     if unitary_result is not NotImplemented and unitary_result is not None:
         return (unitary_result,)
 
-    if default is not RaiseTypeErrorIfNotProvided:
+    return None
+
+
+@functools.lru_cache(maxsize=CHANNEL_CACHE_SIZE, typed=True)
+def _cached_channel(val: Any) -> Optional[Tuple[np.ndarray, ...]]:
+    result = _compute_channel(val)
+    if result is None:
+        return None
+    return tuple(_read_only_copy(m) for m in result)
+
+
+def superoperator(val: Any,
+                  default: TDefault = RaiseTypeErrorIfNotProvidedMatrix
+                 ) -> Union[np.ndarray, TDefault]:
+    r"""Returns the superoperator matrix of the channel of the given value.
+
+    If the channel has Krauss operators {A_0, A_1, ..., A_{r-1}}, this is the
+    d^2 by d^2 matrix
+        \sum_{k=0}^{r-1} A_k \otimes A_k^*
+    which maps the (row-major) flattening of a density matrix \rho onto the
+    flattening of \sum_k A_k \rho A_k^\dagger. Composing channels corresponds
+    to multiplying their superoperators.
+
+    Superoperators (and Krauss operators) of hashable, non-parameterized gates
+    on at most four qubits that use value equality are memoized, and returned
+    as read-only arrays. See `cirq.channel_cache_info`.
+
+    Args:
+        val: The value to describe by a superoperator.
+        default: Determines the fallback behavior when `val` doesn't have
+            a channel. If `default` is not set, a TypeError is raised. If
+            default is set to a value, that value is returned.
+
+    Returns:
+        The superoperator of the channel returned by `cirq.channel(val)`, if
+        there is one. Otherwise the default value, if one was specified.
+
+    Raises:
+        TypeError: `val` doesn't have a channel and no default value was
+            specified.
+    """
+    if memoization.is_cacheable(val):
+        result = _cached_superoperator(val)
+    else:
+        krauss = _compute_channel(val)
+        result = None if krauss is None else _superoperator_from_krauss(krauss)
+    if result is not None:
+        return result
+    if default is not RaiseTypeErrorIfNotProvidedMatrix:
         return default
+    raise TypeError("object of type '{}' has no _channel_, _mixture_ or "
+                    "_unitary_ method (or they returned NotImplemented)."
+                    .format(type(val)))
 
-    if (channel_getter is None and unitary_getter is None
-            and mixture_getter is None):
-        raise TypeError("object of type '{}' has no _channel_ or _mixture_ or "
-                        "_unitary_ method.".format(type(val)))
-    raise TypeError("object of type '{}' does have a _channel_, _mixture_ or "
-                "_unitary_ method, but it returned NotImplemented."
-                .format(type(val)))
+
+@functools.lru_cache(maxsize=CHANNEL_CACHE_SIZE, typed=True)
+def _cached_superoperator(val: Any) -> Optional[np.ndarray]:
+    krauss = _cached_channel(val)
+    if krauss is None:
+        return None
+    return _read_only_copy(_superoperator_from_krauss(krauss))
+
+
+def _superoperator_from_krauss(krauss: Sequence[np.ndarray]) -> np.ndarray:
+    return sum(np.kron(k, np.conj(k)) for k in krauss)
+
+
+def _read_only_copy(matrix: np.ndarray) -> np.ndarray:
+    result = np.array(matrix)
+    result.flags.writeable = False
+    return result
+
+
+def channel_cache_info() -> Tuple['functools._CacheInfo', ...]:
+    """Returns the statistics of the `cirq.channel` and `cirq.superoperator`
+    caches.
+
+    Returns:
+        A pair of named tuples with `hits`, `misses`, `maxsize` and `currsize`
+        fields, as returned by the `cache_info` method of
+        `functools.lru_cache`. The first describes the cache of Krauss
+        operators, and the second the cache of superoperators.
+    """
+    return _cached_channel.cache_info(), _cached_superoperator.cache_info()
+
+
+def clear_channel_cache() -> None:
+    """Forgets all channels memoized by `cirq.channel` and
+    `cirq.superoperator`."""
+    _cached_channel.cache_clear()
+    _cached_superoperator.cache_clear()
 
 
 def has_channel(val: Any) -> bool:
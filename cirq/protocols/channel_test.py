@@ -154,3 +154,53 @@ def test_has_channel():
             return True
 
     assert cirq.has_channel(HasUnitary())
+
+
+def test_superoperator():
+    a = np.array([[0, 1], [0, 0]])
+    b = np.array([[1, 0], [0, 0]])
+
+    class HasChannel:
+
+        def _channel_(self):
+            return (a, b)
+
+    superop = cirq.superoperator(HasChannel())
+    assert superop.shape == (4, 4)
+    rho = np.array([[0.25, 0.5j], [-0.5j, 0.75]])
+    expected = (a @ rho @ a.conj().T) + (b @ rho @ b.conj().T)
+    np.testing.assert_allclose(np.dot(superop, rho.reshape(4)).reshape(2, 2),
+                               expected)
+
+    np.testing.assert_allclose(cirq.superoperator(cirq.X),
+                               np.kron(cirq.unitary(cirq.X),
+                                       cirq.unitary(cirq.X)))
+
+    class NoMethod:
+        pass
+
+    assert cirq.superoperator(NoMethod(), None) is None
+    with pytest.raises(TypeError, match='no _channel_'):
+        _ = cirq.superoperator(NoMethod())
+
+
+def test_channel_cache():
+    cirq.clear_channel_cache()
+    channel = cirq.depolarize(0.25)
+    krauss = cirq.channel(channel)
+    assert cirq.channel(cirq.depolarize(0.25)) is krauss
+    assert all(not k.flags.writeable for k in krauss)
+
+    superop = cirq.superoperator(channel)
+    assert cirq.superoperator(cirq.depolarize(0.25)) is superop
+    assert not superop.flags.writeable
+    np.testing.assert_allclose(superop,
+                               sum(np.kron(k, np.conj(k)) for k in krauss))
+
+    krauss_info, superop_info = cirq.channel_cache_info()
+    assert (krauss_info.hits, krauss_info.misses) == (2, 1)
+    assert (superop_info.hits, superop_info.misses) == (1, 1)
+
+    cirq.clear_channel_cache()
+    assert cirq.channel_cache_info()[0].currsize == 0
+    assert cirq.channel_cache_info()[1].currsize == 0
@@ -20,6 +20,7 @@ from typing import (
     Iterable,
     List,
     Optional,
+    cast,
     overload,
     Sequence,
     Tuple,
@@ -27,6 +28,8 @@ from typing import (
     Union,
 )
 from collections import defaultdict
+import functools
+
 from typing_extensions import Protocol
 
 from cirq import devices, ops
@@ -45,6 +48,9 @@ TError = TypeVar('TError', bound=Exception)
 
 RaiseTypeErrorIfNotProvided: Any = ([],)
 
+# The maximum number of gate decompositions remembered by `cirq.decompose`.
+DECOMPOSE_CACHE_SIZE = 1024
+
 
 def _value_error_describing_bad_operation(op: 'cirq.Operation') -> ValueError:
     return ValueError(
@@ -121,9 +127,105 @@ class SupportsDecomposeWithQubits(Protocol):
 
 def _default_decomposer(op: 'cirq.Operation'
                         ) -> Union[None, 'cirq.OP_TREE', NotImplementedType]:
+    if type(op) is ops.GateOperation:
+        gate = cast(ops.GateOperation, op).gate
+        if _is_cacheable_gate(gate):
+            qid_shape = tuple(q.dimension for q in op.qubits)
+            result = _decompose_gate_once(type(gate), gate, qid_shape)
+            if result is None:
+                return NotImplemented
+            qubit_map = dict(zip(_placeholders(qid_shape), op.qubits))
+            return [
+                placed.transform_qubits(lambda q: qubit_map.get(q, q))
+                for placed in result
+            ]
     return decompose_once(op, default=NotImplemented)
 
 
+def _is_cacheable_gate(gate: 'cirq.Gate') -> bool:
+    if getattr(gate, '_value_equality_values_', None) is None:
+        return False
+    if getattr(gate, '_decompose_depends_on_qubits_', False):
+        return False
+    try:
+        hash(gate)
+    except TypeError:
+        return False
+    return True
+
+
+class _PlaceholderQid(ops.Qid):
+    """A stand-in for the qubits of a cached gate decomposition.
+
+    Placeholders have no notion of adjacency or position, so decompositions
+    computed on them can be moved onto any qubits with the same qid shape.
+    """
+
+    def __init__(self, index: int, dimension: int) -> None:
+        self._index = index
+        self._dimension = dimension
+
+    def _comparison_key(self):
+        return self._index
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    def __repr__(self):
+        return 'cirq.protocols.decompose._PlaceholderQid({}, {})'.format(
+            self._index, self._dimension)
+
+
+def _placeholders(qid_shape: Tuple[int, ...]) -> List['cirq.Qid']:
+    return [_PlaceholderQid(i, d) for i, d in enumerate(qid_shape)]
+
+
+def _decompose_gate_on_placeholders(gate_type: type, gate: 'cirq.Gate',
+                                    qid_shape: Tuple[int, ...]
+                                   ) -> Optional[Tuple['cirq.Operation', ...]]:
+    """Decomposes a gate once onto placeholder qubits, or returns None.
+
+    The result only depends on the gate and the qid shape of its qubits, so
+    it is shared by every operation applying an equal gate. Gates whose
+    decomposition depends on the qubits they act on (e.g. `cirq.CCZ` avoids
+    interactions between non-adjacent qubits) opt out by setting a true
+    `_decompose_depends_on_qubits_` attribute. The `gate_type` argument keeps
+    equal gates of different types, which may decompose differently, apart in
+    the cache.
+    """
+    decomposed = decompose_once_with_qubits(gate, _placeholders(qid_shape),
+                                            None)
+    if decomposed is None:
+        return None
+    # Without `preserve_moments`, only operations are yielded.
+    return tuple(
+        cast(Iterable['cirq.Operation'], ops.flatten_op_tree(decomposed)))
+
+
+_decompose_gate_once = functools.lru_cache(maxsize=DECOMPOSE_CACHE_SIZE)(
+    _decompose_gate_on_placeholders)
+
+
+def decompose_cache_info() -> 'functools._CacheInfo':
+    """Returns the hit and miss statistics of the `cirq.decompose` cache.
+
+    `cirq.decompose` remembers how hashable gates using value equality
+    decompose, and reuses that decomposition for later operations applying an
+    equal gate to any qubits with the same qid shape.
+
+    Returns:
+        A named tuple with `hits`, `misses`, `maxsize` and `currsize` fields, as
+        returned by the `cache_info` method of `functools.lru_cache`.
+    """
+    return _decompose_gate_once.cache_info()
+
+
+def clear_decompose_cache() -> None:
+    """Forgets all decompositions memoized by `cirq.decompose`."""
+    _decompose_gate_once.cache_clear()
+
+
 # pylint: disable=function-redefined
 @overload
 def decompose(
@@ -248,10 +350,12 @@ def decompose(
                 return r
         return NotImplemented
 
+    # Items are expanded depth-first, using an explicit stack whose end holds
+    # the next item to process.
     output = []
-    queue: List[Any] = [val]
-    while queue:
-        item = queue.pop(0)
+    stack: List[Any] = [val]
+    while stack:
+        item = stack.pop()
 
         if isinstance(item, ops.Operation) and keep is not None and keep(item):
             output.append(item)
@@ -259,11 +363,11 @@ def decompose(
 
         decomposed = decomposer(item)
         if decomposed is not NotImplemented and decomposed is not None:
-            queue[:0] = ops.flatten_op_tree(decomposed)
+            stack.extend(reversed(list(ops.flatten_op_tree(decomposed))))
             continue
 
         if (not isinstance(item, ops.Operation) and isinstance(item, Iterable)):
-            queue[:0] = ops.flatten_op_tree(item)
+            stack.extend(reversed(list(ops.flatten_op_tree(item))))
             continue
 
         if keep is not None and on_stuck_raise is not None:
@@ -239,3 +239,87 @@ def test_decompose_intercept():
         keep=lambda op: isinstance(op.gate, cirq.CNotPowGate),
         intercepting_decomposer=lambda _: NotImplemented)
     assert actual == [cirq.CNOT(a, b), cirq.CNOT(b, a), cirq.CNOT(a, b)]
+
+
+def test_decompose_deep_tree():
+
+    class Nested(cirq.SingleQubitGate):
+
+        def __init__(self, depth):
+            self.depth = depth
+
+        def _decompose_(self, qubits):
+            if self.depth == 0:
+                return cirq.X(*qubits)
+            return [Nested(self.depth - 1).on(*qubits), cirq.Z(*qubits)]
+
+    q = cirq.LineQubit(0)
+    result = cirq.decompose(Nested(3000).on(q))
+    assert result == [cirq.X(q)] + [cirq.Z(q)] * 3000
+
+
+def test_decompose_cache():
+
+    @cirq.value_equality
+    class Counted(cirq.TwoQubitGate):
+        calls = 0
+
+        def _value_equality_values_(self):
+            return ()
+
+        def _decompose_(self, qubits):
+            Counted.calls += 1
+            a, b = qubits
+            return [cirq.CZ(a, b), cirq.X(b)]
+
+    cirq.clear_decompose_cache()
+    a, b, c = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit.from_ops(Counted().on(a, b), Counted().on(a, b),
+                                    Counted().on(b, c))
+    keep = lambda op: not isinstance(op.gate, Counted)
+    assert cirq.decompose(circuit, keep=keep) == [
+        cirq.CZ(a, b), cirq.X(b),
+        cirq.CZ(a, b), cirq.X(b),
+        cirq.CZ(b, c), cirq.X(c),
+    ]
+    # Operations on different qubits share the cached decomposition.
+    assert Counted.calls == 1
+    info = cirq.decompose_cache_info()
+    assert (info.hits, info.misses) == (2, 1)
+
+    # Gates without a decomposition are remembered too.
+    assert cirq.decompose(cirq.CZ(a, c)) == [cirq.CZ(a, c)]
+    assert cirq.decompose(cirq.CZ(a, c)) == [cirq.CZ(a, c)]
+    assert cirq.decompose_cache_info()[:2] == (3, 2)
+
+    cirq.clear_decompose_cache()
+    assert cirq.decompose_cache_info().currsize == 0
+
+
+def test_decompose_cache_respects_qubit_dependent_gates():
+
+    @cirq.value_equality
+    class ByQubit(cirq.SingleQubitGate):
+        _decompose_depends_on_qubits_ = True
+
+        def _value_equality_values_(self):
+            return ()
+
+        def _decompose_(self, qubits):
+            q, = qubits
+            return [cirq.X(q) if q == cirq.LineQubit(0) else cirq.Z(q)]
+
+    cirq.clear_decompose_cache()
+    a, b = cirq.LineQubit.range(2)
+    assert cirq.decompose([ByQubit().on(a), ByQubit().on(b)]) == [
+        cirq.X(a), cirq.Z(b)
+    ]
+    assert cirq.decompose_cache_info().currsize == 0
+
+    # CCZ avoids the interaction between non-adjacent qubits.
+    c = cirq.LineQubit(2)
+    for qubits in [(a, b, c), (b, a, c), (a, c, b)]:
+        for op in cirq.decompose(cirq.CCZ(*qubits)):
+            if len(op.qubits) == 2:
+                x, y = op.qubits
+                assert x.is_adjacent(y)
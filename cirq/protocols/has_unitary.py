@@ -22,7 +22,7 @@ from typing import (
 import numpy as np
 from typing_extensions import Protocol
 
-from cirq.protocols import qid_shape_protocol
+from cirq.protocols import qid_shape_protocol, strategy_dispatch
 from cirq.protocols.apply_unitary import ApplyUnitaryArgs
 from cirq.protocols.decompose import _try_decompose_into_operations_and_qubits
 from cirq import linalg
@@ -97,17 +97,10 @@ def has_unitary(val: Any) -> bool:
     Returns:
         Whether or not `val` has a unitary effect.
     """
-    strats = [
-        _strat_has_unitary_from_has_unitary, _strat_has_unitary_from_decompose,
-        _strat_has_unitary_from_apply_unitary, _strat_has_unitary_from_unitary
-    ]
-    for strat in strats:
-        result = strat(val)
-        if result is not None:
-            return result
+    result = _has_unitary_dispatcher.run(val)
 
     # If you can't tell that it's unitary, it's not unitary.
-    return False
+    return bool(result)
 
 
 def _strat_has_unitary_from_has_unitary(val: Any) -> Optional[bool]:
@@ -153,3 +146,10 @@ def _strat_has_unitary_from_apply_unitary(val: Any) -> Optional[bool]:
     if result is NotImplemented:
         return None
     return result is not None
+
+
+_has_unitary_dispatcher = strategy_dispatch.StrategyDispatcher(
+    [('_has_unitary_', _strat_has_unitary_from_has_unitary),
+     ('_decompose_', _strat_has_unitary_from_decompose),
+     ('_apply_unitary_', _strat_has_unitary_from_apply_unitary),
+     ('_unitary_', _strat_has_unitary_from_unitary)], None)
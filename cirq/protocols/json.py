@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
+import gzip
+import io
 import json
 from typing import Union, Any, Dict, Optional, List, Callable, Type, cast, \
-    TYPE_CHECKING, Iterable
+    TYPE_CHECKING, Iterable, Iterator
 
 import numpy as np
 import sympy
@@ -57,6 +60,7 @@ class _ResolverCache:
                 'MeasurementGate': cirq.MeasurementGate,
                 'Moment': cirq.Moment,
                 'NamedQubit': cirq.NamedQubit,
+                'ParamResolver': cirq.ParamResolver,
                 '_PauliX': cirq.ops.pauli_gates._PauliX,
                 '_PauliY': cirq.ops.pauli_gates._PauliY,
                 '_PauliZ': cirq.ops.pauli_gates._PauliZ,
@@ -65,6 +69,7 @@ class _ResolverCache:
                 'SingleQubitPauliStringGateOperation':
                 cirq.SingleQubitPauliStringGateOperation,
                 'SwapPowGate': cirq.SwapPowGate,
+                'TrialResult': cirq.TrialResult,
                 'sympy.Symbol': sympy.Symbol,
                 '_UnconstrainedDevice':
                 cirq.devices.unconstrained_device._UnconstrainedDevice,
@@ -271,3 +276,113 @@ def read_json(
             return json.load(file, object_hook=obj_hook)
 
     return json.load(file_or_fn, object_hook=obj_hook)
+
+
+@contextlib.contextmanager
+def _open_text(file_or_fn, mode: str, compress: Optional[bool]):
+    """Opens a filename or wraps a file-like object for reading or writing
+    text, optionally through gzip.
+
+    If `compress` is None, gzip is used for filenames ending in '.gz'.
+    """
+    if isinstance(file_or_fn, str):
+        if compress is None:
+            compress = file_or_fn.endswith('.gz')
+        if compress:
+            with gzip.open(file_or_fn, mode + 't', encoding='utf-8') as file:
+                yield file
+        else:
+            with open(file_or_fn, mode, encoding='utf-8') as file:
+                yield file
+        return
+
+    if not compress:
+        yield file_or_fn
+        return
+    with gzip.GzipFile(fileobj=file_or_fn, mode=mode + 'b') as binary:
+        text = io.TextIOWrapper(cast(Any, binary), encoding='utf-8')
+        try:
+            yield text
+        finally:
+            # Flush without closing the caller's file object.
+            text.flush()
+            text.detach()
+
+
+def to_json_lines(objs: Iterable[Any],
+                  file_or_fn,
+                  *,
+                  compress: Optional[bool] = None,
+                  cls=CirqEncoder) -> None:
+    """Write a newline-delimited JSON file with one line per object.
+
+    Objects are serialized one at a time as they are drawn from `objs`, so
+    arbitrarily long streams (e.g. generators) can be written without
+    holding them in memory. Use `cirq.read_json_lines` to read them back.
+
+    Args:
+        objs: The objects to serialize. Each must be serializable by
+            `cirq.to_json`.
+        file_or_fn: A filename (if a string), otherwise a file-like
+            object to serve as the destination. File-like objects must
+            accept text, unless `compress` is set in which case they must
+            accept bytes.
+        compress: Whether to gzip the output. Defaults to compressing only
+            when `file_or_fn` is a filename ending in '.gz'.
+        cls: The JSON encoder class; see `cirq.to_json`.
+    """
+    encoder = cls()
+    with _open_text(file_or_fn, 'w', compress) as file:
+        for obj in objs:
+            line = encoder.encode(obj)
+            file.write(line)
+            file.write('\n')
+
+
+def read_json_lines(
+        file_or_fn,
+        resolvers: Optional[List[Callable[[str], Union[None, Type]]]] = None,
+        *,
+        compress: Optional[bool] = None) -> Iterator[Any]:
+    """Lazily read the objects in a newline-delimited JSON file.
+
+    Objects are deserialized one line at a time as the returned iterator is
+    advanced, so files far larger than memory can be processed. The
+    resolution of `cirq_type` names is cached across all records.
+
+    Args:
+        file_or_fn: A filename (if a string), otherwise a file-like
+            object from which lines are read. File-like objects must produce
+            text, unless `compress` is set in which case they must produce
+            bytes.
+        resolvers: A list of functions that are called in order to turn
+            the serialized `cirq_type` string into a constructable class.
+            See `cirq.read_json` for details.
+        compress: Whether the input is gzipped. Defaults to decompressing
+            only when `file_or_fn` is a filename ending in '.gz'.
+
+    Yields:
+        The deserialized object on each non-empty line.
+    """
+    all_resolvers = cast(List[Callable[[str], Union[None, Type]]],
+                         DEFAULT_RESOLVERS if resolvers is None else resolvers)
+
+    resolved = {}  # type: Dict[str, Union[None, Type]]
+
+    def cached_resolver(cirq_type: str) -> Union[None, Type]:
+        if cirq_type not in resolved:
+            for resolver in all_resolvers:
+                cls = resolver(cirq_type)
+                if cls is not None:
+                    break
+            else:
+                cls = None
+            resolved[cirq_type] = cls
+        return resolved[cirq_type]
+
+    decoder = json.JSONDecoder(
+        object_hook=lambda d: _cirq_object_hook(d, [cached_resolver]))
+    with _open_text(file_or_fn, 'r', compress) as file:
+        for line in file:
+            if line.strip():
+                yield decoder.decode(line)
@@ -109,6 +109,74 @@ def test_fail_to_resolve():
                    "during deserialization")
 
 
+
+def _json_lines_records():
+    q0, q1 = cirq.LineQubit.range(2)
+    yield cirq.Circuit.from_ops(cirq.H(q0), cirq.CNOT(q0, q1),
+                                cirq.measure(q0, q1, key='m'))
+    yield cirq.TrialResult(params=cirq.ParamResolver({'t': 0.25}),
+                           measurements={'m': np.array([[True, False]])})
+    yield {'note': 'plain values are fine too', 'values': [1, 2.5]}
+    yield 1j
+
+
+def test_json_lines_roundtrip():
+    buffer = io.StringIO()
+    cirq.to_json_lines(_json_lines_records(), buffer)
+    text = buffer.getvalue()
+    assert text.count('\n') == 4
+    buffer.seek(0)
+    assert list(cirq.read_json_lines(buffer)) == list(_json_lines_records())
+
+
+def test_json_lines_lazy():
+    buffer = io.StringIO()
+    cirq.to_json_lines([cirq.LineQubit(0), cirq.LineQubit(1)], buffer)
+    buffer.write('\n{"cirq_type": "MyCustomClass"}\n')
+    buffer.seek(0)
+
+    records = cirq.read_json_lines(buffer)
+    assert next(records) == cirq.LineQubit(0)
+    assert next(records) == cirq.LineQubit(1)
+    with pytest.raises(ValueError, match="Could not resolve type"):
+        next(records)
+
+
+def test_json_lines_resolvers_cached():
+    calls = []
+
+    def resolver(cirq_type):
+        calls.append(cirq_type)
+        return cirq.protocols.json._cirq_class_resolver(cirq_type)
+
+    buffer = io.StringIO()
+    cirq.to_json_lines((cirq.LineQubit(i) for i in range(10)), buffer)
+    buffer.seek(0)
+    assert list(cirq.read_json_lines(
+        buffer, resolvers=[resolver])) == cirq.LineQubit.range(10)
+    assert calls == ['LineQubit']
+
+
+def test_json_lines_gzip(tmpdir):
+    filename = f'{tmpdir}/records.ndjson.gz'
+    cirq.to_json_lines(_json_lines_records(), filename)
+    with open(filename, 'rb') as file:
+        assert file.read(2) == b'\x1f\x8b'
+    assert list(
+        cirq.read_json_lines(filename)) == list(_json_lines_records())
+
+    filename = f'{tmpdir}/records.ndjson'
+    cirq.to_json_lines(_json_lines_records(), filename)
+    assert list(
+        cirq.read_json_lines(filename)) == list(_json_lines_records())
+
+    buffer = io.BytesIO()
+    cirq.to_json_lines(_json_lines_records(), buffer, compress=True)
+    assert not buffer.closed
+    buffer.seek(0)
+    assert list(cirq.read_json_lines(
+        buffer, compress=True)) == list(_json_lines_records())
+
 QUBITS = cirq.LineQubit.range(5)
 Q0, Q1, Q2, Q3, Q4 = QUBITS
 
@@ -205,6 +273,14 @@ TEST_OBJECTS = {
         }),
         cirq.X(Q0) * cirq.Y(Q1) * 123
     ],
+    'ParamResolver': [
+        cirq.ParamResolver(),
+        cirq.ParamResolver({
+            'a': 0.5,
+            sympy.Symbol('b'): 0.25,
+            'c': sympy.Symbol('d'),
+        }),
+    ],
     'PhasedXPowGate':
     cirq.PhasedXPowGate(phase_exponent=0.123,
                         exponent=0.456,
@@ -228,6 +304,13 @@ TEST_OBJECTS = {
     cirq.T,
     'TOFFOLI':
     cirq.TOFFOLI,
+    'TrialResult': [
+        cirq.TrialResult(params=cirq.ParamResolver({'t': 0.5}),
+                         measurements={
+                             'a': np.array([[True, False], [False, True]]),
+                             'b': np.array([[True], [True]]),
+                         }),
+    ],
     'UNCONSTRAINED_DEVICE':
     cirq.UNCONSTRAINED_DEVICE,
     '_QubitAsQid': [
@@ -261,6 +344,7 @@ SHOULDNT_BE_SERIALIZED = [
 
     # Circuit optimizers are function-like. Only attributes
     # are ignore_failures, tolerance, and other feature flags
+    'CancelCommutingGates',
     'ConvertToCzAndSingleGates',
     'ConvertToIonGates',
     'ConvertToNeutralAtomGates',
@@ -271,7 +355,11 @@ SHOULDNT_BE_SERIALIZED = [
     'ExpandComposite',
     'MergeInteractions',
     'MergeSingleQubitGates',
+    'PassManager',
     'PointOptimizer',
+    'RepeatUntilStable',
+    'TemplateOptimizer',
+    'TwoQubitDecompositionCache',
 
     # global objects
     'CONTROL_TAG',
@@ -313,6 +401,10 @@ SHOULDNT_BE_SERIALIZED = [
     'ParamDictType',
 
     # utility:
+    'CircuitStats',
+    'PassManagerReport',
+    'PassRecord',
+    'SimulationCheckpointStore',
     'Unique',
 ]
 
@@ -399,6 +491,7 @@ NOT_YET_SERIALIZABLE = [
     'InsertStrategy',
     'IonDevice',
     'KakDecomposition',
+    'KakDecompositionBatch',
     'LinearCombinationOfGates',
     'LinearCombinationOfOperations',
     'LinearDict',
@@ -407,7 +500,6 @@ NOT_YET_SERIALIZABLE = [
     'NO_NOISE',
     'NeutralAtomDevice',
     'ParallelGateOperation',
-    'ParamResolver',
     'PauliInteractionGate',
     'PauliStringExpectation',
     'PauliStringPhasor',
@@ -424,19 +516,23 @@ NOT_YET_SERIALIZABLE = [
     'QasmOutput',
     'QubitOrder',
     'ResetChannel',
+    'RewriteTemplate',
     'Schedule',
     'ScheduledOperation',
+    'SimulationCheckpoint',
     'SimulationTrialResult',
     'Simulator',
     'SingleQubitCliffordGate',
     'SingleQubitMatrixGate',
+    'SparseAmplitudeSimulator',
+    'SparseAmplitudeStep',
     'SparseSimulatorStep',
     'StateVectorMixin',
     'TextDiagramDrawer',
     'ThreeQubitDiagonalGate',
     'Timestamp',
-    'TrialResult',
     'TwoQubitMatrixGate',
+    'UnitarySimulator',
     'UnitSweep',
     'WaveFunctionSimulatorState',
     'WaveFunctionTrialResult',
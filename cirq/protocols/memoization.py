@@ -0,0 +1,55 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Decides which values protocols may memoize results for."""
+
+from typing import Any
+
+import numpy as np
+
+from cirq import ops
+from cirq.protocols import qid_shape_protocol
+from cirq.protocols.resolve_parameters import is_parameterized
+
+# Only gates on at most this many qubits (or on qudits with at most the same
+# total dimension) are memoized, so that cached matrices stay small.
+CACHE_MAX_QUBITS = 4
+
+
+def is_cacheable(val: Any) -> bool:
+    """Determines if protocol results for the value may be memoized.
+
+    Memoized values are gates on at most `CACHE_MAX_QUBITS` qubits that use
+    `cirq.value_equality`, are hashable and aren't parameterized. Operations
+    aren't memoized: `cirq.GateOperation` gets its results from its gate.
+
+    Args:
+        val: The value a protocol is being evaluated on.
+
+    Returns:
+        Whether results computed for the value can be cached, keyed by the
+        value's type and equality.
+    """
+    if not isinstance(val, ops.Gate):
+        return False
+    if getattr(val, '_value_equality_values_', None) is None:
+        return False
+    shape = qid_shape_protocol.qid_shape(val, None)
+    if shape is None or np.prod(shape, dtype=int) > 2**CACHE_MAX_QUBITS:
+        return False
+    try:
+        hash(val)
+    except TypeError:
+        return False
+    return not is_parameterized(val)
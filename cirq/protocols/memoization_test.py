@@ -0,0 +1,38 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sympy
+
+import cirq
+from cirq.protocols.memoization import is_cacheable
+
+
+def test_is_cacheable():
+    a, b = cirq.LineQubit.range(2)
+    assert is_cacheable(cirq.X**0.5)
+    assert is_cacheable(cirq.CCZ)
+    assert is_cacheable(cirq.depolarize(0.1))
+
+    assert not is_cacheable(cirq.CZ(a, b))
+    assert not is_cacheable(cirq.X**sympy.Symbol('t'))
+    assert not is_cacheable(cirq.IdentityGate(5))
+    assert not is_cacheable(cirq.SingleQubitMatrixGate(cirq.unitary(cirq.H)))
+
+    @cirq.value_equality(unhashable=True)
+    class Unhashable(cirq.SingleQubitGate):
+
+        def _value_equality_values_(self):
+            return ()
+
+    assert not is_cacheable(Unhashable())
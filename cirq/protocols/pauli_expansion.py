@@ -75,9 +75,5 @@ def pauli_expansion(
                     .format(val, type(val)))
         return default
 
-    num_qubits = matrix.shape[0].bit_length() - 1
-    basis = operator_spaces.kron_bases(operator_spaces.PAULI_BASIS,
-                                       repeat=num_qubits)
-
-    expansion = operator_spaces.expand_matrix_in_orthogonal_basis(matrix, basis)
+    expansion = operator_spaces.expand_matrix_in_pauli_basis(matrix)
     return expansion.clean(atol=atol)
@@ -0,0 +1,72 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Dispatch of protocols to the strategies that apply to a type of value."""
+
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+
+class StrategyDispatcher:
+    """Remembers which strategies of a protocol apply to each type of value.
+
+    Protocols try a list of strategies in order until one of them is
+    conclusive, and each strategy starts by looking up a magic method on the
+    value. The dispatcher looks those methods up once per concrete type and
+    afterwards jumps straight to the strategies whose methods the type
+    defines, preserving their order. Types that customize attribute lookup
+    (via `__getattr__`) always get every strategy.
+    """
+
+    def __init__(self, strats: Sequence[Tuple[str, Callable]],
+                 inconclusive: Any) -> None:
+        """
+        Args:
+            strats: The strategies to try, in order of preference, each paired
+                with the name of the magic method it depends upon.
+            inconclusive: The value returned by a strategy that doesn't know
+                how to handle the given value.
+        """
+        self._strats = tuple(strats)
+        self._inconclusive = inconclusive
+        self._table = {}  # type: Dict[type, Tuple[Callable, ...]]
+
+    def _strats_for(self, cls: type) -> Tuple[Callable, ...]:
+        result = self._table.get(cls)
+        if result is None:
+            if hasattr(cls, '__getattr__'):
+                result = tuple(strat for _, strat in self._strats)
+            else:
+                result = tuple(
+                    strat for name, strat in self._strats
+                    if getattr(cls, name, None) is not None)
+            self._table[cls] = result
+        return result
+
+    def run(self, val: Any, *args: Any) -> Any:
+        """Returns the result of the first conclusive strategy.
+
+        Args:
+            val: The value the protocol is being evaluated on. Passed as the
+                first argument of each strategy.
+            *args: Any additional arguments to pass to the strategies.
+
+        Returns:
+            The result of the first conclusive strategy, or the inconclusive
+            value if none of the strategies is conclusive.
+        """
+        for strat in self._strats_for(type(val)):
+            result = strat(val, *args)
+            if result is not self._inconclusive:
+                return result
+        return self._inconclusive
@@ -0,0 +1,69 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from cirq.protocols.strategy_dispatch import StrategyDispatcher
+
+
+def _from_a(val, *args):
+    return val._a_(*args)
+
+
+def _from_b(val, *args):
+    return val._b_(*args)
+
+
+def test_runs_defined_strategies_in_order():
+    dispatcher = StrategyDispatcher([('_a_', _from_a), ('_b_', _from_b)],
+                                    None)
+
+    class OnlyB:
+
+        def _b_(self, x):
+            return 'b', x
+
+    class Both:
+
+        def __init__(self, a_result):
+            self.a_result = a_result
+
+        def _a_(self, x):
+            return self.a_result
+
+        def _b_(self, x):
+            return 'b', x
+
+    class Neither:
+        pass
+
+    assert dispatcher.run(OnlyB(), 1) == ('b', 1)
+    assert dispatcher._strats_for(OnlyB) == (_from_b,)
+    assert dispatcher.run(Both('a'), 2) == 'a'
+    # Inconclusive strategies fall through to the next one.
+    assert dispatcher.run(Both(None), 3) == ('b', 3)
+    assert dispatcher.run(Neither()) is None
+    assert dispatcher._strats_for(Neither) == ()
+
+
+def test_dynamic_attributes_get_every_strategy():
+    dispatcher = StrategyDispatcher([('_a_', _from_a), ('_b_', _from_b)],
+                                    NotImplemented)
+
+    class Dynamic:
+
+        def __getattr__(self, name):
+            if name == '_b_':
+                return lambda: 'b'
+            raise AttributeError(name)
+
+    assert dispatcher._strats_for(Dynamic) == (_from_a, _from_b)
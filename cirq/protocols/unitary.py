@@ -20,12 +20,17 @@ from typing import (
     Optional,
 )
 
+import functools
+
 import numpy as np
 from typing_extensions import Protocol
 
 from cirq import linalg
-from cirq.protocols import qid_shape_protocol
-from cirq.protocols.apply_unitary import ApplyUnitaryArgs, apply_unitaries
+from cirq.protocols import memoization, qid_shape_protocol, strategy_dispatch
+from cirq.protocols.apply_unitary import (
+    ApplyUnitaryArgs,
+    apply_unitaries,
+)
 from cirq.protocols.decompose import _try_decompose_into_operations_and_qubits
 from cirq.type_workarounds import NotImplementedType
 
@@ -41,6 +46,9 @@ RaiseTypeErrorIfNotProvided = np.array([])  # type: np.ndarray
 
 TDefault = TypeVar('TDefault')
 
+# The maximum number of matrices remembered by `cirq.unitary`.
+UNITARY_CACHE_SIZE = 1024
+
 
 class SupportsUnitary(Protocol):
     """An object that may be describable by a unitary matrix."""
@@ -102,6 +110,14 @@ def unitary(val: Any,
     a unitary effect. The order in which techniques are attempted is
     unspecified.
 
+    Matrices of hashable, non-parameterized gates on at most four qubits that
+    use value equality (such as `cirq.X**0.5` or `cirq.CZ`) are memoized in a
+    bounded least-recently used cache, keyed by the gate's type and equality.
+    Operations are not cached themselves, but operations like `cirq.CZ(a, b)`
+    get their matrices from their cached gates. These matrices are
+    returned as read-only arrays shared between calls; copy them before
+    modifying them. See `cirq.unitary_cache_info`.
+
     Args:
         val: The value to describe with a unitary matrix.
         default: Determines the fallback behavior when `val` doesn't have
@@ -116,16 +132,9 @@ def unitary(val: Any,
         TypeError: `val` doesn't have a unitary effect and no default value was
             specified.
     """
-    strats = [
-        _strat_unitary_from_unitary, _strat_unitary_from_apply_unitary,
-        _strat_unitary_from_decompose
-    ]
-    for strat in strats:
-        result = strat(val)
-        if result is None:
-            break
-        if result is not NotImplemented:
-            return result
+    result = _unitary_or_none(val)
+    if result is not None:
+        return result
 
     if default is not RaiseTypeErrorIfNotProvided:
         return default
@@ -145,6 +154,44 @@ def unitary(val: Any,
         "besides None or NotImplemented.".format(type(val), val))
 
 
+def unitary_cache_info() -> 'functools._CacheInfo':
+    """Returns the hit and miss statistics of the `cirq.unitary` cache.
+
+    Returns:
+        A named tuple with `hits`, `misses`, `maxsize` and `currsize` fields, as
+        returned by the `cache_info` method of `functools.lru_cache`.
+    """
+    return _cached_unitary.cache_info()
+
+
+def clear_unitary_cache() -> None:
+    """Forgets all matrices memoized by `cirq.unitary` and resets its stats."""
+    _cached_unitary.cache_clear()
+
+
+def _unitary_or_none(val: Any) -> Optional[np.ndarray]:
+    if memoization.is_cacheable(val):
+        return _cached_unitary(val)
+    return _compute_unitary(val)
+
+
+@functools.lru_cache(maxsize=UNITARY_CACHE_SIZE, typed=True)
+def _cached_unitary(val: Any) -> Optional[np.ndarray]:
+    result = _compute_unitary(val)
+    if result is not None:
+        # Copy so that freezing the array can't affect the value's own state.
+        result = np.array(result)
+        result.flags.writeable = False
+    return result
+
+
+def _compute_unitary(val: Any) -> Optional[np.ndarray]:
+    result = _unitary_dispatcher.run(val)
+    if result is NotImplemented:
+        return None
+    return result
+
+
 def _strat_unitary_from_unitary(val: Any) -> Optional[np.ndarray]:
     """Attempts to compute a value's unitary via its _unitary_ method."""
     getter = getattr(val, '_unitary_', None)
@@ -196,3 +243,9 @@ def _strat_unitary_from_decompose(val: Any) -> Optional[np.ndarray]:
         return None
     state_len = np.prod(val_qid_shape, dtype=int)
     return result.reshape((state_len, state_len))
+
+
+_unitary_dispatcher = strategy_dispatch.StrategyDispatcher(
+    [('_unitary_', _strat_unitary_from_unitary),
+     ('_apply_unitary_', _strat_unitary_from_apply_unitary),
+     ('_decompose_', _strat_unitary_from_decompose)], NotImplemented)
@@ -15,6 +15,7 @@ from typing import Optional
 
 import numpy as np
 import pytest
+import sympy
 
 import cirq
 
@@ -297,3 +298,76 @@ def test_unitary_from_apply_unitary():
                                np.array([[0, 1], [1, 0]]))
     assert cirq.unitary(ApplyGateNotUnitary(), default=None) is None
     assert cirq.unitary(UnknownType(), default=None) is None
+
+
+def test_unitary_cache():
+    cirq.clear_unitary_cache()
+    assert cirq.unitary_cache_info().currsize == 0
+
+    first = cirq.unitary(cirq.X**0.5)
+    second = cirq.unitary(cirq.XPowGate(exponent=0.5))
+    assert first is second
+    assert not first.flags.writeable
+    with pytest.raises(ValueError):
+        first[0, 0] = 0
+    info = cirq.unitary_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    # Equal values of different types are cached separately.
+    phased = cirq.PhasedXPowGate(phase_exponent=0, exponent=0.5)
+    assert phased == cirq.X**0.5
+    phased_unitary = cirq.unitary(phased)
+    assert phased_unitary is not first
+    np.testing.assert_allclose(phased_unitary, first, atol=1e-8)
+
+    cirq.clear_unitary_cache()
+    assert cirq.unitary_cache_info() == (0, 0, cirq.unitary_cache_info()[2], 0)
+
+
+def test_unitary_cache_skips_uncacheable_values():
+    cirq.clear_unitary_cache()
+    assert cirq.unitary(ReturnsMatrix()) is m1
+    assert cirq.unitary(cirq.X**sympy.Symbol('t'), None) is None
+
+    @cirq.value_equality(unhashable=True)
+    class Unhashable:
+
+        def _value_equality_values_(self):
+            return ()
+
+        def _unitary_(self):
+            return m1
+
+    assert cirq.unitary(Unhashable()) is m1
+    assert cirq.unitary_cache_info().currsize == 0
+
+
+def test_unitary_cache_does_not_freeze_value_state():
+
+    @cirq.value_equality
+    class Holder(cirq.SingleQubitGate):
+
+        def __init__(self):
+            self.matrix = np.eye(2)
+
+        def _value_equality_values_(self):
+            return ()
+
+        def _unitary_(self):
+            return self.matrix
+
+    cirq.clear_unitary_cache()
+    holder = Holder()
+    assert not cirq.unitary(holder).flags.writeable
+    assert holder.matrix.flags.writeable
+
+
+def test_unitary_cache_only_holds_small_gates():
+    cirq.clear_unitary_cache()
+    a, b = cirq.LineQubit.range(2)
+    assert cirq.unitary(cirq.CZ(a, b)) is cirq.unitary(cirq.CZ(b, a))
+    assert cirq.unitary_cache_info().currsize == 1
+
+    assert cirq.unitary(cirq.IdentityGate(5)) is not cirq.unitary(
+        cirq.IdentityGate(5))
+    assert cirq.unitary_cache_info().currsize == 1
@@ -14,6 +14,11 @@
 
 """Base simulation classes and generic simulators."""
 
+from cirq.sim.checkpoint import (
+    SimulationCheckpoint,
+    SimulationCheckpointStore,
+)
+
 from cirq.sim.density_matrix_utils import (
     measure_density_matrix,
     sample_density_matrix,
@@ -28,6 +33,10 @@ from cirq.sim.density_matrix_simulator import (
     DensityMatrixTrialResult,
 )
 
+from cirq.sim.light_cone import (
+    prune_to_light_cone,
+)
+
 from cirq.sim.mux import (
     final_wavefunction,
     sample,
@@ -43,11 +52,20 @@ from cirq.sim.simulator import (
     StepResult,
 )
 
+from cirq.sim.sparse_amplitude_simulator import (
+    SparseAmplitudeSimulator,
+    SparseAmplitudeStep,
+)
+
 from cirq.sim.sparse_simulator import (
     Simulator,
     SparseSimulatorStep,
 )
 
+from cirq.sim.unitary_simulator import (
+    UnitarySimulator,
+)
+
 from cirq.sim.wave_function_simulator import (
     SimulatesIntermediateWaveFunction,
     WaveFunctionSimulatorState,
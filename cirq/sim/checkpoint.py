@@ -0,0 +1,205 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""On-disk checkpoints of intermediate wave functions."""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Type
+
+import hashlib
+import os
+
+import numpy as np
+
+from cirq import circuits, ops, protocols
+
+
+class SimulationCheckpoint:
+    """The wave function of a simulation after a given moment.
+
+    Attributes:
+        moment_index: The index of the last moment that was simulated before
+            the checkpoint was written.
+        state: The state tensor, memory mapped read-only from disk.
+        qubits: The qubits of the simulation, in the order used to define
+            the axes of `state`.
+        measurements: The most recent measurement results for each key
+            recorded up to and including `moment_index`.
+        rng_state: The state of numpy's global random number generator at
+            the time the checkpoint was written.
+    """
+
+    def __init__(self, moment_index: int, state: np.ndarray,
+                 qubits: Sequence[ops.Qid], measurements: Dict[str, List[int]],
+                 rng_state: tuple):
+        self.moment_index = moment_index
+        self.state = state
+        self.qubits = tuple(qubits)
+        self.measurements = measurements
+        self.rng_state = rng_state
+
+
+class SimulationCheckpointStore:
+    """Saves and restores intermediate wave functions of `cirq.Simulator`.
+
+    Every `interval` moments the simulator writes the state tensor as a raw
+    `.npy` file (through a numpy memmap, so the state is never copied into a
+    second in-memory buffer) together with a small JSON file holding the
+    qubit order, the measurement results so far and the state of numpy's
+    random number generator.
+
+    Checkpoints are keyed by a digest of the qubit order, the dtype, the
+    initial state and the moments simulated so far. Operations with a unitary
+    enter the digest through their qubits and matrix, and other operations
+    through their repr. Only operations with value equality can be digested,
+    so moments from the first one containing any other operation onwards are
+    never checkpointed. A later simulation of any circuit sharing a
+    checkpointed prefix (including the same circuit, after an interrupted
+    run) starts from the deepest matching checkpoint instead of from the
+    initial state.
+    """
+
+    def __init__(self, directory: str, *, interval: int = 1):
+        """Initializes the store.
+
+        Args:
+            directory: The directory to write checkpoints to. It is created if
+                it does not exist.
+            interval: The number of moments between checkpoints.
+
+        Raises:
+            ValueError: The interval is not positive.
+        """
+        if interval < 1:
+            raise ValueError(
+                'interval must be positive but was {}'.format(interval))
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.interval = interval
+
+    def prefix_keys(self, circuit: circuits.Circuit, qubits: Sequence[ops.Qid],
+                    initial_state: Any,
+                    dtype: Type[np.number]) -> List[Optional[str]]:
+        """Returns the checkpoint key for each prefix of the circuit.
+
+        The i'th key identifies the state after simulating moments 0 to i. It
+        is None if one of those moments contains an operation that can't be
+        identified across runs.
+        """
+        digest = hashlib.sha256()
+        digest.update(repr(tuple(qubits)).encode())
+        digest.update(np.dtype(dtype).str.encode())
+        if isinstance(initial_state, np.ndarray):
+            digest.update(np.ascontiguousarray(initial_state).tobytes())
+        else:
+            digest.update(repr(initial_state).encode())
+        keys = []  # type: List[Optional[str]]
+        for moment in circuit:
+            for op in moment:
+                fingerprint = _operation_fingerprint(op)
+                if fingerprint is None:
+                    return keys + [None] * (len(circuit) - len(keys))
+                digest.update(len(fingerprint).to_bytes(8, 'little'))
+                digest.update(fingerprint)
+            digest.update(b'|')
+            keys.append(digest.hexdigest())
+        return keys
+
+    def should_save(self, moment_index: int) -> bool:
+        """Determines if the state after the given moment is checkpointed."""
+        return (moment_index + 1) % self.interval == 0
+
+    def save(self, key: str, moment_index: int, state: np.ndarray,
+             qubits: Sequence[ops.Qid],
+             measurements: Dict[str, List[int]]) -> None:
+        """Writes a checkpoint.
+
+        The state file is written before the metadata file, and both are
+        moved into place atomically, so an interrupted write never leaves a
+        checkpoint that `load` would accept.
+        """
+        path = self._path(key)
+        tmp_npy = path + '.tmp.npy'
+        out = np.lib.format.open_memmap(tmp_npy,
+                                        mode='w+',
+                                        dtype=state.dtype,
+                                        shape=state.shape)
+        out[...] = state
+        out.flush()
+        del out
+        os.replace(tmp_npy, path + '.npy')
+
+        name, keys, pos, has_gauss, cached_gaussian = np.random.get_state()
+        meta = {
+            'moment_index': moment_index,
+            'qubits': list(qubits),
+            'measurements': {k: [int(e) for e in v]
+                             for k, v in measurements.items()},
+            'rng_state': {
+                'name': name,
+                'keys': [int(e) for e in keys],
+                'pos': int(pos),
+                'has_gauss': int(has_gauss),
+                'cached_gaussian': float(cached_gaussian),
+            },
+        }
+        tmp_json = path + '.tmp.json'
+        protocols.to_json(meta, tmp_json)
+        os.replace(tmp_json, path + '.json')
+
+    def load(self, key: str) -> Optional[SimulationCheckpoint]:
+        """Reads the checkpoint with the given key, if it exists."""
+        path = self._path(key)
+        if not os.path.exists(path + '.json'):
+            return None
+        meta = protocols.read_json(path + '.json')
+        rng = meta['rng_state']
+        return SimulationCheckpoint(
+            moment_index=meta['moment_index'],
+            state=np.load(path + '.npy', mmap_mode='r'),
+            qubits=meta['qubits'],
+            measurements=meta['measurements'],
+            rng_state=(rng['name'], np.array(rng['keys'], dtype=np.uint32),
+                       rng['pos'], rng['has_gauss'], rng['cached_gaussian']))
+
+    def latest(self, keys: Iterable[Optional[str]]
+              ) -> Optional[SimulationCheckpoint]:
+        """Returns the deepest existing checkpoint among the prefix keys."""
+        for key in reversed(list(keys)):
+            checkpoint = None if key is None else self.load(key)
+            if checkpoint is not None:
+                return checkpoint
+        return None
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+
+def _operation_fingerprint(op: ops.Operation) -> Optional[bytes]:
+    """Bytes identifying what an operation does, the same in every run.
+
+    Returns None for operations without value equality. Their reprs, like
+    `<Foo object at 0x...>`, don't identify them across runs.
+    """
+    values = [op]  # type: List[Any]
+    if isinstance(op, ops.GateOperation):
+        values.append(op.gate)
+    if any(getattr(v, '_value_equality_values_', None) is None
+           for v in values):
+        return None
+    if protocols.has_unitary(op):
+        # Reprs of large arrays are truncated, so use the matrix itself.
+        matrix = np.ascontiguousarray(protocols.unitary(op),
+                                      dtype=np.complex128)
+        return repr(op.qubits).encode() + matrix.tobytes()
+    return repr(op).encode()
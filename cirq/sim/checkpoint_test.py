@@ -0,0 +1,255 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import numpy as np
+import pytest
+
+import cirq
+
+
+def _circuit():
+    a, b, c = cirq.LineQubit.range(3)
+    return cirq.Circuit([
+        cirq.Moment([cirq.H(a)]),
+        cirq.Moment([cirq.CNOT(a, b)]),
+        cirq.Moment([cirq.Y(c)**0.25]),
+        cirq.Moment([cirq.CZ(b, c)**0.5]),
+        cirq.Moment([cirq.X(a)**0.3]),
+    ])
+
+
+def test_invalid_interval(tmpdir):
+    with pytest.raises(ValueError, match='positive'):
+        cirq.SimulationCheckpointStore(str(tmpdir), interval=0)
+
+
+def test_creates_directory(tmpdir):
+    path = os.path.join(str(tmpdir), 'a', 'b')
+    store = cirq.SimulationCheckpointStore(path)
+    assert os.path.isdir(path)
+    assert store.directory == path
+    assert store.interval == 1
+
+
+def test_prefix_keys(tmpdir):
+    store = cirq.SimulationCheckpointStore(str(tmpdir))
+    circuit = _circuit()
+    qubits = sorted(circuit.all_qubits())
+    keys = store.prefix_keys(circuit, qubits, 0, np.complex64)
+    assert len(keys) == len(circuit)
+    assert len(set(keys)) == len(keys)
+
+    # Shared prefixes share keys.
+    longer = circuit + cirq.Circuit.from_ops(cirq.Z(qubits[0]))
+    longer_keys = store.prefix_keys(longer, qubits, 0, np.complex64)
+    assert longer_keys[:len(keys)] == keys
+
+    # Anything else that changes the state changes all keys.
+    for other in [
+            store.prefix_keys(circuit, qubits[::-1], 0, np.complex64),
+            store.prefix_keys(circuit, qubits, 1, np.complex64),
+            store.prefix_keys(circuit, qubits, 0, np.complex128),
+            store.prefix_keys(circuit, qubits,
+                              np.array([0, 1, 0, 0, 0, 0, 0, 0]), np.complex64),
+    ]:
+        assert not set(other) & set(keys)
+
+
+def test_save_and_load(tmpdir):
+    store = cirq.SimulationCheckpointStore(str(tmpdir))
+    assert store.load('missing') is None
+    assert store.latest(['a', 'b']) is None
+
+    qubits = cirq.LineQubit.range(2)
+    state = np.array([[0, 1j], [0, 0]], dtype=np.complex64)
+    np.random.seed(5)
+    store.save('a', 3, state, qubits, {'m': [1, 0]})
+    expected_draw = np.random.random()
+
+    checkpoint = store.load('a')
+    assert checkpoint.moment_index == 3
+    assert checkpoint.qubits == tuple(qubits)
+    assert checkpoint.measurements == {'m': [1, 0]}
+    np.testing.assert_equal(checkpoint.state, state)
+    assert checkpoint.state.dtype == np.complex64
+    assert not checkpoint.state.flags.writeable
+
+    np.random.seed(6)
+    np.random.set_state(checkpoint.rng_state)
+    assert np.random.random() == expected_draw
+
+    assert store.latest(['a', 'b']).moment_index == 3
+    store.save('b', 4, state, qubits, {})
+    assert store.latest(['a', 'b']).moment_index == 4
+    assert sorted(os.listdir(str(tmpdir))) == [
+        'a.json', 'a.npy', 'b.json', 'b.npy'
+    ]
+
+
+@pytest.mark.parametrize('interval', [1, 2, 3, 5])
+def test_simulate_writes_checkpoints(tmpdir, interval):
+    store = cirq.SimulationCheckpointStore(str(tmpdir), interval=interval)
+    circuit = _circuit()
+    expected = cirq.Simulator().simulate(circuit).final_state
+    result = cirq.Simulator(checkpoint_store=store).simulate(circuit)
+    np.testing.assert_allclose(result.final_state, expected, atol=1e-6)
+
+    num_files = len(os.listdir(str(tmpdir)))
+    assert num_files == 2 * (len(circuit) // interval)
+
+
+def test_resume_skips_checkpointed_moments(tmpdir):
+    store = cirq.SimulationCheckpointStore(str(tmpdir), interval=2)
+    circuit = _circuit()
+    simulator = cirq.Simulator(checkpoint_store=store)
+    first = [
+        step.state_vector().copy()
+        for step in simulator.simulate_moment_steps(circuit)
+    ]
+    assert len(first) == 5
+
+    # The state after moment 3 is checkpointed, so only moment 4 is rerun.
+    second = [
+        step.state_vector().copy()
+        for step in simulator.simulate_moment_steps(circuit)
+    ]
+    assert len(second) == 1
+    np.testing.assert_allclose(second[-1], first[-1], atol=1e-6)
+
+
+def test_resume_fully_checkpointed_circuit(tmpdir):
+    store = cirq.SimulationCheckpointStore(str(tmpdir))
+    circuit = _circuit()
+    simulator = cirq.Simulator(checkpoint_store=store)
+    expected = simulator.simulate(circuit).final_state
+    steps = list(simulator.simulate_moment_steps(circuit))
+    assert len(steps) == 1
+    np.testing.assert_allclose(steps[0].state_vector(), expected, atol=1e-6)
+
+
+def test_shared_prefix_is_cached(tmpdir):
+    store = cirq.SimulationCheckpointStore(str(tmpdir))
+    circuit = _circuit()
+    simulator = cirq.Simulator(checkpoint_store=store)
+    simulator.simulate(circuit)
+
+    extra = cirq.Circuit.from_ops(cirq.Z(cirq.LineQubit(0))**0.125)
+    steps = list(simulator.simulate_moment_steps(circuit + extra))
+    assert len(steps) == 1
+    np.testing.assert_allclose(steps[0].state_vector(),
+                               cirq.Simulator().simulate(circuit +
+                                                         extra).final_state,
+                               atol=1e-6)
+
+
+def test_resume_restores_measurements_and_random_state(tmpdir):
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit([
+        cirq.Moment([cirq.H(a)]),
+        cirq.Moment([cirq.measure(a, key='a')]),
+        cirq.Moment([cirq.H(b)]),
+        cirq.Moment([cirq.measure(b, key='b')]),
+    ])
+    store = cirq.SimulationCheckpointStore(str(tmpdir), interval=2)
+    simulator = cirq.Simulator(checkpoint_store=store)
+
+    np.random.seed(3)
+    expected = simulator.simulate(circuit)
+
+    # Remove the final checkpoint so that the last two moments are rerun.
+    keys = store.prefix_keys(circuit, [a, b], 0, np.complex64)
+    os.remove(os.path.join(str(tmpdir), keys[-1] + '.json'))
+
+    np.random.seed(4)
+    resumed = simulator.simulate(circuit)
+    assert resumed.measurements == expected.measurements
+    np.testing.assert_allclose(resumed.final_state,
+                               expected.final_state,
+                               atol=1e-6)
+
+    # Results from before the checkpoint aren't reported as new results.
+    os.remove(os.path.join(str(tmpdir), keys[-1] + '.json'))
+    steps = list(simulator.simulate_moment_steps(circuit))
+    assert len(steps) == 2
+    assert steps[0].restored_measurements == {
+        'a': list(expected.measurements['a'])
+    }
+    assert 'a' not in steps[0].measurements
+    assert steps[1].restored_measurements == {}
+
+
+def test_run_ignores_checkpoints(tmpdir):
+    a = cirq.LineQubit(0)
+    circuit = cirq.Circuit.from_ops(cirq.H(a), cirq.measure(a, key='a'),
+                                    cirq.H(a), cirq.measure(a, key='b'))
+    store = cirq.SimulationCheckpointStore(str(tmpdir))
+    simulator = cirq.Simulator(checkpoint_store=store)
+    result = simulator.run(circuit, repetitions=100)
+    assert os.listdir(str(tmpdir)) == []
+    assert 0 < np.sum(result.measurements['b']) < 100
+
+
+def test_large_matrices_have_distinct_keys(tmpdir):
+
+    @cirq.value_equality
+    class FiveQubitGate(cirq.Gate):
+
+        def __init__(self, matrix):
+            self.matrix = matrix
+
+        def num_qubits(self):
+            return 5
+
+        def _unitary_(self):
+            return self.matrix
+
+        def _value_equality_values_(self):
+            return self.matrix.tobytes()
+
+        def __repr__(self):
+            return 'FiveQubitGate({!r})'.format(self.matrix)
+
+    flipped = np.eye(32)
+    flipped[16, 16] = -1
+    gates = [FiveQubitGate(np.eye(32)), FiveQubitGate(flipped)]
+    # The reprs of the matrices are truncated to the same text.
+    assert repr(gates[0]) == repr(gates[1])
+
+    qubits = cirq.LineQubit.range(5)
+    store = cirq.SimulationCheckpointStore(str(tmpdir))
+    keys = [
+        store.prefix_keys(cirq.Circuit.from_ops(gate.on(*qubits)), qubits, 0,
+                          np.complex64) for gate in gates
+    ]
+    assert keys[0] != keys[1]
+
+
+def test_operations_without_value_equality_are_not_checkpointed(tmpdir):
+
+    class Opaque(cirq.SingleQubitGate):
+
+        def _unitary_(self):
+            return np.array([[0, 1], [1, 0]])
+
+    a = cirq.LineQubit(0)
+    circuit = cirq.Circuit.from_ops(cirq.H(a), Opaque().on(a), cirq.X(a))
+    store = cirq.SimulationCheckpointStore(str(tmpdir))
+    keys = store.prefix_keys(circuit, [a], 0, np.complex64)
+    assert keys[0] is not None
+    assert keys[1:] == [None, None]
+
+    cirq.Simulator(checkpoint_store=store).simulate(circuit)
+    assert len(os.listdir(str(tmpdir))) == 2
@@ -0,0 +1,79 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Restricting circuits to the operations that can affect their outputs."""
+
+from typing import Callable, List, Optional, Set
+
+import bisect
+
+from cirq import circuits, ops, protocols
+
+
+def _is_measurement_or_display(op: ops.Operation) -> bool:
+    return (protocols.is_measurement(op) or
+            isinstance(op, (ops.SamplesDisplay, ops.WaveFunctionDisplay,
+                            ops.DensityMatrixDisplay)))
+
+
+def prune_to_light_cone(
+        circuit: circuits.Circuit,
+        is_target: Optional[Callable[[ops.Operation], bool]] = None,
+) -> circuits.Circuit:
+    """Removes the operations outside the past light cone of the targets.
+
+    An operation is in the past light cone of the target operations if it is
+    a target, or if it shares a qubit with a later operation in the light
+    cone. Operations outside of the light cone cannot influence the
+    statistics of the targets, so they can be dropped before simulating. Any
+    qubit that is only acted on outside of the light cone disappears from the
+    returned circuit, shrinking the simulated state.
+
+    The moment structure of the circuit is preserved, although some moments
+    may become empty.
+
+    Args:
+        circuit: The circuit to prune.
+        is_target: Determines which operations are targets. Defaults to
+            measurements and displays.
+
+    Returns:
+        A circuit containing only the operations in the past light cone of
+        the targets.
+    """
+    if is_target is None:
+        is_target = _is_measurement_or_display
+    target_moments = sorted(
+        {i for i, _ in circuit.findall_operations(is_target)})
+    kept = [[] for _ in range(len(circuit))]  # type: List[List[ops.Operation]]
+    active = set()  # type: Set[ops.Qid]
+
+    end = len(circuit)
+    while True:
+        # The latest earlier moment that has a target or extends the cone.
+        k = bisect.bisect_left(target_moments, end)
+        index = target_moments[k - 1] if k else None
+        if active:
+            prev = circuit.prev_moment_operating_on(tuple(active), end)
+            if prev is not None and (index is None or prev > index):
+                index = prev
+        if index is None:
+            break
+        for op in circuit[index].operations:
+            if is_target(op) or not active.isdisjoint(op.qubits):
+                kept[index].append(op)
+                active.update(op.qubits)
+        end = index
+
+    return circuits.Circuit(ops.Moment(operations) for operations in kept)
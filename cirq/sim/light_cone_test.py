@@ -0,0 +1,104 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import numpy as np
+
+import cirq
+
+
+def test_prune_empty():
+    assert cirq.prune_to_light_cone(cirq.Circuit()) == cirq.Circuit()
+
+
+def test_prune_without_targets_removes_everything():
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit.from_ops(cirq.H(a), cirq.CNOT(a, b))
+    assert cirq.prune_to_light_cone(circuit) == cirq.Circuit(
+        [cirq.Moment(), cirq.Moment()])
+
+
+def test_prune_keeps_past_light_cone():
+    a, b, c, d = cirq.LineQubit.range(4)
+    circuit = cirq.Circuit([
+        cirq.Moment([cirq.H(a), cirq.H(c), cirq.H(d)]),
+        cirq.Moment([cirq.CNOT(a, b), cirq.X(d)]),
+        cirq.Moment([cirq.CNOT(b, c)]),
+        cirq.Moment([cirq.measure(a, key='a'),
+                     cirq.Y(b)]),
+        cirq.Moment([cirq.X(a)]),
+    ])
+    assert cirq.prune_to_light_cone(circuit) == cirq.Circuit([
+        cirq.Moment([cirq.H(a)]),
+        cirq.Moment([cirq.CNOT(a, b)]),
+        cirq.Moment(),
+        cirq.Moment([cirq.measure(a, key='a')]),
+        cirq.Moment(),
+    ])
+
+    circuit.append(cirq.Moment([cirq.measure(c, key='c')]))
+    assert cirq.prune_to_light_cone(circuit) == cirq.Circuit([
+        cirq.Moment([cirq.H(a), cirq.H(c)]),
+        cirq.Moment([cirq.CNOT(a, b)]),
+        cirq.Moment([cirq.CNOT(b, c)]),
+        cirq.Moment([cirq.measure(a, key='a')]),
+        cirq.Moment(),
+        cirq.Moment([cirq.measure(c, key='c')]),
+    ])
+
+
+def test_prune_displays_and_custom_targets():
+    a, b = cirq.LineQubit.range(2)
+    display = cirq.pauli_string_expectation(cirq.Z(b), num_samples=1)
+    circuit = cirq.Circuit.from_ops(cirq.H(a), cirq.X(b), display)
+    assert cirq.prune_to_light_cone(circuit) == cirq.Circuit([
+        cirq.Moment([cirq.X(b)]),
+        cirq.Moment([display]),
+    ])
+    assert cirq.prune_to_light_cone(
+        circuit, lambda op: op == cirq.H(a)) == cirq.Circuit([
+            cirq.Moment([cirq.H(a)]),
+            cirq.Moment(),
+        ])
+
+
+def test_pruned_run_distribution_unchanged():
+    qubits = cirq.LineQubit.range(6)
+    circuit = cirq.Circuit.from_ops(
+        [cirq.H(q) for q in qubits],
+        [cirq.CZ(a, b)**0.5 for a, b in zip(qubits, qubits[1:])],
+        [cirq.X(q)**0.3 for q in qubits],
+        cirq.measure(qubits[0], qubits[1], key='m'),
+    )
+    pruned = cirq.prune_to_light_cone(circuit)
+    assert pruned.all_qubits() < circuit.all_qubits()
+    np.testing.assert_allclose(
+        cirq.density_matrix_from_state_vector(
+            circuit.final_wavefunction(), indices=[0, 1]),
+        cirq.density_matrix_from_state_vector(
+            pruned.final_wavefunction(), indices=[0, 1]),
+        atol=1e-6)
+
+
+def test_simulator_run_simulates_light_cone_only():
+    a, b, c = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit.from_ops(cirq.X(a), cirq.CNOT(a, b), cirq.H(c),
+                                    cirq.measure(b, key='b'))
+    simulator = cirq.Simulator()
+    with mock.patch.object(simulator, '_simulate_unitary',
+                           wraps=simulator._simulate_unitary) as m:
+        result = simulator.run(circuit, repetitions=3)
+    assert m.call_count == 2
+    np.testing.assert_equal(result.measurements['b'], [[1], [1], [1]])
@@ -40,6 +40,7 @@ from typing import (
 
 import abc
 import collections
+import itertools
 
 import numpy as np
 
@@ -373,7 +374,9 @@ class SimulatesIntermediateState(SimulatesFinalState, metaclass=abc.ABCMeta):
                                                           initial_state)
             measurements = {}  # type: Dict[str, np.ndarray]
             for step_result in all_step_results:
-                for k, v in step_result.measurements.items():
+                for k, v in itertools.chain(
+                        step_result.restored_measurements.items(),
+                        step_result.measurements.items()):
                     measurements[k] = np.array(v, dtype=np.uint8)
             trial_results.append(
                 self._create_simulator_trial_result(
@@ -468,11 +471,16 @@ class StepResult(metaclass=abc.ABCMeta):
     Attributes:
         measurements: A dictionary from measurement gate key to measurement
             results, ordered by the qubits that the measurement operates on.
+        restored_measurements: Measurement results that an earlier
+            simulation recorded before the point this simulation resumed
+            from, for example from a `cirq.SimulationCheckpointStore`. They
+            are not results of this step, and are usually empty.
     """
 
     def __init__(self,
                  measurements: Optional[Dict[str, List[int]]] = None) -> None:
         self.measurements = measurements or collections.defaultdict(list)
+        self.restored_measurements = {}  # type: Dict[str, List[int]]
 
     @abc.abstractmethod
     def _simulator_state(self) -> Any:
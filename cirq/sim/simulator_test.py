@@ -75,9 +75,11 @@ def test_intermediate_simulator():
     def steps(*args, **kwargs):
         result = mock.Mock()
         result.measurements = {'a': [True, True]}
+        result.restored_measurements = {}
         yield result
         result = mock.Mock()
         result.measurements = {'b': [True, False]}
+        result.restored_measurements = {}
         result._simulator_state.return_value = final_simulator_state
         yield result
 
@@ -107,6 +109,7 @@ def test_intermediate_sweeps():
     def steps(*args, **kwargs):
         result = mock.Mock()
         result.measurements = {'a': np.array([True, True])}
+        result.restored_measurements = {}
         result._simulator_state.return_value = final_state
         yield result
 
@@ -0,0 +1,380 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A simulator storing only the nonzero amplitudes of the wave function."""
+
+import collections
+
+from typing import Dict, Iterator, List, Sequence, Tuple, Type, Union, cast
+
+import numpy as np
+
+from cirq import circuits, ops, protocols, schedules, study, value
+from cirq.sim import light_cone, simulator, sparse_simulator
+
+# Matrix entries smaller than this are treated as zero.
+_ATOL = 1e-7
+
+# Amplitudes smaller than this fraction of the largest amplitude are treated as
+# zero. The threshold is relative so that wide, uniform superpositions of many
+# qubits are kept.
+_RTOL = 1e-7
+
+# The number of bits in the basis state indices.
+_MAX_QUBITS = 64
+
+
+class _SparseState:
+    """A wave function over qubits as parallel arrays of nonzero entries.
+
+    Attributes:
+        num_qubits: The number of qubits. Qubit `i` is the bit with value
+            `2**(num_qubits - 1 - i)` of the basis state indices (big endian).
+        indices: The basis states with nonzero amplitude, as `np.uint64`.
+        amplitudes: The amplitudes of those basis states.
+    """
+
+    def __init__(self, num_qubits: int, dtype: Type[np.number]):
+        self.num_qubits = num_qubits
+        self.indices = np.zeros(1, dtype=np.uint64)
+        self.amplitudes = np.ones(1, dtype=dtype)
+
+    def _shift(self, axis: int) -> np.uint64:
+        return np.uint64(self.num_qubits - 1 - axis)
+
+    def fill_ratio(self) -> float:
+        return len(self.indices) / 2**self.num_qubits
+
+    def to_dense(self) -> np.ndarray:
+        result = np.zeros(2**self.num_qubits, dtype=self.amplitudes.dtype)
+        result[self.indices.astype(np.int64)] = self.amplitudes
+        return result / np.linalg.norm(result)
+
+    def bits(self, indices: np.ndarray, axes: Sequence[int]) -> np.ndarray:
+        """Extracts the bits of the given axes, one column per axis."""
+        result = np.empty((len(indices), len(axes)), dtype=np.uint8)
+        for j, axis in enumerate(axes):
+            result[:, j] = (indices >> self._shift(axis)) & np.uint64(1)
+        return result
+
+    def apply_matrix(self, matrix: np.ndarray, axes: Sequence[int]) -> None:
+        """Left-multiplies the wave function by a matrix on the given axes.
+
+        Each column of the matrix maps one value of the targeted bits to the
+        values with a nonzero entry in that column. Every stored basis state
+        is expanded into its images by index arithmetic, and images that
+        coincide are summed.
+        """
+        matrix = matrix.astype(self.amplitudes.dtype)
+        k = len(axes)
+        shifts = [self._shift(a) for a in axes]
+        mask = np.uint64(sum(1 << int(s) for s in shifts))
+        deposit = np.zeros(2**k, dtype=np.uint64)
+        for s in range(2**k):
+            for j, shift in enumerate(shifts):
+                if (s >> (k - 1 - j)) & 1:
+                    deposit[s] |= np.uint64(1) << shift
+
+        sub = np.zeros(len(self.indices), dtype=np.int64)
+        for shift in shifts:
+            sub = (sub << 1) | ((self.indices >> shift) &
+                                np.uint64(1)).astype(np.int64)
+        rest = self.indices & ~mask
+
+        # The nonzero entries of the matrix, grouped by column.
+        rows, cols = np.nonzero(np.abs(matrix.T) > _ATOL)[::-1]
+        vals = matrix[rows, cols]
+        counts = np.bincount(cols, minlength=2**k)
+        starts = np.cumsum(counts) - counts
+
+        n_per = counts[sub]
+        rep = np.repeat(np.arange(len(sub)), n_per)
+        offsets = np.arange(len(rep)) - np.repeat(np.cumsum(n_per) - n_per,
+                                                  n_per)
+        entries = starts[sub][rep] + offsets
+        new_indices = rest[rep] | deposit[rows[entries]]
+        new_amplitudes = self.amplitudes[rep] * vals[entries]
+
+        is_permutation = (np.all(counts == 1) and
+                          len(np.unique(rows)) == len(rows))
+        if not is_permutation:
+            new_indices, inverse = np.unique(new_indices, return_inverse=True)
+            new_amplitudes = (
+                np.bincount(inverse, weights=new_amplitudes.real) +
+                1j * np.bincount(inverse, weights=new_amplitudes.imag)).astype(
+                    self.amplitudes.dtype)
+        magnitudes = np.abs(new_amplitudes)
+        keep = magnitudes > _RTOL * np.max(magnitudes)
+        self.indices = new_indices[keep]
+        self.amplitudes = new_amplitudes[keep]
+
+    def measure(self, axes: Sequence[int]) -> List[int]:
+        """Measures the given axes, collapsing the wave function."""
+        outcomes = np.zeros(len(self.indices), dtype=np.uint64)
+        for shift in (self._shift(a) for a in axes):
+            outcomes = (outcomes << np.uint64(1)) | (
+                (self.indices >> shift) & np.uint64(1))
+        unique, inverse = np.unique(outcomes, return_inverse=True)
+        probs = np.bincount(inverse, weights=np.abs(self.amplitudes)**2)
+        choice = np.random.choice(len(unique), p=probs / np.sum(probs))
+        keep = inverse == choice
+        self.indices = self.indices[keep]
+        self.amplitudes = self.amplitudes[keep] / np.sqrt(probs[choice])
+        return [int(b) for b in self.bits(self.indices[:1], axes)[0]]
+
+    def flip(self, axes: Sequence[int]) -> None:
+        """Applies a bit flip to the given axes."""
+        for axis in axes:
+            self.indices = self.indices ^ (np.uint64(1) << self._shift(axis))
+
+    def sample(self, axes: Sequence[int], repetitions: int) -> np.ndarray:
+        probs = np.abs(self.amplitudes)**2
+        choices = np.random.choice(len(probs),
+                                   size=repetitions,
+                                   p=probs / np.sum(probs))
+        return self.bits(self.indices[choices], axes)
+
+
+class SparseAmplitudeStep(simulator.StepResult):
+    """A `StepResult` of a `cirq.SparseAmplitudeSimulator`.
+
+    The state is kept as an array of the basis states with nonzero amplitude
+    and an array of those amplitudes.
+    """
+
+    def __init__(self, state: _SparseState, qubit_map: Dict[ops.Qid, int],
+                 measurements: Dict[str, List[int]]):
+        super().__init__(measurements=measurements)
+        self._state = state
+        self.qubit_map = qubit_map
+
+    def _simulator_state(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns copies of the basis state indices and their amplitudes."""
+        return self._state.indices.copy(), self._state.amplitudes.copy()
+
+    def sample(self, qubits: List[ops.Qid],
+               repetitions: int = 1) -> np.ndarray:
+        return self._state.sample([self.qubit_map[q] for q in qubits],
+                                  repetitions)
+
+    def amplitudes(self, indices: Sequence[int]) -> List[complex]:
+        """Returns the amplitudes of the given basis states."""
+        order = np.argsort(self._state.indices)
+        sorted_indices = self._state.indices[order]
+        targets = np.array(indices, dtype=np.uint64)
+        positions = np.searchsorted(sorted_indices, targets)
+        result = []
+        for target, position in zip(targets, positions):
+            if (position < len(sorted_indices) and
+                    sorted_indices[position] == target):
+                result.append(
+                    complex(self._state.amplitudes[order[position]]))
+            else:
+                result.append(0j)
+        return result
+
+
+class SparseAmplitudeSimulator(simulator.SimulatesSamples,
+                               simulator.SimulatesAmplitudes):
+    """A simulator that stores only the nonzero amplitudes of the state.
+
+    The wave function is kept as parallel numpy arrays of basis state indices
+    and amplitudes, and gates are applied by arithmetic on the indices. This
+    makes classical-like circuits, made of permutations such as X, CNOT,
+    TOFFOLI and SWAP, phases and a few Hadamards, cheap to simulate on many
+    more qubits (up to 64) than a dense wave function allows.
+
+    When the number of stored amplitudes grows past `dense_threshold` times
+    the dimension of the full wave function, the remainder of the circuit is
+    simulated by `cirq.Simulator` on a dense wave function.
+
+    Only qubits (not higher dimensional qudits) are supported. Operations
+    that cannot influence a measurement are not simulated by the run methods.
+    """
+
+    def __init__(self,
+                 *,
+                 dtype: Type[np.number] = np.complex64,
+                 dense_threshold: float = 0.25):
+        """Initializes the simulator.
+
+        Args:
+            dtype: The `numpy.dtype` of the amplitudes. One of
+                `numpy.complex64` or `numpy.complex128`.
+            dense_threshold: The fraction of nonzero amplitudes at which the
+                simulation switches to a dense wave function.
+        """
+        if np.dtype(dtype).kind != 'c':
+            raise ValueError(
+                'dtype must be a complex type but was {}'.format(dtype))
+        self._dtype = dtype
+        self._dense_threshold = dense_threshold
+
+    def _run(self, circuit: circuits.Circuit,
+             param_resolver: study.ParamResolver,
+             repetitions: int) -> Dict[str, np.ndarray]:
+        """See definition in `cirq.SimulatesSamples`."""
+        resolved_circuit = self._resolve(circuit, param_resolver)
+        resolved_circuit = light_cone.prune_to_light_cone(
+            resolved_circuit, protocols.is_measurement)
+        qubits = ops.QubitOrder.DEFAULT.order_for(resolved_circuit.all_qubits())
+
+        def measure_or_mixture(op):
+            return protocols.is_measurement(op) or protocols.has_mixture(op)
+
+        if resolved_circuit.are_all_matches_terminal(measure_or_mixture):
+            for step in self._iterator(resolved_circuit,
+                                       qubits,
+                                       perform_measurements=False):
+                pass
+            measurement_ops = [
+                op for _, op, _ in resolved_circuit.
+                findall_operations_with_gate_type(ops.MeasurementGate)
+            ]
+            return step.sample_measurement_ops(measurement_ops, repetitions)
+
+        measurements = {}  # type: Dict[str, List[np.ndarray]]
+        for _ in range(repetitions):
+            for step in self._iterator(resolved_circuit, qubits):
+                for k, v in step.measurements.items():
+                    measurements.setdefault(k, []).append(
+                        np.array(v, dtype=np.uint8))
+        return {k: np.array(v) for k, v in measurements.items()}
+
+    def compute_amplitudes_sweep(
+            self,
+            program: Union[circuits.Circuit, schedules.Schedule],
+            bitstrings: np.ndarray,
+            params: study.Sweepable,
+            qubit_order: ops.QubitOrderOrList = ops.QubitOrder.DEFAULT,
+    ) -> List[List[complex]]:
+        """See definition in `cirq.SimulatesAmplitudes`."""
+        circuit = (program if isinstance(program, circuits.Circuit) else
+                   program.to_circuit())
+        qubits = ops.QubitOrder.as_qubit_order(qubit_order).order_for(
+            circuit.all_qubits())
+        indices = [value.big_endian_bits_to_int(b) for b in bitstrings]
+
+        all_amplitudes = []
+        for param_resolver in study.to_resolvers(params):
+            resolved_circuit = self._resolve(circuit, param_resolver)
+            for step in self._iterator(resolved_circuit, qubits):
+                pass
+            if isinstance(step, SparseAmplitudeStep):
+                all_amplitudes.append(step.amplitudes(indices))
+            else:
+                state = cast(sparse_simulator.SparseSimulatorStep,
+                             step).state_vector()
+                all_amplitudes.append([state[i] for i in indices])
+        return all_amplitudes
+
+    def _resolve(self, circuit: circuits.Circuit,
+                 param_resolver: study.ParamResolver) -> circuits.Circuit:
+        resolved_circuit = protocols.resolve_parameters(
+            circuit, param_resolver or study.ParamResolver({}))
+        if protocols.is_parameterized(resolved_circuit):
+            raise ValueError('Circuit contains ops whose symbols were not '
+                             'specified in parameter sweep.')
+        return resolved_circuit
+
+    def _iterator(self,
+                  circuit: circuits.Circuit,
+                  qubits: Sequence[ops.Qid],
+                  perform_measurements: bool = True
+                 ) -> Iterator[simulator.StepResult]:
+        """Iterates over the moments of the circuit from the zero state.
+
+        Yields `SparseAmplitudeStep`s until the state becomes too dense, and
+        `cirq.SparseSimulatorStep`s for the remaining moments.
+        """
+        if any(q.dimension != 2 for q in qubits):
+            raise ValueError('Only qubits are supported.')
+        if len(qubits) > _MAX_QUBITS:
+            raise ValueError('At most {} qubits are supported.'.format(
+                _MAX_QUBITS))
+        qubit_map = {q: i for i, q in enumerate(qubits)}
+        state = _SparseState(len(qubits), self._dtype)
+        if len(circuit) == 0:
+            yield SparseAmplitudeStep(state, qubit_map, {})
+
+        for i, moment in enumerate(circuit):
+            measurements = collections.defaultdict(
+                list)  # type: Dict[str, List[int]]
+            for op in _decompose_moment(moment):
+                axes = [qubit_map[q] for q in op.qubits]
+                _simulate_op(op, state, axes, measurements,
+                             perform_measurements)
+            yield SparseAmplitudeStep(state, qubit_map, measurements)
+
+            if (i + 1 < len(circuit) and
+                    state.fill_ratio() > self._dense_threshold):
+                remainder = circuit[i + 1:]
+                if not perform_measurements:
+                    remainder = circuits.Circuit(
+                        ops.Moment(op for op in m
+                                   if not protocols.is_measurement(op))
+                        for m in remainder)
+                dense = sparse_simulator.Simulator(dtype=self._dtype)
+                yield from dense.simulate_moment_steps(
+                    remainder,
+                    qubit_order=qubits,
+                    initial_state=state.to_dense())
+                return
+
+
+def _decompose_moment(moment: ops.Moment) -> List[ops.Operation]:
+
+    def on_stuck(bad_op: ops.Operation):
+        return TypeError(
+            "Can't simulate unknown operations that don't specify a "
+            "_unitary_ method, a _decompose_ method, "
+            "(_has_unitary_ + _apply_unitary_) methods,"
+            "(_has_mixture_ + _mixture_) methods, or are measurements."
+            ": {!r}".format(bad_op))
+
+    def keep(potential_op: ops.Operation) -> bool:
+        return (protocols.has_unitary(potential_op) or
+                protocols.has_mixture(potential_op) or
+                protocols.is_measurement(potential_op) or
+                ops.op_gate_isinstance(potential_op, ops.ResetChannel))
+
+    non_display_ops = (op for op in moment
+                       if not isinstance(op, (ops.SamplesDisplay,
+                                              ops.WaveFunctionDisplay,
+                                              ops.DensityMatrixDisplay)))
+    return protocols.decompose(non_display_ops,
+                               keep=keep,
+                               on_stuck_raise=on_stuck)
+
+
+def _simulate_op(op: ops.Operation, state: _SparseState, axes: List[int],
+                 measurements: Dict[str, List[int]],
+                 perform_measurements: bool) -> None:
+    if ops.op_gate_isinstance(op, ops.ResetChannel):
+        bits = state.measure(axes)
+        state.flip([a for a, b in zip(axes, bits) if b])
+    elif protocols.has_unitary(op):
+        state.apply_matrix(protocols.unitary(op), axes)
+    elif protocols.is_measurement(op):
+        meas = ops.op_gate_of_type(op, ops.MeasurementGate)
+        if meas and perform_measurements:
+            bits = state.measure(axes)
+            corrected = [
+                bit ^ mask for bit, mask in zip(bits, meas.full_invert_mask())
+            ]
+            measurements[protocols.measurement_key(meas)].extend(corrected)
+    elif protocols.has_mixture(op):
+        probs, unitaries = zip(*protocols.mixture(op))
+        index = np.random.choice(range(len(unitaries)), p=probs)
+        state.apply_matrix(unitaries[index], axes)
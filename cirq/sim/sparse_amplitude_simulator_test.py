@@ -0,0 +1,196 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+
+import numpy as np
+import pytest
+import sympy
+
+import cirq
+from cirq.sim import sparse_amplitude_simulator
+
+
+def _all_amplitudes(simulator, circuit, qubits):
+    bitstrings = np.array(list(itertools.product([0, 1],
+                                                 repeat=len(qubits))))
+    return np.array(
+        simulator.compute_amplitudes(circuit, bitstrings, qubit_order=qubits))
+
+
+def test_invalid_dtype():
+    with pytest.raises(ValueError, match='complex'):
+        cirq.SparseAmplitudeSimulator(dtype=np.int32)
+
+
+@pytest.mark.parametrize('dtype', [np.complex64, np.complex128])
+@pytest.mark.parametrize('dense_threshold', [0.1, 2])
+def test_amplitudes_match_dense_simulation(dtype, dense_threshold):
+    simulator = cirq.SparseAmplitudeSimulator(dtype=dtype,
+                                              dense_threshold=dense_threshold)
+    for _ in range(5):
+        circuit = cirq.testing.random_circuit(qubits=4,
+                                              n_moments=6,
+                                              op_density=0.8)
+        qubits = sorted(circuit.all_qubits())
+        np.testing.assert_allclose(_all_amplitudes(simulator, circuit, qubits),
+                                   circuit.final_wavefunction(
+                                       qubit_order=qubits),
+                                   atol=1e-5)
+
+
+def test_amplitudes_qubit_order_and_sweep():
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit.from_ops(cirq.X(a)**sympy.Symbol('t'),
+                                    cirq.CNOT(a, b))
+    simulator = cirq.SparseAmplitudeSimulator()
+    result = simulator.compute_amplitudes_sweep(circuit,
+                                                np.array([[0, 1], [1, 1]]),
+                                                cirq.Points('t', [0, 1]),
+                                                qubit_order=[b, a])
+    np.testing.assert_allclose(result, [[0, 0], [0, 1]], atol=1e-6)
+
+
+def test_unresolved_parameter():
+    circuit = cirq.Circuit.from_ops(
+        cirq.X(cirq.LineQubit(0))**sympy.Symbol('t'),
+        cirq.measure(cirq.LineQubit(0)))
+    with pytest.raises(ValueError, match='symbols'):
+        cirq.SparseAmplitudeSimulator().run(circuit)
+
+
+def test_unsupported_qudits():
+    q = cirq.LineQid(0, dimension=3)
+    circuit = cirq.Circuit.from_ops(cirq.measure(q))
+    with pytest.raises(ValueError, match='qubits'):
+        cirq.SparseAmplitudeSimulator().run(circuit)
+
+
+def test_unknown_operation():
+
+    class NoUnitary(cirq.SingleQubitGate):
+        pass
+
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit.from_ops(NoUnitary()(q), cirq.measure(q))
+    with pytest.raises(TypeError, match="Can't simulate"):
+        cirq.SparseAmplitudeSimulator().run(circuit)
+
+
+def test_run_classical_circuit_on_many_qubits():
+    qubits = cirq.LineQubit.range(62)
+    ones = qubits[::3]
+    circuit = cirq.Circuit.from_ops(
+        [cirq.X(q) for q in ones],
+        [cirq.CNOT(a, b) for a, b in zip(qubits, qubits[1:])],
+        cirq.TOFFOLI(qubits[0], qubits[1], qubits[-1]),
+        cirq.SWAP(qubits[2], qubits[3]),
+        cirq.measure(*qubits, key='m'),
+    )
+    result = cirq.SparseAmplitudeSimulator().run(circuit, repetitions=3)
+    bits = [0] * len(qubits)
+    for q in ones:
+        bits[q.x] = 1
+    for i in range(1, len(qubits)):
+        bits[i] ^= bits[i - 1]
+    bits[-1] ^= bits[0] & bits[1]
+    bits[2], bits[3] = bits[3], bits[2]
+    np.testing.assert_equal(result.measurements['m'], [bits] * 3)
+
+
+def test_run_superposition_on_many_qubits():
+    qubits = cirq.LineQubit.range(60)
+    circuit = cirq.Circuit.from_ops(
+        cirq.H(qubits[0]),
+        [cirq.CNOT(qubits[0], q) for q in qubits[1:]],
+        cirq.Z(qubits[0]),
+        cirq.measure(*qubits, key='m'),
+    )
+    result = cirq.SparseAmplitudeSimulator().run(circuit, repetitions=100)
+    m = result.measurements['m']
+    assert np.all(m == m[:, :1])
+    assert 0 < np.sum(m[:, 0]) < 100
+
+
+def test_run_non_terminal_measurement_reset_and_mixture():
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit.from_ops(
+        cirq.H(a),
+        cirq.measure(a, key='m0'),
+        cirq.CNOT(a, b),
+        cirq.measure(b, key='m1', invert_mask=(True,)),
+        cirq.reset(b),
+        cirq.bit_flip(1)(a),
+        cirq.measure(b, key='m2'),
+        cirq.measure(a, key='m3'),
+    )
+    result = cirq.SparseAmplitudeSimulator().run(circuit, repetitions=50)
+    m = result.measurements
+    np.testing.assert_equal(m['m0'], 1 - m['m1'])
+    np.testing.assert_equal(m['m2'], [[0]] * 50)
+    np.testing.assert_equal(m['m3'], 1 - m['m0'])
+    assert 0 < np.sum(m['m0']) < 50
+
+
+@pytest.mark.parametrize('dense_threshold', [0.0, 2])
+def test_run_switches_to_dense(dense_threshold):
+    qubits = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit.from_ops(
+        [cirq.H(q) for q in qubits],
+        [cirq.H(q) for q in qubits],
+        cirq.X(qubits[1]),
+        cirq.measure(*qubits, key='m'),
+    )
+    simulator = cirq.SparseAmplitudeSimulator(dense_threshold=dense_threshold)
+    steps = list(simulator._iterator(circuit, qubits))
+    assert isinstance(steps[-1], cirq.SparseSimulatorStep) == (dense_threshold
+                                                               < 1)
+    result = simulator.run(circuit, repetitions=4)
+    np.testing.assert_equal(result.measurements['m'], [[0, 1, 0]] * 4)
+
+
+def test_run_samples_terminal_measurements_after_dense_switch():
+    qubits = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit.from_ops(
+        [cirq.H(q) for q in qubits],
+        cirq.measure(*qubits, key='m'),
+    )
+    simulator = cirq.SparseAmplitudeSimulator(dense_threshold=0.0)
+    result = simulator.run(circuit, repetitions=100)
+    assert len(set(tuple(m) for m in result.measurements['m'])) > 1
+
+
+def test_small_amplitudes_are_pruned_relative_to_largest():
+    state = sparse_amplitude_simulator._SparseState(1, np.complex128)
+    state.amplitudes = state.amplitudes * 1e-9
+    state.apply_matrix(cirq.unitary(cirq.H), [0])
+    assert sorted(state.indices) == [0, 1]
+
+    state.apply_matrix(cirq.unitary(cirq.H), [0])
+    assert list(state.indices) == [0]
+
+
+def test_step_state():
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit.from_ops(cirq.H(a), cirq.CNOT(a, b))
+    simulator = cirq.SparseAmplitudeSimulator(dense_threshold=2)
+    steps = list(simulator._iterator(circuit, [a, b]))
+    indices, amplitudes = steps[-1]._simulator_state()
+    assert sorted(indices) == [0, 3]
+    np.testing.assert_allclose(amplitudes, [np.sqrt(0.5)] * 2, atol=1e-6)
+    assert steps[-1].amplitudes([1, 3]) == pytest.approx([0, np.sqrt(0.5)])
+
+    empty = list(simulator._iterator(cirq.Circuit(), []))
+    assert len(empty) == 1
+    assert empty[0].amplitudes([0]) == [1]
@@ -16,12 +16,17 @@
 
 import collections
 
-from typing import Dict, Iterator, List, Tuple, Type, Union
+from typing import (Dict, Iterable, Iterator, List, Optional, Sequence, Tuple,
+                    Type, Union, TYPE_CHECKING)
 
 import numpy as np
 
 from cirq import circuits, linalg, ops, protocols, study
-from cirq.sim import simulator, wave_function, wave_function_simulator
+from cirq.sim import (light_cone, simulator, wave_function,
+                      wave_function_simulator)
+
+if TYPE_CHECKING:
+    import cirq
 
 
 class _FlipGate(ops.SingleQubitGate):
@@ -53,6 +58,72 @@ class _StateAndBuffer():
         self.buffer = buffer
 
 
+class _Factor:
+    """The wave function of a group of qubits that have interacted."""
+
+    def __init__(self, qubits: List[ops.Qid], data: _StateAndBuffer):
+        self.qubits = qubits
+        self.data = data
+        self.axes = {q: i for i, q in enumerate(qubits)}
+
+
+class _FactorizedState:
+    """A product state over groups of qubits, starting from all zeros.
+
+    Each qubit starts in its own group. Groups are merged, by taking the
+    tensor product of their wave functions, when an operation acts on qubits
+    from more than one group.
+    """
+
+    def __init__(self, qubits: Iterable[ops.Qid], dtype: Type[np.number]):
+        self._factor_of = {}  # type: Dict[ops.Qid, _Factor]
+        for q in qubits:
+            state = linalg.one_hot(index=0,
+                                   shape=(q.dimension,),
+                                   dtype=dtype)
+            self._factor_of[q] = _Factor([q],
+                                         _StateAndBuffer(
+                                             state, np.empty_like(state)))
+
+    def factors(self) -> List[_Factor]:
+        """Returns the distinct factors, in order of first qubit."""
+        seen = {}  # type: Dict[int, _Factor]
+        for factor in self._factor_of.values():
+            seen.setdefault(id(factor), factor)
+        return list(seen.values())
+
+    def group_by_factor(self, qubits: Sequence[ops.Qid]
+                       ) -> List[Tuple[_Factor, List[int]]]:
+        """Groups the positions of the given qubits by their factor."""
+        groups = collections.OrderedDict(
+        )  # type: Dict[int, Tuple[_Factor, List[int]]]
+        for i, q in enumerate(qubits):
+            factor = self._factor_of[q]
+            groups.setdefault(id(factor), (factor, []))[1].append(i)
+        return list(groups.values())
+
+    def merge(self, qubits: Iterable[ops.Qid]) -> _Factor:
+        """Merges the factors of the given qubits into a single factor."""
+        factors = []  # type: List[_Factor]
+        for q in qubits:
+            factor = self._factor_of[q]
+            if all(factor is not f for f in factors):
+                factors.append(factor)
+        if len(factors) == 1:
+            return factors[0]
+
+        state = factors[0].data.state
+        merged_qubits = list(factors[0].qubits)
+        for other in factors[1:]:
+            state = np.multiply.outer(state, other.data.state)
+            merged_qubits.extend(other.qubits)
+        merged = _Factor(merged_qubits,
+                         _StateAndBuffer(state, np.empty_like(state)))
+        for q in merged_qubits:
+            self._factor_of[q] = merged
+        return merged
+
+
 class Simulator(simulator.SimulatesSamples,
                 wave_function_simulator.SimulatesIntermediateWaveFunction):
     """A sparse matrix wave function simulator that uses numpy.
@@ -82,10 +153,14 @@ class Simulator(simulator.SimulatesSamples,
 
     The simulation performs optimizations if the number of repetitions is
     greater than one and all measurements in the circuit are terminal (at the
-    end of the circuit). These methods return `TrialResult`s which contain both
-    the measurement results, but also the parameters used for the parameterized
-    circuit operations. The initial state of a run is always the all 0s state
-    in the computational basis.
+    end of the circuit). Operations that cannot influence any measurement are
+    not simulated. When the circuit consists of independent groups of qubits,
+    for example parallel experiments packed onto one device, constructing the
+    simulator with `split_untangled_states=True` keeps a separate wave
+    function per group instead of one over all qubits. These methods return
+    `TrialResult`s which contain both the measurement results, but also the
+    parameters used for the parameterized circuit operations. The initial
+    state of a run is always the all 0s state in the computational basis.
 
     By contrast the simulate methods of the simulator give access to the
     wave function of the simulation at the end of the simulation of the circuit.
@@ -139,13 +214,27 @@ class Simulator(simulator.SimulatesSamples,
     The result of computing display values is stored in a
     `ComputeDisplaysResult`.
 
+    Long simulations can be checkpointed to disk by passing a
+    `cirq.SimulationCheckpointStore`. The simulate methods then write the
+    wave function every few moments, and start any later simulation whose
+    circuit shares a checkpointed prefix (for instance a rerun of an
+    interrupted simulation) from the deepest matching checkpoint. The
+    measurement results recorded before the checkpoint are restored into the
+    `restored_measurements` of the first step yielded after resuming, and
+    into the result of the simulation. The run methods never use
+    checkpoints, since restoring the random state would make repetitions
+    identical.
+
     See `Simulator` for the definitions of the supported methods.
     """
 
     def __init__(self,
                  *,
                  dtype: Type[np.number] = np.complex64,
-                 seed: int = None):
+                 seed: int = None,
+                 checkpoint_store: Optional[
+                     'cirq.SimulationCheckpointStore'] = None,
+                 split_untangled_states: bool = False):
         """A sparse matrix simulator.
 
         Args:
@@ -154,11 +243,21 @@ class Simulator(simulator.SimulatesSamples,
             seed: The random seed to use for this simulator. Sets numpy's
                 random seed. Setting numpy's seed different in between
                 use of this class will lead to non-seeded behavior.
+            checkpoint_store: Where to write and look up checkpoints of the
+                wave function when using the simulate methods. If not
+                specified, no checkpoints are used.
+            split_untangled_states: If set, the run methods keep a separate
+                wave function for each group of qubits that have interacted
+                so far, and only take the tensor product of two groups when
+                a multi-qubit operation connects them. Measurements are
+                sampled per group and combined.
         """
         if np.dtype(dtype).kind != 'c':
             raise ValueError(
                 'dtype must be a complex type but was {}'.format(dtype))
         self._dtype = dtype
+        self._checkpoint_store = checkpoint_store
+        self._split_untangled_states = split_untangled_states
         if seed:
             np.random.seed(seed)
 
@@ -171,6 +270,9 @@ class Simulator(simulator.SimulatesSamples,
         param_resolver = param_resolver or study.ParamResolver({})
         resolved_circuit = protocols.resolve_parameters(circuit, param_resolver)
         self._check_all_resolved(resolved_circuit)
+        # Only operations that can influence a measurement need simulating.
+        resolved_circuit = light_cone.prune_to_light_cone(
+            resolved_circuit, protocols.is_measurement)
 
         def measure_or_mixture(op):
             return protocols.is_measurement(op) or protocols.has_mixture(op)
@@ -182,11 +284,8 @@ class Simulator(simulator.SimulatesSamples,
         self,
         circuit: circuits.Circuit,
         repetitions: int) -> Dict[str, List[np.ndarray]]:
-        for step_result in self._base_iterator(
-                circuit=circuit,
-                qubit_order=ops.QubitOrder.DEFAULT,
-                initial_state=0,
-                perform_measurements=False):
+        for step_result in self._run_iterator(circuit,
+                                              perform_measurements=False):
             pass
         # We can ignore the mixtures since this is a run method which
         # does not return the state.
@@ -201,10 +300,7 @@ class Simulator(simulator.SimulatesSamples,
         repetitions: int) -> Dict[str, List[np.ndarray]]:
         measurements = {}  # type: Dict[str, List[np.ndarray]]
         for _ in range(repetitions):
-            all_step_results = self._base_iterator(
-                    circuit,
-                    qubit_order=ops.QubitOrder.DEFAULT,
-                    initial_state=0)
+            all_step_results = self._run_iterator(circuit)
 
             for step_result in all_step_results:
                 for k, v in step_result.measurements.items():
@@ -213,6 +309,61 @@ class Simulator(simulator.SimulatesSamples,
                     measurements[k].append(np.array(v, dtype=np.uint8))
         return {k: np.array(v) for k, v in measurements.items()}
 
+    def _run_iterator(self,
+                      circuit: circuits.Circuit,
+                      perform_measurements: bool = True) -> Iterator:
+        """Iterates over the moments of a run, starting from all zeros."""
+        if self._split_untangled_states:
+            return self._factorized_iterator(circuit, perform_measurements)
+        return self._base_iterator(circuit,
+                                   qubit_order=ops.QubitOrder.DEFAULT,
+                                   initial_state=0,
+                                   perform_measurements=perform_measurements)
+
+    def _factorized_iterator(self,
+                             circuit: circuits.Circuit,
+                             perform_measurements: bool = True
+                            ) -> Iterator['_FactorizedStep']:
+        """Like `_base_iterator`, but with a wave function per qubit group."""
+        state = _FactorizedState(circuit.all_qubits(), self._dtype)
+        if len(circuit) == 0:
+            yield _FactorizedStep(state, {}, self._dtype)
+
+        for moment in circuit:
+            measurements = collections.defaultdict(
+                list)  # type: Dict[str, List[int]]
+            for op in self._unitary_ops_and_measurements(moment):
+                meas = ops.op_gate_of_type(op, ops.MeasurementGate)
+                if meas:
+                    # Measurements don't entangle, so measure each factor.
+                    if perform_measurements:
+                        self._simulate_factorized_measurement(
+                            op, meas, state, measurements)
+                    continue
+                factor = state.merge(op.qubits)
+                indices = [factor.axes[qubit] for qubit in op.qubits]
+                self._simulate_op(op, factor.data, indices, measurements,
+                                  len(factor.axes), perform_measurements)
+            yield _FactorizedStep(state, measurements, self._dtype)
+
+    def _simulate_factorized_measurement(
+            self, op: ops.Operation, meas: ops.MeasurementGate,
+            state: '_FactorizedState',
+            measurements: Dict[str, List[int]]) -> None:
+        """Measures each factor touched by a measurement separately."""
+        bits = [0] * len(op.qubits)
+        for factor, positions in state.group_by_factor(op.qubits):
+            factor_bits, _ = wave_function.measure_state_vector(
+                factor.data.state,
+                [factor.axes[op.qubits[i]] for i in positions],
+                out=factor.data.state,
+                qid_shape=factor.data.state.shape)
+            for i, bit in zip(positions, factor_bits):
+                bits[i] = bit
+        invert_mask = meas.full_invert_mask()
+        corrected = [bit ^ mask for bit, mask in zip(bits, invert_mask)]
+        measurements[protocols.measurement_key(meas)].extend(corrected)
+
     def _simulator_iterator(
             self,
             circuit: circuits.Circuit,
@@ -235,7 +386,8 @@ class Simulator(simulator.SimulatesSamples,
         return self._base_iterator(resolved_circuit,
                                    qubit_order,
                                    actual_initial_state,
-                                   perform_measurements=True)
+                                   perform_measurements=True,
+                                   use_checkpoints=True)
 
     def _base_iterator(
             self,
@@ -243,6 +395,7 @@ class Simulator(simulator.SimulatesSamples,
             qubit_order: ops.QubitOrderOrList,
             initial_state: Union[int, np.ndarray],
             perform_measurements: bool=True,
+            use_checkpoints: bool=False,
     ) -> Iterator:
         qubits = ops.QubitOrder.as_qubit_order(qubit_order).order_for(
                 circuit.all_qubits())
@@ -256,6 +409,57 @@ class Simulator(simulator.SimulatesSamples,
         if len(circuit) == 0:
             yield SparseSimulatorStep(state, {}, qubit_map, self._dtype)
 
+        store = self._checkpoint_store if use_checkpoints else None
+        keys = []  # type: List[Optional[str]]
+        start = 0
+        # The latest results for each measurement key, kept for checkpoints.
+        recorded = {}  # type: Dict[str, List[int]]
+        if store is not None:
+            keys = store.prefix_keys(circuit, qubits, initial_state,
+                                     self._dtype)
+            resumed = store.latest(keys)
+            if resumed is not None:
+                state = np.array(resumed.state, dtype=self._dtype)
+                np.random.set_state(resumed.rng_state)
+                recorded = dict(resumed.measurements)
+                start = resumed.moment_index + 1
+                if start == len(circuit):
+                    step = SparseSimulatorStep(state, {}, qubit_map,
+                                               self._dtype)
+                    step.restored_measurements = dict(recorded)
+                    yield step
+
+        data = _StateAndBuffer(state=np.reshape(state, qid_shape),
+                               buffer=np.empty(qid_shape, dtype=self._dtype))
+        for moment_index in range(start, len(circuit)):
+            moment = circuit[moment_index]
+            measurements = collections.defaultdict(
+                list)  # type: Dict[str, List[int]]
+
+            for op in self._unitary_ops_and_measurements(moment):
+                indices = [qubit_map[qubit] for qubit in op.qubits]
+                self._simulate_op(op, data, indices, measurements, num_qubits,
+                                  perform_measurements)
+
+            step = SparseSimulatorStep(state_vector=data.state,
+                                       measurements=measurements,
+                                       qubit_map=qubit_map,
+                                       dtype=self._dtype)
+            if store is not None:
+                if moment_index == start:
+                    step.restored_measurements = dict(recorded)
+                recorded.update(measurements)
+                key = keys[moment_index]
+                if key is not None and store.should_save(moment_index):
+                    store.save(key, moment_index, data.state, qubits,
+                               recorded)
+
+            yield step
+
+    def _unitary_ops_and_measurements(self, moment: ops.Moment
+                                     ) -> List[ops.Operation]:
+        """Decomposes a moment into operations the simulator can apply."""
+
         def on_stuck(bad_op: ops.Operation):
             return TypeError(
                 "Can't simulate unknown operations that don't specify a "
@@ -271,43 +475,32 @@ class Simulator(simulator.SimulatesSamples,
                     protocols.is_measurement(potential_op) or
                     ops.op_gate_isinstance(potential_op, ops.ResetChannel))
 
-        data = _StateAndBuffer(state=np.reshape(state, qid_shape),
-                               buffer=np.empty(qid_shape, dtype=self._dtype))
-        for moment in circuit:
-            measurements = collections.defaultdict(
-                list)  # type: Dict[str, List[int]]
-
-            non_display_ops = (op for op in moment
-                               if not isinstance(op, (ops.SamplesDisplay,
-                                                      ops.WaveFunctionDisplay,
-                                                      ops.DensityMatrixDisplay
-                                                      )))
-            unitary_ops_and_measurements = protocols.decompose(
-                non_display_ops,
-                keep=keep,
-                on_stuck_raise=on_stuck)
-
-            for op in unitary_ops_and_measurements:
-                indices = [qubit_map[qubit] for qubit in op.qubits]
-                if ops.op_gate_isinstance(op, ops.ResetChannel):
-                    self._simulate_reset(op, data, indices)
-                elif protocols.has_unitary(op):
-                    self._simulate_unitary(op, data, indices)
-                elif protocols.is_measurement(op):
-                    # Do measurements second, since there may be mixtures that
-                    # operate as measurements.
-                    # TODO: support measurement outside the computational basis.
-                    if perform_measurements:
-                        self._simulate_measurement(op, data, indices,
-                                                   measurements, num_qubits)
-                elif protocols.has_mixture(op):
-                    self._simulate_mixture(op, data, indices)
-
-            yield SparseSimulatorStep(
-                state_vector=data.state,
-                measurements=measurements,
-                qubit_map=qubit_map,
-                dtype=self._dtype)
+        non_display_ops = (op for op in moment
+                           if not isinstance(op, (ops.SamplesDisplay,
+                                                  ops.WaveFunctionDisplay,
+                                                  ops.DensityMatrixDisplay)))
+        return protocols.decompose(non_display_ops,
+                                   keep=keep,
+                                   on_stuck_raise=on_stuck)
+
+    def _simulate_op(self, op: ops.Operation, data: _StateAndBuffer,
+                     indices: List[int], measurements: Dict[str, List[int]],
+                     num_qubits: int, perform_measurements: bool) -> None:
+        """Simulates an operation returned by `_unitary_ops_and_measurements`.
+        """
+        if ops.op_gate_isinstance(op, ops.ResetChannel):
+            self._simulate_reset(op, data, indices)
+        elif protocols.has_unitary(op):
+            self._simulate_unitary(op, data, indices)
+        elif protocols.is_measurement(op):
+            # Do measurements second, since there may be mixtures that
+            # operate as measurements.
+            # TODO: support measurement outside the computational basis.
+            if perform_measurements:
+                self._simulate_measurement(op, data, indices, measurements,
+                                           num_qubits)
+        elif protocols.has_mixture(op):
+            self._simulate_mixture(op, data, indices)
 
     def _simulate_unitary(self, op: ops.Operation, data: _StateAndBuffer,
             indices: List[int]) -> None:
@@ -450,3 +643,38 @@ class SparseSimulatorStep(wave_function.StateVectorMixin,
                                                  qid_shape=protocols.qid_shape(
                                                      self, None),
                                                  repetitions=repetitions)
+
+
+class _FactorizedStep(simulator.StepResult):
+    """A `StepResult` of a simulation split into independent qubit groups."""
+
+    def __init__(self, state: _FactorizedState,
+                 measurements: Dict[str, List[int]], dtype: Type[np.number]):
+        super().__init__(measurements=measurements)
+        self._state = state
+        self._dtype = dtype
+
+    def _simulator_state(self
+                        ) -> wave_function_simulator.WaveFunctionSimulatorState:
+        """The tensor product of all factors, over the sorted qubits."""
+        state = np.ones((), dtype=self._dtype)
+        axes_qubits = []  # type: List[ops.Qid]
+        for factor in self._state.factors():
+            state = np.multiply.outer(state, factor.data.state)
+            axes_qubits.extend(factor.qubits)
+        qubits = sorted(axes_qubits)
+        state = np.transpose(state, [axes_qubits.index(q) for q in qubits])
+        return wave_function_simulator.WaveFunctionSimulatorState(
+            qubit_map={q: i for i, q in enumerate(qubits)},
+            state_vector=state.reshape(state.size))
+
+    def sample(self, qubits: List[ops.Qid],
+               repetitions: int = 1) -> np.ndarray:
+        result = np.zeros((repetitions, len(qubits)), dtype=np.uint8)
+        for factor, positions in self._state.group_by_factor(qubits):
+            result[:, positions] = wave_function.sample_state_vector(
+                factor.data.state,
+                [factor.axes[qubits[i]] for i in positions],
+                qid_shape=factor.data.state.shape,
+                repetitions=repetitions)
+        return result
@@ -808,3 +808,97 @@ def test_random_seed():
     assert np.all(
         result.measurements['a'] == [[False], [True], [False], [True], [True],
                                      [False], [False], [True], [True], [True]])
+
+
+@pytest.mark.parametrize('dtype', [np.complex64, np.complex128])
+def test_split_untangled_states_run(dtype):
+    a, b, c, d = cirq.LineQubit.range(4)
+    simulator = cirq.Simulator(dtype=dtype, split_untangled_states=True)
+    circuit = cirq.Circuit.from_ops(cirq.X(a), cirq.X(c), cirq.CNOT(a, b),
+                                    cirq.measure(a, b, c, key='abc'),
+                                    cirq.measure(d, key='d'))
+    result = simulator.run(circuit, repetitions=3)
+    np.testing.assert_equal(result.measurements['abc'], [[1, 1, 1]] * 3)
+    np.testing.assert_equal(result.measurements['d'], [[0]] * 3)
+
+
+def test_split_untangled_states_run_non_terminal_measurements():
+    a, b = cirq.LineQubit.range(2)
+    simulator = cirq.Simulator(split_untangled_states=True)
+    circuit = cirq.Circuit.from_ops(cirq.H(a), cirq.measure(a, key='m0'),
+                                    cirq.CNOT(a, b), cirq.measure(b, key='m1'),
+                                    cirq.reset(b), cirq.measure(b, key='m2'))
+    result = simulator.run(circuit, repetitions=50)
+    np.testing.assert_equal(result.measurements['m0'],
+                            result.measurements['m1'])
+    np.testing.assert_equal(result.measurements['m2'], [[0]] * 50)
+    assert 0 < np.sum(result.measurements['m0']) < 50
+
+
+def test_split_untangled_states_run_qudits_and_mixtures():
+    q0, q1 = cirq.LineQid.for_qid_shape((3, 4))
+    a = cirq.LineQubit(0)
+    simulator = cirq.Simulator(split_untangled_states=True)
+    circuit = cirq.Circuit.from_ops(PlusGate(3, 2)(q0),
+                                    PlusGate(4, 3)(q1),
+                                    cirq.bit_flip(1)(a),
+                                    cirq.measure(q1, q0, a, key='m'))
+    result = simulator.run(circuit, repetitions=2)
+    np.testing.assert_equal(result.measurements['m'], [[3, 2, 1]] * 2)
+
+
+def test_split_untangled_states_run_is_correlated_within_groups():
+    a, b, c = cirq.LineQubit.range(3)
+    simulator = cirq.Simulator(split_untangled_states=True)
+    circuit = cirq.Circuit.from_ops(cirq.H(a), cirq.CNOT(a, c), cirq.H(b),
+                                    cirq.measure(c, b, a, key='m'))
+    result = simulator.run(circuit, repetitions=100)
+    m = result.measurements['m']
+    np.testing.assert_equal(m[:, 0], m[:, 2])
+    assert 0 < np.sum(m[:, 0]) < 100
+    assert 0 < np.sum(m[:, 1]) < 100
+
+
+def test_split_untangled_states_many_independent_qubits():
+    qubits = cirq.GridQubit.rect(6, 8)
+    simulator = cirq.Simulator(split_untangled_states=True)
+    circuit = cirq.Circuit.from_ops(
+        [cirq.X(q) for q in qubits[::2]],
+        [cirq.Y(q)**0.5 for q in qubits],
+        [cirq.Y(q)**-0.5 for q in qubits],
+        cirq.measure(*qubits, key='m'),
+    )
+    result = simulator.run(circuit, repetitions=4)
+    np.testing.assert_equal(result.measurements['m'], [[1, 0] * 24] * 4)
+
+
+def test_split_untangled_states_full_state():
+    simulator = cirq.Simulator(split_untangled_states=True)
+    for _ in range(3):
+        circuit = cirq.testing.random_circuit(qubits=5,
+                                              n_moments=4,
+                                              op_density=0.5)
+        steps = list(simulator._factorized_iterator(circuit))
+        state = steps[-1]._simulator_state()
+        qubits = sorted(circuit.all_qubits())
+        assert state.qubit_map == {q: i for i, q in enumerate(qubits)}
+        np.testing.assert_allclose(state.state_vector,
+                                   circuit.final_wavefunction(),
+                                   atol=1e-5)
+
+    steps = list(simulator._factorized_iterator(cirq.Circuit()))
+    assert len(steps) == 1
+    np.testing.assert_allclose(steps[0]._simulator_state().state_vector, [1])
+
+
+@pytest.mark.parametrize('dtype', [np.complex64, np.complex128])
+def test_split_untangled_states_keeps_dtype(dtype):
+    a, b = cirq.LineQubit.range(2)
+    simulator = cirq.Simulator(dtype=dtype, split_untangled_states=True)
+    circuit = cirq.Circuit.from_ops(cirq.X(a)**0.1, cirq.Y(b)**0.3)
+    steps = list(simulator._factorized_iterator(circuit))
+    state = steps[-1]._simulator_state().state_vector
+    assert state.dtype == dtype
+    np.testing.assert_allclose(state,
+                               circuit.final_wavefunction(dtype=np.complex128),
+                               atol=1e-12 if dtype == np.complex128 else 1e-6)
@@ -0,0 +1,256 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A simulator computing the unitaries of circuits over parameter sweeps."""
+
+from typing import List, Sequence, Tuple, Type
+
+import numpy as np
+
+from cirq import circuits, linalg, ops, protocols, study
+
+
+class UnitarySimulator:
+    """Computes the unitary matrices of circuits, batched over sweeps.
+
+    The columns of the identity matrix are treated as a batch of states, so
+    each operation is applied to the whole matrix with a single tensor
+    contraction. A second batch axis runs over the points of a parameter
+    sweep: operations that don't depend on the swept parameters are applied
+    to every point at once, and parameterized operations are applied with a
+    stack of matrices, one per point.
+
+    Consecutive operations whose qubits together fit within
+    `max_fused_qubits` are first multiplied into a single small matrix
+    (a fused kernel) so that the large tensor is traversed fewer times.
+
+    This is intended for many small (up to roughly ten qubit) unitaries, e.g.
+    for calibration fitting. Terminal measurements are ignored, as in
+    `cirq.Circuit.unitary`.
+    """
+
+    def __init__(self,
+                 *,
+                 dtype: Type[np.number] = np.complex128,
+                 max_fused_qubits: int = 2):
+        """Initializes the simulator.
+
+        Args:
+            dtype: The `numpy.dtype` used by the simulation. Must be a complex
+                type.
+            max_fused_qubits: The maximum number of qubits of a fused kernel.
+                Set to 0 to disable fusion.
+
+        Raises:
+            ValueError: The dtype is not complex or `max_fused_qubits` is
+                negative.
+        """
+        if np.dtype(dtype).kind != 'c':
+            raise ValueError(
+                'dtype must be a complex type but was {}'.format(dtype))
+        if max_fused_qubits < 0:
+            raise ValueError('max_fused_qubits must be non-negative but was '
+                             '{}'.format(max_fused_qubits))
+        self._dtype = dtype
+        self._max_fused_qubits = max_fused_qubits
+
+    def unitary(
+            self,
+            circuit: circuits.Circuit,
+            param_resolver: 'study.ParamResolverOrSimilarType' = None,
+            qubit_order: ops.QubitOrderOrList = ops.QubitOrder.DEFAULT,
+    ) -> np.ndarray:
+        """Returns the unitary matrix of the circuit.
+
+        Args:
+            circuit: The circuit to compute the unitary of.
+            param_resolver: Parameters to run with the circuit.
+            qubit_order: Determines how qubits are ordered when defining the
+                rows and columns of the matrix.
+
+        Returns:
+            The unitary matrix of the circuit.
+        """
+        return self.unitary_sweep(circuit, study.ParamResolver(param_resolver),
+                                  qubit_order)[0]
+
+    def unitary_sweep(
+            self,
+            circuit: circuits.Circuit,
+            params: study.Sweepable,
+            qubit_order: ops.QubitOrderOrList = ops.QubitOrder.DEFAULT,
+    ) -> np.ndarray:
+        """Returns the unitary matrices of the circuit over a sweep.
+
+        Args:
+            circuit: The circuit to compute the unitaries of.
+            params: Parameters to run with the circuit.
+            qubit_order: Determines how qubits are ordered when defining the
+                rows and columns of the matrices.
+
+        Returns:
+            An array of shape `(len(resolvers), dim, dim)` where the i'th
+            entry is the unitary of the circuit for the i'th parameter
+            resolver.
+
+        Raises:
+            ValueError: The circuit contains a non-terminal measurement.
+            TypeError: The circuit contains an operation without a known
+                unitary, or a parameter isn't resolved by the sweep.
+        """
+        if not circuit.are_all_measurements_terminal():
+            raise ValueError('Circuit contains a non-terminal measurement.')
+        resolvers = study.to_resolvers(params)
+        qubits = ops.QubitOrder.as_qubit_order(qubit_order).order_for(
+            circuit.all_qubits())
+        qid_shape = protocols.qid_shape(qubits)
+        dim = np.prod(qid_shape, dtype=int)
+        qubit_map = {q: i for i, q in enumerate(qubits)}
+
+        kernels = []  # type: List[Tuple[Tuple[int, ...], np.ndarray]]
+        for block in self._blocks(_unitary_ops(circuit)):
+            matrices = [(tuple(qubit_map[q] for q in op.qubits),
+                         self._matrices(op, resolvers)) for op in block]
+            if len(matrices) == 1:
+                kernels.append(matrices[0])
+            else:
+                kernels.append(self._fuse(matrices))
+
+        # The state axes are (sweep point, *row qids, column). The sweep axis
+        # stays of length 1 until a parameterized kernel is applied.
+        state = linalg.eye_tensor(qid_shape,
+                                  dtype=self._dtype).reshape(
+                                      (1, *qid_shape, dim))
+        for axes, matrix in kernels:
+            state = _apply_matrix(matrix, state, axes)
+        result = state.reshape((state.shape[0], dim, dim))
+        if result.shape[0] != len(resolvers):
+            result = np.repeat(result, len(resolvers), axis=0)
+        return result
+
+    def _blocks(self, operations: Sequence[ops.Operation]
+               ) -> List[List[ops.Operation]]:
+        """Groups consecutive operations into blocks on few qubits."""
+        blocks = []  # type: List[List[ops.Operation]]
+        block_qubits = set()  # type: set
+        for op in operations:
+            merged = block_qubits.union(op.qubits)
+            if blocks and len(merged) <= self._max_fused_qubits:
+                blocks[-1].append(op)
+                block_qubits = merged
+            else:
+                blocks.append([op])
+                block_qubits = set(op.qubits)
+        return blocks
+
+    def _matrices(self, op: ops.Operation,
+                  resolvers: List[study.ParamResolver]) -> np.ndarray:
+        """The matrix of an operation as a tensor with a leading sweep axis.
+
+        Operations that don't depend on the sweep have a sweep axis of
+        length 1.
+        """
+        shape = protocols.qid_shape(op) * 2
+        if not protocols.is_parameterized(op):
+            return protocols.unitary(op).astype(self._dtype).reshape(
+                (1, *shape))
+        return np.array([
+            protocols.unitary(protocols.resolve_parameters(op, resolver))
+            for resolver in resolvers
+        ],
+                        dtype=self._dtype).reshape((len(resolvers), *shape))
+
+    def _fuse(self, matrices: List[Tuple[Tuple[int, ...], np.ndarray]]
+             ) -> Tuple[Tuple[int, ...], np.ndarray]:
+        """Multiplies a block of kernels into a single kernel."""
+        axes = []  # type: List[int]
+        for op_axes, _ in matrices:
+            axes.extend(a for a in op_axes if a not in axes)
+        local = {a: i for i, a in enumerate(axes)}
+        shape = tuple(_axis_dim(a, matrices) for a in axes)
+        dim = np.prod(shape, dtype=int)
+        block = linalg.eye_tensor(shape, dtype=self._dtype).reshape(
+            (1, *shape, dim))
+        for op_axes, matrix in matrices:
+            block = _apply_matrix(matrix, block,
+                                  tuple(local[a] for a in op_axes))
+        return tuple(axes), block.reshape((block.shape[0], *shape, *shape))
+
+
+def _axis_dim(axis: int,
+              matrices: List[Tuple[Tuple[int, ...], np.ndarray]]) -> int:
+    for op_axes, matrix in matrices:
+        if axis in op_axes:
+            return matrix.shape[1 + op_axes.index(axis)]
+    raise ValueError('Axis not found.')  # coverage: ignore
+
+
+def _apply_matrix(matrix: np.ndarray, state: np.ndarray,
+                  axes: Tuple[int, ...]) -> np.ndarray:
+    """Left-multiplies the qid axes of a batched state by a batched matrix.
+
+    Args:
+        matrix: The matrix as a tensor of shape `(batch, *op_shape,
+            *op_shape)`, where `batch` is 1 or the batch size of the state.
+        state: The state tensor of shape `(batch, *qid_shape, columns)`.
+        axes: The indices of the qids the matrix acts on.
+
+    Returns:
+        The new state tensor.
+    """
+    if matrix.shape[0] == 1:
+        return linalg.targeted_left_multiply(matrix[0], state,
+                                             [1 + a for a in axes])
+    if state.shape[0] == 1:
+        state = np.repeat(state, matrix.shape[0], axis=0)
+    k = len(axes)
+    d = len(state.shape)
+    work_indices = tuple(range(k))
+    data_indices = tuple(range(k, k + d))
+    used_data_indices = tuple(data_indices[1 + a] for a in axes)
+    output_indices = list(data_indices)
+    for w, a in zip(work_indices, axes):
+        output_indices[1 + a] = w
+    return np.einsum(matrix, (data_indices[0],) + work_indices +
+                     used_data_indices,
+                     state,
+                     data_indices,
+                     output_indices,
+                     optimize=2 * k + d >= 26)
+
+
+def _unitary_ops(circuit: circuits.Circuit) -> List[ops.Operation]:
+    """Decomposes the circuit into operations with (possibly swept) unitaries.
+
+    Terminal measurements are replaced by the bit flips of their invert mask.
+    """
+
+    def keep(op: ops.Operation) -> bool:
+        return protocols.has_unitary(op) or protocols.is_parameterized(op)
+
+    def measurement_inversions(op: ops.Operation) -> ops.OP_TREE:
+        gate = ops.op_gate_of_type(op, ops.MeasurementGate)
+        if gate:
+            return [ops.X(q) for q, b in zip(op.qubits, gate.invert_mask) if b]
+        return NotImplemented
+
+    def on_stuck(bad_op: ops.Operation):
+        return TypeError(
+            'Operation without a known matrix or decomposition: {!r}'.format(
+                bad_op))
+
+    return protocols.decompose(circuit.all_operations(),
+                               keep=keep,
+                               intercepting_decomposer=measurement_inversions,
+                               on_stuck_raise=on_stuck)
@@ -0,0 +1,140 @@
+# Copyright 2019 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+import sympy
+
+import cirq
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError, match='complex'):
+        cirq.UnitarySimulator(dtype=np.float64)
+    with pytest.raises(ValueError, match='non-negative'):
+        cirq.UnitarySimulator(max_fused_qubits=-1)
+
+
+@pytest.mark.parametrize('max_fused_qubits', [0, 1, 2, 3])
+@pytest.mark.parametrize('dtype', [np.complex64, np.complex128])
+def test_matches_circuit_unitary(max_fused_qubits, dtype):
+    simulator = cirq.UnitarySimulator(dtype=dtype,
+                                      max_fused_qubits=max_fused_qubits)
+    for _ in range(5):
+        circuit = cirq.testing.random_circuit(qubits=4,
+                                              n_moments=8,
+                                              op_density=0.8)
+        np.testing.assert_allclose(simulator.unitary(circuit),
+                                   circuit.unitary(),
+                                   atol=1e-5)
+
+
+def test_qubit_order():
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit.from_ops(cirq.CNOT(a, b), cirq.Y(a)**0.5)
+    simulator = cirq.UnitarySimulator()
+    np.testing.assert_allclose(simulator.unitary(circuit, qubit_order=[b, a]),
+                               circuit.unitary(qubit_order=[b, a]),
+                               atol=1e-8)
+
+
+def test_qudits():
+    a, b = cirq.LineQid.for_qid_shape((2, 3))
+    circuit = cirq.Circuit.from_ops(cirq.X(a), PlusGate(3)(b))
+    np.testing.assert_allclose(cirq.UnitarySimulator().unitary(circuit),
+                               circuit.unitary(),
+                               atol=1e-8)
+
+
+def test_terminal_measurements():
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit.from_ops(
+        cirq.H(a), cirq.measure(a, b, invert_mask=(False, True)))
+    np.testing.assert_allclose(cirq.UnitarySimulator().unitary(circuit),
+                               circuit.unitary(),
+                               atol=1e-8)
+
+    circuit.append(cirq.H(a))
+    with pytest.raises(ValueError, match='non-terminal'):
+        cirq.UnitarySimulator().unitary(circuit)
+
+
+def test_unknown_operation():
+
+    class NoUnitary(cirq.SingleQubitGate):
+        pass
+
+    circuit = cirq.Circuit.from_ops(NoUnitary()(cirq.LineQubit(0)))
+    with pytest.raises(TypeError, match='known matrix'):
+        cirq.UnitarySimulator().unitary(circuit)
+
+
+def test_unresolved_parameter():
+    circuit = cirq.Circuit.from_ops(
+        cirq.X(cirq.LineQubit(0))**sympy.Symbol('t'))
+    with pytest.raises(TypeError):
+        cirq.UnitarySimulator().unitary(circuit)
+
+
+@pytest.mark.parametrize('max_fused_qubits', [0, 2])
+def test_sweep(max_fused_qubits):
+    a, b, c = cirq.LineQubit.range(3)
+    t, s = sympy.Symbol('t'), sympy.Symbol('s')
+    circuit = cirq.Circuit.from_ops(
+        cirq.H(a),
+        cirq.X(b)**t,
+        cirq.CZ(a, b)**s,
+        cirq.Y(c)**0.25,
+        cirq.ISWAP(b, c)**t,
+    )
+    sweep = cirq.Linspace('t', 0, 1, 5) * cirq.Points('s', [0.25, 1])
+    simulator = cirq.UnitarySimulator(max_fused_qubits=max_fused_qubits)
+    result = simulator.unitary_sweep(circuit, sweep)
+    assert result.shape == (10, 8, 8)
+    for resolver, actual in zip(sweep, result):
+        expected = cirq.resolve_parameters(circuit, resolver).unitary()
+        np.testing.assert_allclose(actual, expected, atol=1e-8)
+
+    np.testing.assert_allclose(simulator.unitary(circuit, {
+        't': 0.5,
+        's': 1
+    }),
+                               result[5],
+                               atol=1e-8)
+
+
+def test_sweep_without_parameters():
+    circuit = cirq.Circuit.from_ops(cirq.H(cirq.LineQubit(0)))
+    result = cirq.UnitarySimulator().unitary_sweep(
+        circuit, cirq.Linspace('t', 0, 1, 3))
+    assert result.shape == (3, 2, 2)
+    for actual in result:
+        np.testing.assert_allclose(actual, cirq.unitary(cirq.H), atol=1e-8)
+
+
+def test_empty_circuit():
+    np.testing.assert_allclose(cirq.UnitarySimulator().unitary(cirq.Circuit()),
+                               np.eye(1))
+
+
+class PlusGate(cirq.Gate):
+
+    def __init__(self, dimension):
+        self.dimension = dimension
+
+    def _qid_shape_(self):
+        return (self.dimension,)
+
+    def _unitary_(self):
+        return np.roll(np.eye(self.dimension), 1, axis=0)
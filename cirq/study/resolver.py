@@ -102,3 +102,14 @@ class ParamResolver(object):
 
     def __repr__(self):
         return 'cirq.ParamResolver({})'.format(repr(self.param_dict))
+
+    def _json_dict_(self):
+        return {
+            'cirq_type': self.__class__.__name__,
+            # JSON requires mappings to have keys of basic types.
+            'param_dict': list(self.param_dict.items()),
+        }
+
+    @classmethod
+    def _from_json_dict_(cls, param_dict, **kwargs):
+        return cls(dict(param_dict))
@@ -271,3 +271,18 @@ class TrialResult:
         if not isinstance(other, type(self)):
             return NotImplemented
         return self.data.equals(other.data) and self.params == other.params
+
+    def _json_dict_(self):
+        return {
+            'cirq_type': self.__class__.__name__,
+            'params': self.params,
+            'measurements': self.measurements,
+        }
+
+    @classmethod
+    def _from_json_dict_(cls, params, measurements, **kwargs):
+        return cls(params=params,
+                   measurements={
+                       key: np.asarray(val)
+                       for key, val in measurements.items()
+                   })